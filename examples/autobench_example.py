@@ -42,14 +42,12 @@ def main():
                 conn.root.ping()
             print("  Completed 5 pings")
 
-        with mark.section("Accessing remote modules"):
-            remote_os = conn.modules.os
-            cwd = remote_os.getcwd()
+        with mark.section("Remote environment (single eval)"):
+            # One round trip instead of a getattr/call chain per value
+            cwd, version = conn.eval(
+                "__import__('os').getcwd(), __import__('sys').version"
+            )
             print(f"  Remote CWD: {cwd}")
-
-        with mark.section("Nested remote calls"):
-            remote_sys = conn.modules.sys
-            version = remote_sys.version
             print(f"  Remote Python: {version[:20]}...")
 
         conn.close()
@@ -12,6 +12,18 @@ from rpycbench.servers.rpyc_servers import RPyCServer, create_rpyc_connection
 import time
 
 
+def _spin(microseconds):
+    """
+    Busy-wait for the given number of microseconds.
+
+    Simulates app CPU work deterministically; time.sleep() adds scheduler
+    jitter on the order of the 1ms being simulated.
+    """
+    end = time.perf_counter() + microseconds * 1e-6
+    while time.perf_counter() < end:
+        pass
+
+
 # Your application code
 class MyApplication:
     """Example application that uses RPyC"""
@@ -21,15 +33,13 @@ class MyApplication:
 
     def process_data(self, data):
         """Simulate some app processing overhead"""
-        # Your app logic here (validation, transformation, etc.)
-        time.sleep(0.001)  # Simulate 1ms processing
+        # Your app logic here (validation, transformation, etc.); the 1ms
+        # before and 1ms after the call are simulated as one 2ms block
+        _spin(2000)  # Simulate 2ms processing
 
         # Call RPyC service
         result = self.conn.root.echo(data)
 
-        # More app logic
-        time.sleep(0.001)  # Simulate 1ms processing
-
         return result
 
 
@@ -44,10 +54,10 @@ def benchmark_baseline(conn, num_requests=100):
     ) as bench:
 
         for _ in range(num_requests):
-            with bench.measure_request():
-                # Direct call without app logic
-                conn.root.ping()
-                bench.record_request(success=True)
+            # Direct call without app logic
+            t = bench.measure_request_fast()
+            conn.root.ping()
+            bench.record_elapsed(t)
 
     return bench.get_results()
 
@@ -67,10 +77,10 @@ def benchmark_with_app(conn, num_requests=100):
         test_data = b'test'
 
         for _ in range(num_requests):
-            with bench.measure_request():
-                # Call through app (includes app overhead)
-                app.process_data(test_data)
-                bench.record_request(success=True)
+            # Call through app (includes app overhead)
+            t = bench.measure_request_fast()
+            app.process_data(test_data)
+            bench.record_elapsed(t)
 
     return bench.get_results()
 
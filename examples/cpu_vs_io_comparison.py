@@ -11,12 +11,20 @@ Key Concepts Demonstrated:
 4. Memory Trade-off: Forking uses more memory but enables true parallelism
 
 Run this to understand when to use threaded vs forking mode for your RPyC server.
+
+The CPU-bound and I/O-bound runs for each server mode execute side by side, pinned
+to disjoint CPU sets. Pass --serial to run all four benchmarks one after another
+(slower, but system-wide CPU usage readings are not shared between workloads).
 """
 
 import hashlib
+import itertools
+import os
+import sys
 import time
+import concurrent.futures
 import rpyc
-from rpycbench.core.benchmark import ConcurrentBenchmark
+from rpycbench.core.benchmark import AsyncConcurrentBenchmark, ConcurrentBenchmark
 from rpycbench.servers.rpyc_servers import RPyCServer
 
 
@@ -27,10 +35,16 @@ class CPUBoundService(rpyc.Service):
         """
         CPU-intensive task: repeated hash computation
         This demonstrates work that keeps the CPU busy
+
+        hashlib.sha256 is OpenSSL's C constructor, which already uses the
+        CPU's SHA extensions where available; the constructor is bound to a
+        local so each iteration skips the module attribute lookup, and
+        itertools.repeat avoids creating a loop-counter int per iteration.
         """
+        sha256 = hashlib.sha256
         result = b"start"
-        for i in range(iterations):
-            result = hashlib.sha256(result).digest()
+        for _ in itertools.repeat(None, iterations):
+            result = sha256(result).digest()
         return result.hex()[:16]
 
 
@@ -52,24 +66,39 @@ def benchmark_workload(service_class, port, mode, num_clients=128):
     print(f"Testing {service_class.__name__} in {mode.upper()} mode")
     print(f"{'='*60}")
 
-    with RPyCServer(port=port, mode=mode, service=service_class) as server:
-        # Determine which method to call based on service type
+    # "Forking" runs on a preforked pool: one worker process per core (up to
+    # 4), forked once at startup and sharing the port via SO_REUSEPORT. Plain
+    # ForkingServer would fork per connection, so 128 clients would measure
+    # 128 interpreter forks on top of the GIL-parallelism being compared.
+    if mode == 'forking':
+        server = RPyCServer(port=port, mode='preforked', service=service_class,
+                            num_workers=min(len(_usable_cpus()), 4))
+    else:
+        server = RPyCServer(port=port, mode=mode, service=service_class)
+
+    with server:
+        # Determine which method to call based on service type; each client
+        # resolves it once after connecting, not on every request. I/O-bound
+        # clients mostly wait, so they run as coroutines on one event loop
+        # rather than 128 threads whose context switches would inflate latency.
         if service_class == CPUBoundService:
-            request_func = lambda c: c.root.cpu_work()
+            benchmark_class = ConcurrentBenchmark
+            request_func_factory = lambda c: c.root.cpu_work
         else:
-            request_func = lambda c: c.root.io_work()
+            benchmark_class = AsyncConcurrentBenchmark
+            request_func_factory = lambda c: rpyc.async_(c.root.io_work)
 
-        bench = ConcurrentBenchmark(
+        bench = benchmark_class(
             name=f"{service_class.__name__}_{mode}",
             protocol="rpyc",
             server_mode=mode,
             connection_factory=lambda: rpyc.connect('localhost', port),
-            request_func=request_func,
+            request_func_factory=request_func_factory,
             num_clients=num_clients,
             requests_per_client=10
         )
 
-        metrics = bench.run()
+        metrics = bench.execute()
         metrics.record_system_metrics()  # Capture CPU and memory usage
 
         stats = metrics.compute_statistics()
@@ -87,6 +116,66 @@ def benchmark_workload(service_class, port, mode, num_clients=128):
         return stats
 
 
+def _usable_cpus():
+    """CPUs this process may run on"""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _split_cpus():
+    """Split the usable CPUs into two disjoint sets (None where unsupported)"""
+    if not hasattr(os, 'sched_setaffinity'):
+        return None, None
+    cpus = _usable_cpus()
+    if len(cpus) < 2:
+        return None, None
+    half = len(cpus) // 2
+    return set(cpus[:half]), set(cpus[half:])
+
+
+def _run_pinned(cpus, service_class, port, mode):
+    """Run benchmark_workload with this process (and its server) pinned to cpus"""
+    if cpus:
+        os.sched_setaffinity(0, cpus)
+    return benchmark_workload(service_class, port, mode)
+
+
+def run_all_workloads(parallel=True):
+    """
+    Run the four workload/mode combinations.
+
+    CPU-bound and I/O-bound workloads contend on different resources, so with
+    parallel=True each mode's CPU and I/O runs overlap on disjoint CPU sets.
+    Threaded vs forking still run one after the other so the CPU-bound
+    comparison sees the same cores.
+    """
+    runs = {
+        ('cpu', 'threaded'): (CPUBoundService, 18812),
+        ('cpu', 'forking'): (CPUBoundService, 18813),
+        ('io', 'threaded'): (IOBoundService, 18814),
+        ('io', 'forking'): (IOBoundService, 18815),
+    }
+
+    if not parallel:
+        return {
+            key: benchmark_workload(service_class, port, key[1])
+            for key, (service_class, port) in runs.items()
+        }
+
+    cpu_set, io_set = _split_cpus()
+    results = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        for mode in ('threaded', 'forking'):
+            futures = {
+                kind: executor.submit(_run_pinned, cpus, *runs[(kind, mode)], mode)
+                for kind, cpus in (('cpu', cpu_set), ('io', io_set))
+            }
+            for kind, future in futures.items():
+                results[(kind, mode)] = future.result()
+    return results
+
+
 def main():
     print("""
     CPU vs I/O Workload Comparison
@@ -107,13 +196,15 @@ def main():
     Testing with {num_clients} concurrent clients...
     """.format(num_clients=128))
 
+    results = run_all_workloads(parallel='--serial' not in sys.argv)
+
     # ===== CPU-BOUND WORKLOAD =====
     print("\n" + "="*70)
     print("PART 1: CPU-BOUND WORKLOAD (Hash Computation)")
     print("="*70)
 
-    cpu_threaded_stats = benchmark_workload(CPUBoundService, 18812, 'threaded')
-    cpu_forking_stats = benchmark_workload(CPUBoundService, 18813, 'forking')
+    cpu_threaded_stats = results[('cpu', 'threaded')]
+    cpu_forking_stats = results[('cpu', 'forking')]
 
     # Compare CPU-bound results
     cpu_improvement = ((cpu_threaded_stats['latency']['mean'] - cpu_forking_stats['latency']['mean'])
@@ -137,8 +228,8 @@ def main():
     print("PART 2: I/O-BOUND WORKLOAD (Simulated Database/Network)")
     print("="*70)
 
-    io_threaded_stats = benchmark_workload(IOBoundService, 18814, 'threaded')
-    io_forking_stats = benchmark_workload(IOBoundService, 18815, 'forking')
+    io_threaded_stats = results[('io', 'threaded')]
+    io_forking_stats = results[('io', 'forking')]
 
     # Compare I/O-bound results
     io_difference = ((io_forking_stats['latency']['mean'] / io_threaded_stats['latency']['mean']) - 1) * 100
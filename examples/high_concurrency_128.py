@@ -7,12 +7,24 @@ Demonstrates:
 - Server in separate process (no GIL interference)
 - Per-connection metrics tracking
 - Testing different server modes (threaded vs forking)
+
+--compare benchmarks the server modes side by side in separate processes;
+add --serial to run them one after another instead.
 """
 
+import concurrent.futures
+import os
+
+import numpy as np
+
 from rpycbench.benchmarks.suite import BenchmarkSuite
-from rpycbench.core.benchmark import ConcurrentBenchmark
-from rpycbench.servers.rpyc_servers import RPyCServer, create_rpyc_connection
-from rpycbench.servers.http_servers import HTTPBenchmarkServer, create_http_session
+from rpycbench.core.benchmark import AsyncConcurrentBenchmark, ConcurrentBenchmark
+from rpycbench.servers.rpyc_servers import ConnectionPool, RPyCServer, create_rpyc_connection
+from rpycbench.servers.http_servers import (
+    HTTPBenchmarkServer,
+    create_http_pool_manager,
+    open_async_http_connection,
+)
 
 
 def test_high_concurrency_rpyc():
@@ -30,20 +42,27 @@ def test_high_concurrency_rpyc():
 
         # Start server in separate process (GIL-free)
         with RPyCServer(host='localhost', port=18812, mode=mode):
-
-            # Create benchmark with 128 clients
-            bench = ConcurrentBenchmark(
-                name=f"RPyC {mode} - 128 clients",
-                protocol="rpyc",
-                server_mode=mode,
-                connection_factory=lambda: create_rpyc_connection('localhost', 18812),
-                request_func=lambda conn: conn.root.ping(),
-                num_clients=128,
-                requests_per_client=50,
-                track_per_connection=True,  # Track individual connections
-            )
-
-            metrics = bench.execute()
+            factory = lambda: create_rpyc_connection('localhost', 18812)
+
+            # Clients borrow connections from a pool: 64 are kept open between
+            # runs, and bursts may open up to 128 before clients wait
+            with ConnectionPool(factory, max_size=64, burst_limit=128) as pool:
+
+                # Create benchmark with 128 clients
+                bench = ConcurrentBenchmark(
+                    name=f"RPyC {mode} - 128 clients",
+                    protocol="rpyc",
+                    server_mode=mode,
+                    connection_factory=factory,
+                    request_func_factory=lambda conn: conn.root.ping,  # Resolve .ping once per client
+                    num_clients=128,
+                    requests_per_client=50,
+                    track_per_connection=True,  # Track individual connections
+                    per_connection_samples=False,  # Histograms only, no raw samples
+                    connection_pool=pool,
+                )
+
+                metrics = bench.execute()
             stats = metrics.compute_statistics()
 
             # Print results
@@ -56,15 +75,23 @@ def test_high_concurrency_rpyc():
             print(f"  P95 latency: {stats['latency']['p95']*1000:.2f}ms")
             print(f"  P99 latency: {stats['latency']['p99']*1000:.2f}ms")
 
-            # Per-connection analysis
-            per_conn = bench.get_per_connection_metrics()
-            if per_conn:
-                avg_conn_time = sum(c['connection_time'] for c in per_conn) / len(per_conn)
+            # Per-connection analysis (one array element per client)
+            per_conn = bench.get_per_connection_arrays()
+            if per_conn is not None and len(per_conn):
+                avg_conn_time = np.nanmean(per_conn.connection_time)
                 print(f"  Avg connection time: {avg_conn_time*1000:.2f}ms")
 
                 # Find slowest connection
-                slowest = max(per_conn, key=lambda c: c.get('total_duration', 0))
-                print(f"  Slowest client #{slowest['client_id']}: {slowest['total_duration']:.2f}s")
+                slowest = per_conn.total_duration.argmax()
+                print(f"  Slowest client #{per_conn.client_id[slowest]}: "
+                      f"{per_conn.total_duration[slowest]:.2f}s")
+
+            # Latency distribution across all clients (fixed buckets)
+            histogram = bench.get_latency_histogram()
+            bounds = [f"<={b*1000:g}ms" for b in histogram.buckets] + ["more"]
+            print("  Latency histogram: " + ", ".join(
+                f"{label}: {count}" for label, count in zip(bounds, histogram.counts) if count
+            ))
 
 
 def test_high_concurrency_http():
@@ -74,6 +101,16 @@ def test_high_concurrency_http():
     print("HTTP HIGH CONCURRENCY TEST: 128 Parallel Connections")
     print("=" * 80)
 
+    # One PoolManager shared by all 128 client threads, instead of a separate
+    # requests.Session (and connection pool) per client
+    pool_manager = create_http_pool_manager(maxsize=128)
+
+    def ping(pm):
+        response = pm.request('GET', 'http://localhost:5000/ping', preload_content=False)
+        response.drain_conn()
+        response.release_conn()
+        return response
+
     # Start HTTP server in separate process
     with HTTPBenchmarkServer(host='localhost', port=5000, threaded=True):
 
@@ -82,8 +119,8 @@ def test_high_concurrency_http():
             name="HTTP threaded - 128 clients",
             protocol="http",
             server_mode="threaded",
-            connection_factory=lambda: create_http_session(),
-            request_func=lambda session: session.get('http://localhost:5000/ping'),
+            connection_factory=lambda: pool_manager,
+            request_func=ping,
             num_clients=128,
             requests_per_client=50,
             track_per_connection=True,
@@ -102,32 +139,100 @@ def test_high_concurrency_http():
         print(f"  P95 latency: {stats['latency']['p95']*1000:.2f}ms")
         print(f"  P99 latency: {stats['latency']['p99']*1000:.2f}ms")
 
+        # Requests per connection shows how well sockets were reused (Flask's
+        # development server closes every connection, so expect ~1.0 there)
+        pool = pool_manager.connection_from_url('http://localhost:5000')
+        print(f"  Connections opened: {pool.num_connections} "
+              f"({pool.num_requests / max(pool.num_connections, 1):.1f} requests/connection)")
 
-def compare_server_modes():
-    """Compare different server modes under high load"""
+        # Same load with every client as a coroutine on one event loop: the
+        # client side is pure network polling, so one selector can wait on
+        # all 128 sockets instead of 128 threads blocking in recv()
+        async def async_ping(conn):
+            await conn.request('GET', '/ping')
 
-    print("\n\n" + "=" * 80)
-    print("SERVER MODE COMPARISON UNDER HIGH LOAD")
-    print("=" * 80)
+        async_bench = AsyncConcurrentBenchmark(
+            name="HTTP threaded - 128 async clients",
+            protocol="http",
+            server_mode="threaded",
+            connection_factory=lambda: open_async_http_connection('localhost', 5000),
+            request_func=async_ping,
+            num_clients=128,
+            requests_per_client=50,
+        )
+        async_stats = async_bench.execute().compute_statistics()
+        print(f"\nAsync clients ({async_bench.metrics.metadata['event_loop']}):")
+        print(f"  Mean latency: {async_stats['latency']['mean']*1000:.2f}ms")
+        print(f"  P99 latency: {async_stats['latency']['p99']*1000:.2f}ms")
 
-    results = {}
+    pool_manager.clear()
 
-    for mode in ['threaded', 'forking']:
-        print(f"\n[Benchmarking RPyC {mode.upper()}]")
 
-        with RPyCServer(host='localhost', port=18812, mode=mode):
+def _usable_cpus():
+    """CPUs this process may run on"""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _split_cpus(n):
+    """Split the usable CPUs into n disjoint sets (None where unsupported)"""
+    cpus = _usable_cpus()
+    if not hasattr(os, 'sched_setaffinity') or len(cpus) < n:
+        return [None] * n
+    return [set(cpus[i::n]) for i in range(n)]
+
+
+def _run_one(mode, port, cpus=None):
+    """Benchmark one server mode on its own port; returns the stats dict"""
+    if cpus:
+        # The server process forked below inherits this affinity
+        os.sched_setaffinity(0, cpus)
+
+    print(f"\n[Benchmarking RPyC {mode.upper()}]")
+
+    with RPyCServer(host='localhost', port=port, mode=mode):
+        factory = lambda: create_rpyc_connection('localhost', port)
+        with ConnectionPool(factory, max_size=64, burst_limit=128) as pool:
             bench = ConcurrentBenchmark(
                 name=f"RPyC {mode}",
                 protocol="rpyc",
                 server_mode=mode,
-                connection_factory=lambda: create_rpyc_connection('localhost', 18812),
-                request_func=lambda conn: conn.root.ping(),
+                connection_factory=factory,
+                request_func_factory=lambda conn: conn.root.ping,  # Resolve .ping once per client
                 num_clients=128,
                 requests_per_client=100,
+                connection_pool=pool,
             )
 
             metrics = bench.execute()
-            results[mode] = metrics.compute_statistics()
+    return metrics.compute_statistics()
+
+
+def compare_server_modes(parallel=True):
+    """
+    Compare different server modes under high load.
+
+    With parallel=True each mode runs in its own process, on its own port
+    and pinned to its own CPU set (where supported), so the comparison takes
+    as long as the slowest mode rather than the sum of all of them.
+    """
+
+    print("\n\n" + "=" * 80)
+    print("SERVER MODE COMPARISON UNDER HIGH LOAD")
+    print("=" * 80)
+
+    # 'preforked' runs one threaded worker per CPU, forked once up front, so
+    # it shows multi-process scaling without forking per connection
+    modes = ['threaded', 'forking', 'preforked']
+    ports = [18812, 18813, 18814]
+
+    if parallel:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=len(modes)) as executor:
+            stats = executor.map(_run_one, modes, ports, _split_cpus(len(modes)))
+            results = dict(zip(modes, stats))
+    else:
+        results = {mode: _run_one(mode, port) for mode, port in zip(modes, ports)}
 
     # Compare results
     print("\n" + "=" * 80)
@@ -162,7 +267,7 @@ if __name__ == '__main__':
         elif sys.argv[1] == '--http':
             test_high_concurrency_http()
         elif sys.argv[1] == '--compare':
-            compare_server_modes()
+            compare_server_modes(parallel='--serial' not in sys.argv)
     else:
         # Run all tests
         test_high_concurrency_rpyc()
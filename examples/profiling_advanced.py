@@ -10,6 +10,8 @@ This example demonstrates:
 - Deep stack detection
 """
 
+import sys
+
 import rpyc
 from rpycbench.servers.rpyc_servers import RPyCServer, BenchmarkService
 from rpycbench.utils.profiler import profile_rpyc_calls
@@ -61,9 +63,11 @@ def main():
     # swap services. In production you'd start your custom service.
 
     with RPyCServer(host='localhost', port=18812, mode='threaded'):
+        # No pickling: the bytes payloads below go through RPyC's native
+        # brine encoding; pickle-only objects must be serialized beforehand
         conn = rpyc.connect('localhost', 18812, config={
             'allow_public_attrs': True,
-            'allow_pickle': True,
+            'allow_pickle': False,
         })
 
         # Use profiling context manager
@@ -95,22 +99,23 @@ def main():
 
             telemetry = profiled.telemetry
 
-        # Generate visualizations
+        # Generate visualizations (streamed line by line to stdout rather
+        # than built into one string first)
         print("\n" + "=" * 80)
         print("CALL TREE VISUALIZATION")
-        print(format_call_tree(telemetry, max_depth=10))
+        format_call_tree(telemetry, max_depth=10, out=sys.stdout)
 
         print("\n" + "=" * 80)
         print("TIMELINE VISUALIZATION")
-        print(format_timeline(telemetry, width=60))
+        format_timeline(telemetry, width=60, out=sys.stdout)
 
         print("\n" + "=" * 80)
         print("NETREF REPORT")
-        print(format_netref_report(telemetry))
+        format_netref_report(telemetry, out=sys.stdout)
 
         print("\n" + "=" * 80)
         print("SLOW CALLS REPORT")
-        print(format_slow_calls_report(telemetry, top_n=10))
+        format_slow_calls_report(telemetry, top_n=10, out=sys.stdout)
 
         print("\n" + "=" * 80)
         print("FULL TELEMETRY REPORT")
@@ -1,26 +1,73 @@
 #!/usr/bin/env python3
 """Install or upgrade rpycbench to the latest version from GitHub releases"""
 
+import os
 import sys
 import json
 import subprocess
+import urllib.error
 import urllib.request
 
 REPO = "patrickkidd/rpycbench"
+CACHE_FILE = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'rpycbench',
+    'latest.json',
+)
+
+def _load_cache():
+    """Return the cached {'etag': ..., 'url': ...} from the last lookup, if any"""
+    try:
+        with open(CACHE_FILE) as f:
+            cache = json.load(f)
+        if cache.get('etag') and cache.get('url'):
+            return cache
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _save_cache(etag, url):
+    """Remember the release ETag and wheel URL (best effort)"""
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(CACHE_FILE, 'w') as f:
+            json.dump({'etag': etag, 'url': url}, f)
+    except OSError:
+        pass
 
 def get_latest_wheel_url():
-    """Fetch the latest wheel URL from GitHub API"""
+    """
+    Fetch the latest wheel URL from GitHub API
+
+    The release's ETag is cached, and later runs send it as If-None-Match.
+    If the release hasn't changed, GitHub answers 304 with no body and the
+    cached URL is reused.
+    """
     api_url = f"https://api.github.com/repos/{REPO}/releases/latest"
+    request = urllib.request.Request(api_url, headers={'Accept': 'application/vnd.github+json'})
+
+    cache = _load_cache()
+    if cache:
+        request.add_header('If-None-Match', cache['etag'])
 
     try:
-        with urllib.request.urlopen(api_url) as response:
+        with urllib.request.urlopen(request) as response:
+            etag = response.headers.get('ETag')
             data = json.loads(response.read())
 
         # Find wheel asset
         for asset in data.get('assets', []):
             if asset['name'].endswith('.whl'):
-                return asset['browser_download_url']
+                url = asset['browser_download_url']
+                if etag:
+                    _save_cache(etag, url)
+                return url
 
+        return None
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cache:
+            return cache['url']
+        print(f"Error fetching release info: {e}", file=sys.stderr)
         return None
     except Exception as e:
         print(f"Error fetching release info: {e}", file=sys.stderr)
@@ -1,26 +1,44 @@
 """RPyC vs HTTP/REST Benchmark Suite"""
 
-from rpycbench.core.benchmark import (
-    BenchmarkContext,
-    ConnectionBenchmark,
-    LatencyBenchmark,
-    BandwidthBenchmark,
-    ConcurrentBenchmark,
-)
-from rpycbench.core.metrics import BenchmarkMetrics, BenchmarkResults
-from rpycbench.utils.telemetry import (
-    RPyCTelemetry,
-    get_telemetry,
-    enable_telemetry,
-    disable_telemetry,
-    telemetry_context,
-)
-from rpycbench.utils.profiler import (
-    ProfiledConnection,
-    create_profiled_connection,
-    profile_rpyc_calls,
-)
-from rpycbench.utils.markers import mark
+import importlib
+
+# Public name -> module that defines it. Modules are imported on first
+# attribute access (PEP 562), so "import rpycbench" does not pull in rpyc,
+# numpy and asyncio until something actually uses them.
+_LAZY = {
+    "BenchmarkContext": "rpycbench.core.benchmark",
+    "ConnectionBenchmark": "rpycbench.core.benchmark",
+    "LatencyBenchmark": "rpycbench.core.benchmark",
+    "BandwidthBenchmark": "rpycbench.core.benchmark",
+    "ConcurrentBenchmark": "rpycbench.core.benchmark",
+    "AsyncConcurrentBenchmark": "rpycbench.core.benchmark",
+    "BenchmarkMetrics": "rpycbench.core.metrics",
+    "BenchmarkResults": "rpycbench.core.metrics",
+    "RPyCTelemetry": "rpycbench.utils.telemetry",
+    "get_telemetry": "rpycbench.utils.telemetry",
+    "enable_telemetry": "rpycbench.utils.telemetry",
+    "disable_telemetry": "rpycbench.utils.telemetry",
+    "telemetry_context": "rpycbench.utils.telemetry",
+    "ProfiledConnection": "rpycbench.utils.profiler",
+    "create_profiled_connection": "rpycbench.utils.profiler",
+    "profile_rpyc_calls": "rpycbench.utils.profiler",
+    "mark": "rpycbench.utils.markers",
+}
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 try:
     from importlib.metadata import version, PackageNotFoundError
@@ -37,6 +55,7 @@ __all__ = [
     "LatencyBenchmark",
     "BandwidthBenchmark",
     "ConcurrentBenchmark",
+    "AsyncConcurrentBenchmark",
     "BenchmarkMetrics",
     "BenchmarkResults",
     "RPyCTelemetry",
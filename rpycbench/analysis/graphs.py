@@ -1,219 +1,319 @@
+import concurrent.futures
 import json
+import os
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Raster resolution used when output_format is 'png'
+PNG_DPI = 100
+
+# matplotlib.figure.Figure, imported on first GraphGenerator construction
+Figure = None
+
+_STYLE_APPLIED = False
+
+
+def _load_matplotlib():
+    """
+    Import the matplotlib Figure class on first use.
+
+    Importing matplotlib costs a few hundred ms (font cache and rcParams
+    setup), so it is deferred until graphs are actually generated rather
+    than paid by everything that imports rpycbench.analysis. pyplot is not
+    used at all: figures are created directly on an Agg canvas, so they are
+    never registered with pyplot's global figure manager.
+    """
+    global Figure
+    if Figure is None:
+        from matplotlib.figure import Figure as _Figure
+        Figure = _Figure
+    return Figure
+
+
+def _new_figure(figsize):
+    """A Figure attached to its own Agg canvas, outside pyplot"""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig = Figure(figsize=figsize, constrained_layout=True)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _apply_style():
+    """Apply the graph style to rcParams once per process"""
+    global _STYLE_APPLIED
+    if not _STYLE_APPLIED:
+        import matplotlib.style
+        matplotlib.style.use('seaborn-v0_8-darkgrid')
+        _STYLE_APPLIED = True
+
 
 class GraphGenerator:
-    def __init__(self, results_data: Dict[str, Any], output_dir: Path):
+    __slots__ = (
+        'results', 'output_dir', 'output_format', 'colors',
+        '_fig', '_ax', '_bw_fig', '_bw_axes',
+        '_series', '_labels', '_bar_colors',
+    )
+
+    def __init__(self, results_data: Dict[str, Any], output_dir: Path, output_format: str = 'svg'):
+        if output_format not in ('svg', 'png'):
+            raise ValueError(f"output_format must be 'svg' or 'png', not {output_format!r}")
         self.results = results_data
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_format = output_format
 
-        plt.style.use('seaborn-v0_8-darkgrid')
+        _load_matplotlib()
+        _apply_style()
         self.colors = {
             'rpyc_threaded': '#2E86AB',
             'rpyc_forking': '#A23B72',
             'http': '#F18F01'
         }
 
-    def generate_all(self):
-        graphs_generated = []
-
-        try:
-            graphs_generated.append(self.generate_connection_time_comparison())
-        except (KeyError, ValueError, RuntimeError) as e:
-            print(f"Warning: Could not generate connection time comparison: {e}")
+        # Figures are created on first use and reused (cleared) by every
+        # generate_* method; close() releases them
+        self._fig = self._ax = None
+        self._bw_fig = self._bw_axes = None
+
+        self._extract_series()
+
+    # (column, results section, field, default when the field is missing)
+    _SERIES = (
+        ('connection_mean', 'connection_time', 'mean', np.nan),
+        ('connection_stdev', 'connection_time', 'stdev', 0.0),
+        ('latency_mean', 'latency', 'mean', np.nan),
+        ('latency_stdev', 'latency', 'stdev', 0.0),
+        ('latency_p50', 'latency', 'median', 0.0),
+        ('latency_p95', 'latency', 'p95', 0.0),
+        ('latency_p99', 'latency', 'p99', 0.0),
+        ('upload_mbps', 'upload_bandwidth', 'mean', 0.0),
+        ('download_mbps', 'download_bandwidth', 'mean', 0.0),
+    )
+
+    # (series column, legend label, bar color) for the percentile graph
+    _PERCENTILE_BARS = (
+        ('latency_p50', 'P50 (Median)', '#4CAF50'),
+        ('latency_p95', 'P95', '#FF9800'),
+        ('latency_p99', 'P99', '#F44336'),
+    )
+
+    def _extract_series(self):
+        """
+        Read every plotted value from the results in one pass.
+
+        Each column is a float64 array with one entry per protocol, already
+        scaled for display (seconds to ms, bytes/s to MB/s), so the
+        generate_* methods only select and plot. A missing connection_time
+        or latency section leaves NaN in its mean column, which masks that
+        protocol out of the graph.
+        """
+        keys = list(self.results)
+        rows = [
+            [
+                (data.get(section) or {}).get(field, default)
+                for _, section, field, default in self._SERIES
+            ]
+            for data in self.results.values()
+        ]
+        table = np.array(rows, dtype=np.float64).reshape(len(keys), len(self._SERIES))
+        table[:, :7] *= 1000.0          # seconds -> ms
+        table[:, 7:] /= float(1 << 20)  # bytes/s -> MB/s
+
+        self._series = {name: table[:, i] for i, (name, *_) in enumerate(self._SERIES)}
+        self._labels = np.array([self._format_label(k) for k in keys], dtype=object)
+        self._bar_colors = np.array([self._get_color(k) for k in keys], dtype=object)
+
+    def _axes(self):
+        """The shared single-plot axes, cleared for the next graph"""
+        if self._fig is None:
+            self._fig = _new_figure((10, 6))
+            self._ax = self._fig.add_subplot(1, 1, 1)
+        self._ax.clear()
+        return self._ax
+
+    def _bandwidth_axes(self):
+        """The shared upload/download axes pair, cleared for the next graph"""
+        if self._bw_fig is None:
+            self._bw_fig = _new_figure((14, 6))
+            self._bw_axes = self._bw_fig.subplots(1, 2)
+        for ax in self._bw_axes:
+            ax.clear()
+        return self._bw_axes
+
+    def _save(self, fig, name: str) -> str:
+        # SVG writes the bars as vector paths with no rasterization or PNG
+        # compression; PNG output is rendered at PNG_DPI
+        output_path = self.output_dir / f'{name}.{self.output_format}'
+        if self.output_format == 'png':
+            fig.savefig(output_path, dpi=PNG_DPI)
+        else:
+            fig.savefig(output_path)
+        return str(output_path)
 
+    def close(self):
+        """Release the shared figures (nothing else holds a reference)"""
+        self._fig = self._ax = None
+        self._bw_fig = self._bw_axes = None
+
+    # (generate_* method, description used in warnings), in output order
+    _GRAPHS = (
+        ('generate_connection_time_comparison', 'connection time comparison'),
+        ('generate_latency_comparison', 'latency comparison'),
+        ('generate_bandwidth_comparison', 'bandwidth comparison'),
+        ('generate_percentile_comparison', 'percentile comparison'),
+    )
+
+    def generate_all(self, parallel: bool = True):
+        """
+        Generate every graph and return the paths written.
+
+        With parallel=True (and more than one CPU) each graph is rendered in
+        its own worker process, so the wall time is roughly that of the
+        slowest graph rather than the sum of all four.
+        """
         try:
-            graphs_generated.append(self.generate_latency_comparison())
-        except (KeyError, ValueError, RuntimeError) as e:
-            print(f"Warning: Could not generate latency comparison: {e}")
+            if parallel and (os.cpu_count() or 1) > 1:
+                return self._generate_all_parallel()
+            return self._generate_all()
+        finally:
+            self.close()
 
-        try:
-            graphs_generated.append(self.generate_bandwidth_comparison())
-        except (KeyError, ValueError, RuntimeError) as e:
-            print(f"Warning: Could not generate bandwidth comparison: {e}")
+    def _generate_all(self):
+        graphs_generated = []
 
-        try:
-            graphs_generated.append(self.generate_percentile_comparison())
-        except (KeyError, ValueError, RuntimeError) as e:
-            print(f"Warning: Could not generate percentile comparison: {e}")
+        for method, description in self._GRAPHS:
+            try:
+                graphs_generated.append(getattr(self, method)())
+            except (KeyError, ValueError, RuntimeError) as e:
+                print(f"Warning: Could not generate {description}: {e}")
 
         return [g for g in graphs_generated if g]
 
-    def generate_connection_time_comparison(self) -> Optional[str]:
-        fig, ax = plt.subplots(figsize=(10, 6))
+    def _generate_all_parallel(self):
+        graphs_generated = []
 
-        protocols = []
-        times = []
-        errors = []
+        max_workers = min(len(self._GRAPHS), os.cpu_count() or 1)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (executor.submit(_render_graph, self.results, self.output_dir, self.output_format, method),
+                 description)
+                for method, description in self._GRAPHS
+            ]
+            for future, description in futures:
+                try:
+                    graphs_generated.append(future.result())
+                except (KeyError, ValueError, RuntimeError) as e:
+                    print(f"Warning: Could not generate {description}: {e}")
 
-        for protocol_key, data in self.results.items():
-            if 'connection_time' in data:
-                ct = data['connection_time']
-                protocols.append(self._format_label(protocol_key))
-                times.append(ct['mean'] * 1000)
-                errors.append(ct['stdev'] * 1000)
+        return [g for g in graphs_generated if g]
 
-        if not protocols:
+    def generate_connection_time_comparison(self) -> Optional[str]:
+        series = self._series
+        mask = ~np.isnan(series['connection_mean'])
+        if not mask.any():
             return None
 
-        x = np.arange(len(protocols))
-        bars = ax.bar(x, times, yerr=errors, capsize=5,
-                     color=[self._get_color(p) for p in self.results.keys()],
+        ax = self._axes()
+        x = np.arange(mask.sum())
+        bars = ax.bar(x, series['connection_mean'][mask], yerr=series['connection_stdev'][mask], capsize=5,
+                     color=list(self._bar_colors[mask]),
                      alpha=0.8, edgecolor='black', linewidth=1.2)
 
         ax.set_xlabel('Protocol / Server Mode', fontsize=12, fontweight='bold')
         ax.set_ylabel('Connection Time (ms)', fontsize=12, fontweight='bold')
         ax.set_title('Connection Establishment Time Comparison', fontsize=14, fontweight='bold')
         ax.set_xticks(x)
-        ax.set_xticklabels(protocols, rotation=15, ha='right')
+        ax.set_xticklabels(self._labels[mask], rotation=15, ha='right')
         ax.grid(axis='y', alpha=0.3)
 
-        plt.tight_layout()
-        output_path = self.output_dir / 'connection_time_comparison.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-
-        return str(output_path)
+        return self._save(self._fig, 'connection_time_comparison')
 
     def generate_latency_comparison(self) -> Optional[str]:
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        protocols = []
-        means = []
-        errors = []
-
-        for protocol_key, data in self.results.items():
-            if 'latency' in data:
-                lat = data['latency']
-                protocols.append(self._format_label(protocol_key))
-                means.append(lat['mean'] * 1000)
-                errors.append(lat['stdev'] * 1000)
-
-        if not protocols:
+        series = self._series
+        mask = ~np.isnan(series['latency_mean'])
+        if not mask.any():
             return None
 
-        x = np.arange(len(protocols))
-        bars = ax.bar(x, means, yerr=errors, capsize=5,
-                     color=[self._get_color(p) for p in self.results.keys()],
+        ax = self._axes()
+        x = np.arange(mask.sum())
+        bars = ax.bar(x, series['latency_mean'][mask], yerr=series['latency_stdev'][mask], capsize=5,
+                     color=list(self._bar_colors[mask]),
                      alpha=0.8, edgecolor='black', linewidth=1.2)
 
         ax.set_xlabel('Protocol / Server Mode', fontsize=12, fontweight='bold')
         ax.set_ylabel('Latency (ms)', fontsize=12, fontweight='bold')
         ax.set_title('Mean Latency Comparison', fontsize=14, fontweight='bold')
         ax.set_xticks(x)
-        ax.set_xticklabels(protocols, rotation=15, ha='right')
+        ax.set_xticklabels(self._labels[mask], rotation=15, ha='right')
         ax.grid(axis='y', alpha=0.3)
 
-        plt.tight_layout()
-        output_path = self.output_dir / 'latency_comparison.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-
-        return str(output_path)
+        return self._save(self._fig, 'latency_comparison')
 
     def generate_bandwidth_comparison(self) -> Optional[str]:
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-
-        protocols = []
-        upload = []
-        download = []
-
-        for protocol_key, data in self.results.items():
-            label = self._format_label(protocol_key)
-            protocols.append(label)
-
-            if 'upload_bandwidth' in data:
-                ub = data['upload_bandwidth']['mean'] / (1024 * 1024)
-                upload.append(ub)
-            else:
-                upload.append(0)
-
-            if 'download_bandwidth' in data:
-                db = data['download_bandwidth']['mean'] / (1024 * 1024)
-                download.append(db)
-            else:
-                download.append(0)
-
-        if not protocols or (all(u == 0 for u in upload) and all(d == 0 for d in download)):
+        upload = self._series['upload_mbps']
+        download = self._series['download_mbps']
+        if not len(upload) or not (upload.any() or download.any()):
             return None
 
-        x = np.arange(len(protocols))
+        ax1, ax2 = self._bandwidth_axes()
+        x = np.arange(len(upload))
         width = 0.6
+        colors = list(self._bar_colors)
 
-        ax1.bar(x, upload, width, color=[self._get_color(p) for p in self.results.keys()],
+        ax1.bar(x, upload, width, color=colors,
                alpha=0.8, edgecolor='black', linewidth=1.2)
         ax1.set_xlabel('Protocol / Server Mode', fontsize=11, fontweight='bold')
         ax1.set_ylabel('Upload Bandwidth (MB/s)', fontsize=11, fontweight='bold')
         ax1.set_title('Upload Bandwidth', fontsize=12, fontweight='bold')
         ax1.set_xticks(x)
-        ax1.set_xticklabels(protocols, rotation=15, ha='right')
+        ax1.set_xticklabels(self._labels, rotation=15, ha='right')
         ax1.grid(axis='y', alpha=0.3)
 
-        ax2.bar(x, download, width, color=[self._get_color(p) for p in self.results.keys()],
+        ax2.bar(x, download, width, color=colors,
                alpha=0.8, edgecolor='black', linewidth=1.2)
         ax2.set_xlabel('Protocol / Server Mode', fontsize=11, fontweight='bold')
         ax2.set_ylabel('Download Bandwidth (MB/s)', fontsize=11, fontweight='bold')
         ax2.set_title('Download Bandwidth', fontsize=12, fontweight='bold')
         ax2.set_xticks(x)
-        ax2.set_xticklabels(protocols, rotation=15, ha='right')
+        ax2.set_xticklabels(self._labels, rotation=15, ha='right')
         ax2.grid(axis='y', alpha=0.3)
 
-        plt.tight_layout()
-        output_path = self.output_dir / 'bandwidth_comparison.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-
-        return str(output_path)
+        return self._save(self._bw_fig, 'bandwidth_comparison')
 
     def generate_percentile_comparison(self) -> Optional[str]:
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        protocols = []
-        p50_values = []
-        p95_values = []
-        p99_values = []
-
-        for protocol_key, data in self.results.items():
-            if 'latency' in data:
-                lat = data['latency']
-                protocols.append(self._format_label(protocol_key))
-                p50_values.append(lat.get('median', 0) * 1000)
-                p95_values.append(lat.get('p95', 0) * 1000)
-                p99_values.append(lat.get('p99', 0) * 1000)
-
-        if not protocols:
+        series = self._series
+        mask = ~np.isnan(series['latency_mean'])
+        if not mask.any():
             return None
 
-        x = np.arange(len(protocols))
+        ax = self._axes()
+        x = np.arange(mask.sum())
         width = 0.25
 
-        ax.bar(x - width, p50_values, width, label='P50 (Median)',
-              color='#4CAF50', alpha=0.8, edgecolor='black', linewidth=1)
-        ax.bar(x, p95_values, width, label='P95',
-              color='#FF9800', alpha=0.8, edgecolor='black', linewidth=1)
-        ax.bar(x + width, p99_values, width, label='P99',
-              color='#F44336', alpha=0.8, edgecolor='black', linewidth=1)
+        # One (3, N) gather for all three percentile rows; each ax.bar call
+        # then receives contiguous ndarrays for positions and heights
+        heights = np.stack([series[column] for column, _, _ in self._PERCENTILE_BARS])[:, mask]
+        positions = x + width * np.array([[-1.0], [0.0], [1.0]])
+        for (_, label, color), pos, height in zip(self._PERCENTILE_BARS, positions, heights):
+            ax.bar(pos, height, width, label=label,
+                  color=color, alpha=0.8, edgecolor='black', linewidth=1)
 
         ax.set_xlabel('Protocol / Server Mode', fontsize=12, fontweight='bold')
         ax.set_ylabel('Latency (ms)', fontsize=12, fontweight='bold')
         ax.set_title('Latency Percentiles Comparison', fontsize=14, fontweight='bold')
         ax.set_xticks(x)
-        ax.set_xticklabels(protocols, rotation=15, ha='right')
+        ax.set_xticklabels(self._labels[mask], rotation=15, ha='right')
         ax.legend(fontsize=10)
         ax.grid(axis='y', alpha=0.3)
 
-        plt.tight_layout()
-        output_path = self.output_dir / 'percentile_comparison.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-
-        return str(output_path)
+        return self._save(self._fig, 'percentile_comparison')
 
     def _format_label(self, protocol_key: str) -> str:
         return protocol_key.replace('_', ' ').title()
@@ -222,11 +322,34 @@ class GraphGenerator:
         return self.colors.get(protocol_key, '#666666')
 
 
-def generate_graphs_from_json(json_path: Path, output_dir: Path) -> List[str]:
-    with open(json_path, 'r') as f:
-        data = json.load(f)
+def _render_graph(results_data: Dict[str, Any], output_dir: Path, output_format: str, method: str) -> Optional[str]:
+    """Render one graph in a pool worker with its own GraphGenerator"""
+    generator = GraphGenerator(results_data, output_dir, output_format=output_format)
+    try:
+        return getattr(generator, method)()
+    finally:
+        generator.close()
+
+
+def generate_graphs_from_json(json_path: Path, output_dir: Path, output_format: str = 'svg') -> List[str]:
+    """
+    Render comparison graphs for a results JSON file.
+
+    output_format is 'svg' (default; vector output, no raster encoding) or
+    'png' (rendered at PNG_DPI). The file is parsed with orjson when it is
+    installed. Returns the paths of the files written.
+    """
+    raw = Path(json_path).read_bytes()
+    data = None
+    if orjson is not None:
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity written by the stdlib encoder; let json parse it
+    if data is None:
+        data = json.loads(raw)
 
     results = data.get('results', data)
 
-    generator = GraphGenerator(results, output_dir)
+    generator = GraphGenerator(results, output_dir, output_format=output_format)
     return generator.generate_all()
@@ -1,76 +1,84 @@
 """Monkey-patching for automatic RPyC connection profiling"""
 
 import sys
+import threading
 import rpyc
 from typing import Optional
 
 from rpycbench.utils.profiler import ProfiledConnection
-from rpycbench.utils.telemetry import get_telemetry
+from rpycbench.utils.telemetry import RPyCTelemetry, get_telemetry
 
 
 _original_connect = None
 _original_classic_connect = None
 _patches_installed = False
+_install_lock = threading.Lock()
 
 
-def install_patches():
+def install_patches(telemetry_inst: Optional[RPyCTelemetry] = None):
     """Install monkey patches for rpyc.connect and rpyc.utils.classic.connect
 
     This intercepts connection creation to automatically wrap connections
     with profiling capabilities.
+
+    Connections record into telemetry_inst, or else into whatever the
+    global telemetry instance is when each connection is made, so
+    enable_telemetry() and telemetry_context() keep working after the
+    patches are installed. Installing again while installed is a no-op,
+    also when racing from several threads.
     """
     global _original_connect, _original_classic_connect, _patches_installed
 
-    if _patches_installed:
-        return
+    with _install_lock:
+        if _patches_installed:
+            return
 
-    import rpyc as rpyc_module
-    _original_connect = rpyc_module.connect
+        import rpyc as rpyc_module
+        _original_connect = rpyc_module.connect
 
-    def profiled_connect(*args, **kwargs):
-        """Wrapper for rpyc.connect that returns a ProfiledConnection"""
-        conn = _original_connect(*args, **kwargs)
-        telemetry = get_telemetry()
-        return ProfiledConnection(conn, telemetry_inst=telemetry)
+        def profiled_connect(*args, **kwargs):
+            """Wrapper for rpyc.connect that returns a ProfiledConnection"""
+            conn = _original_connect(*args, **kwargs)
+            return ProfiledConnection(conn, telemetry_inst=telemetry_inst or get_telemetry())
 
-    rpyc_module.connect = profiled_connect
+        rpyc_module.connect = profiled_connect
 
-    try:
-        import rpyc.utils.classic as classic_module
-        _original_classic_connect = classic_module.connect
+        try:
+            import rpyc.utils.classic as classic_module
+            _original_classic_connect = classic_module.connect
 
-        def profiled_classic_connect(*args, **kwargs):
-            """Wrapper for rpyc.utils.classic.connect that returns a ProfiledConnection"""
-            conn = _original_classic_connect(*args, **kwargs)
-            telemetry = get_telemetry()
-            return ProfiledConnection(conn, telemetry_inst=telemetry)
+            def profiled_classic_connect(*args, **kwargs):
+                """Wrapper for rpyc.utils.classic.connect that returns a ProfiledConnection"""
+                conn = _original_classic_connect(*args, **kwargs)
+                return ProfiledConnection(conn, telemetry_inst=telemetry_inst or get_telemetry())
 
-        classic_module.connect = profiled_classic_connect
-    except (ImportError, AttributeError):
-        pass
+            classic_module.connect = profiled_classic_connect
+        except (ImportError, AttributeError):
+            pass
 
-    _patches_installed = True
+        _patches_installed = True
 
 
 def uninstall_patches():
     """Restore original RPyC connection functions"""
     global _patches_installed
 
-    if not _patches_installed:
-        return
+    with _install_lock:
+        if not _patches_installed:
+            return
 
-    if _original_connect:
-        import rpyc as rpyc_module
-        rpyc_module.connect = _original_connect
+        if _original_connect:
+            import rpyc as rpyc_module
+            rpyc_module.connect = _original_connect
 
-    if _original_classic_connect:
-        try:
-            import rpyc.utils.classic as classic_module
-            classic_module.connect = _original_classic_connect
-        except (ImportError, AttributeError):
-            pass
+        if _original_classic_connect:
+            try:
+                import rpyc.utils.classic as classic_module
+                classic_module.connect = _original_classic_connect
+            except (ImportError, AttributeError):
+                pass
 
-    _patches_installed = False
+        _patches_installed = False
 
 
 def is_patched() -> bool:
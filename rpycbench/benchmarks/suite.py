@@ -6,15 +6,31 @@ from rpycbench.core.benchmark import (
     BandwidthBenchmark,
     BinaryTransferBenchmark,
     ConcurrentBenchmark,
+    create_client_executor,
 )
 from rpycbench.core.metrics import BenchmarkResults
-from rpycbench.servers.rpyc_servers import RPyCServer, create_rpyc_connection
-from rpycbench.servers.http_servers import HTTPBenchmarkServer, create_http_session
+from rpycbench.servers.rpyc_servers import ConnectionPool, RPyCServer, create_rpyc_connection
+from rpycbench.servers.http_servers import (
+    HTTPBenchmarkServer,
+    create_http_connection,
+    create_http_session,
+    download_chunks,
+    http_request,
+    upload_chunks,
+)
+import contextlib
+import functools
+import logging
 import requests
 import time
 from typing import Optional
 
 
+logger = logging.getLogger(__name__)
+
+RULE = "=" * 80
+
+
 class BenchmarkSuite:
     """Complete benchmark suite for RPyC vs HTTP comparison"""
 
@@ -25,6 +41,8 @@ class BenchmarkSuite:
         http_host='localhost',
         http_port=5000,
         remote_host: Optional[str] = None,
+        pin_client_threads: bool = False,
+        reuse_connections: bool = True,
     ):
         self.rpyc_host = rpyc_host
         self.rpyc_port = rpyc_port
@@ -44,6 +62,24 @@ class BenchmarkSuite:
 
         self.results = BenchmarkResults()
 
+        # Client threads shared by every concurrent benchmark in run_all()
+        self.pin_client_threads = pin_client_threads
+        self._executor = None
+
+        # Single-connection benchmarks of one protocol share a connection
+        self.reuse_connections = reuse_connections
+
+    def _shared_connection(self, connection_factory):
+        """
+        Pool holding the one connection consecutive benchmarks share.
+
+        Yields None (every benchmark opens its own connection) when
+        reuse_connections is off.
+        """
+        if not self.reuse_connections:
+            return contextlib.nullcontext()
+        return ConnectionPool(connection_factory, max_size=1)
+
     def run_all(
         self,
         test_rpyc_threaded=True,
@@ -60,12 +96,49 @@ class BenchmarkSuite:
     ):
         """Run all benchmarks"""
 
-        print("Starting Benchmark Suite...")
-        print("=" * 80)
+        # One client thread pool for the whole suite, instead of starting and
+        # joining num_parallel_clients threads for every concurrent benchmark
+        self._executor = create_client_executor(
+            min(num_parallel_clients, 128), pin_threads=self.pin_client_threads
+        )
+        try:
+            return self._run_all(
+                test_rpyc_threaded,
+                test_rpyc_forking,
+                test_http,
+                num_serial_connections,
+                num_requests,
+                num_parallel_clients,
+                requests_per_client,
+                test_binary_transfer,
+                binary_file_sizes,
+                binary_chunk_size,
+                binary_iterations,
+            )
+        finally:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _run_all(
+        self,
+        test_rpyc_threaded,
+        test_rpyc_forking,
+        test_http,
+        num_serial_connections,
+        num_requests,
+        num_parallel_clients,
+        requests_per_client,
+        test_binary_transfer,
+        binary_file_sizes,
+        binary_chunk_size,
+        binary_iterations,
+    ):
+        logger.info("Starting Benchmark Suite...")
+        logger.info(RULE)
 
         # Test RPyC Threaded Server
         if test_rpyc_threaded:
-            print("\n[1/3] Testing RPyC Threaded Server...")
+            logger.info("\n[1/3] Testing RPyC Threaded Server...")
             if self.remote_host:
                 from rpycbench.remote.servers import RemoteRPyCServer
                 bind_host = '0.0.0.0' if self.rpyc_host == 'localhost' else self.rpyc_host
@@ -93,7 +166,7 @@ class BenchmarkSuite:
 
         # Test RPyC Forking Server
         if test_rpyc_forking:
-            print("\n[2/3] Testing RPyC Forking Server...")
+            logger.info("\n[2/3] Testing RPyC Forking Server...")
             if self.remote_host:
                 from rpycbench.remote.servers import RemoteRPyCServer
                 bind_host = '0.0.0.0' if self.rpyc_host == 'localhost' else self.rpyc_host
@@ -121,7 +194,7 @@ class BenchmarkSuite:
 
         # Test HTTP Server
         if test_http:
-            print("\n[3/3] Testing HTTP/REST Server...")
+            logger.info("\n[3/3] Testing HTTP/REST Server...")
             if self.remote_host:
                 from rpycbench.remote.servers import RemoteHTTPServer
                 bind_host = '0.0.0.0' if self.http_host == 'localhost' else self.http_host
@@ -146,8 +219,8 @@ class BenchmarkSuite:
                     binary_iterations,
                 )
 
-        print("\n" + "=" * 80)
-        print("All benchmarks complete!")
+        logger.info("\n%s", RULE)
+        logger.info("All benchmarks complete!")
 
         return self.results
 
@@ -166,7 +239,7 @@ class BenchmarkSuite:
         """Run all benchmarks for RPyC"""
 
         # Connection Benchmark
-        print(f"  - Connection benchmark ({num_serial_connections} serial connections)...")
+        logger.info("  - Connection benchmark (%d serial connections)...", num_serial_connections)
         conn_bench = ConnectionBenchmark(
             name=f"RPyC Connection ({server_mode})",
             protocol="rpyc",
@@ -177,64 +250,74 @@ class BenchmarkSuite:
         metrics = conn_bench.execute()
         self.results.add_result(metrics)
 
-        # Latency Benchmark
-        print(f"  - Latency benchmark ({num_requests} requests)...")
-        lat_bench = LatencyBenchmark(
-            name=f"RPyC Latency ({server_mode})",
-            protocol="rpyc",
-            server_mode=server_mode,
-            connection_factory=lambda: create_rpyc_connection(self.rpyc_connect_host, self.rpyc_port),
-            request_func=lambda conn: conn.root.ping(),
-            num_requests=num_requests,
-        )
-        metrics = lat_bench.execute()
-        self.results.add_result(metrics)
-
-        # Bandwidth Benchmark
-        print(f"  - Bandwidth benchmark...")
-        bw_bench = BandwidthBenchmark(
-            name=f"RPyC Bandwidth ({server_mode})",
-            protocol="rpyc",
-            server_mode=server_mode,
-            connection_factory=lambda: create_rpyc_connection(self.rpyc_connect_host, self.rpyc_port),
-            upload_func=lambda conn, data: conn.root.upload(data),
-            download_func=lambda conn, size: conn.root.download(size),
-            data_sizes=[1024, 10240, 102400, 1048576],
-            iterations=10,
-        )
-        metrics = bw_bench.execute()
-        self.results.add_result(metrics)
+        # The latency, bandwidth and binary transfer benchmarks each run over
+        # one connection; share it instead of handshaking once per benchmark
+        rpyc_connection_factory = lambda: create_rpyc_connection(self.rpyc_connect_host, self.rpyc_port)
+        with self._shared_connection(rpyc_connection_factory) as pool:
+            # Latency Benchmark
+            logger.info("  - Latency benchmark (%d requests)...", num_requests)
+            lat_bench = LatencyBenchmark(
+                name=f"RPyC Latency ({server_mode})",
+                protocol="rpyc",
+                server_mode=server_mode,
+                connection_factory=rpyc_connection_factory,
+                connection_pool=pool,
+                request_func_factory=lambda conn: conn.root.ping,
+                num_requests=num_requests,
+            )
+            metrics = lat_bench.execute()
+            self.results.add_result(metrics)
 
-        # Binary Transfer Benchmark
-        if test_binary_transfer:
-            print(f"  - Binary transfer benchmark...")
-            bin_bench = BinaryTransferBenchmark(
-                name=f"RPyC Binary Transfer ({server_mode})",
+            # Bandwidth Benchmark
+            logger.info("  - Bandwidth benchmark...")
+            bw_bench = BandwidthBenchmark(
+                name=f"RPyC Bandwidth ({server_mode})",
                 protocol="rpyc",
                 server_mode=server_mode,
-                connection_factory=lambda: create_rpyc_connection(self.rpyc_connect_host, self.rpyc_port),
-                upload_func=lambda conn, data: conn.root.upload_file(data),
-                download_func=lambda conn, size: conn.root.download_file(size),
-                upload_chunked_func=lambda conn, chunks: conn.root.upload_file_chunked(chunks),
-                download_chunked_func=lambda conn, size, chunk_size: conn.root.download_file_chunked(size, chunk_size),
-                file_sizes=binary_file_sizes,
-                chunk_size=binary_chunk_size,
-                iterations=binary_iterations,
+                connection_factory=rpyc_connection_factory,
+                connection_pool=pool,
+                upload_func=lambda conn, data: conn.root.upload(data),
+                download_func=lambda conn, size: conn.root.download(size),
+                data_sizes=[1024, 10240, 102400, 1048576],
+                iterations=10,
+                interleaved=True,
+                warmup_iterations=3,
             )
-            metrics = bin_bench.execute()
+            metrics = bw_bench.execute()
             self.results.add_result(metrics)
 
+            # Binary Transfer Benchmark
+            if test_binary_transfer:
+                logger.info("  - Binary transfer benchmark...")
+                bin_bench = BinaryTransferBenchmark(
+                    name=f"RPyC Binary Transfer ({server_mode})",
+                    protocol="rpyc",
+                    server_mode=server_mode,
+                    connection_factory=rpyc_connection_factory,
+                    connection_pool=pool,
+                    upload_func=lambda conn, data: conn.root.upload_file(data),
+                    download_func=lambda conn, size: conn.root.download_file(size),
+                    upload_chunked_func=lambda conn, chunks: conn.root.upload_file_chunked(chunks),
+                    download_chunked_func=lambda conn, size, chunk_size: conn.root.download_file_chunked(size, chunk_size),
+                    file_sizes=binary_file_sizes,
+                    chunk_size=binary_chunk_size,
+                    iterations=binary_iterations,
+                )
+                metrics = bin_bench.execute()
+                self.results.add_result(metrics)
+
         # Concurrent Benchmark
-        print(f"  - Concurrent benchmark ({num_parallel_clients} parallel clients)...")
+        logger.info("  - Concurrent benchmark (%d parallel clients)...", num_parallel_clients)
         conc_bench = ConcurrentBenchmark(
             name=f"RPyC Concurrent ({server_mode})",
             protocol="rpyc",
             server_mode=server_mode,
             connection_factory=lambda: create_rpyc_connection(self.rpyc_connect_host, self.rpyc_port),
-            request_func=lambda conn: conn.root.ping(),
+            request_func_factory=lambda conn: conn.root.ping,
             num_clients=num_parallel_clients,
             requests_per_client=requests_per_client,
             track_per_connection=False,  # Disable for suite (enable manually if needed)
+            executor=self._executor,
         )
         metrics = conc_bench.execute()
         self.results.add_result(metrics)
@@ -251,65 +334,80 @@ class BenchmarkSuite:
         binary_iterations,
     ):
         """Run all benchmarks for HTTP"""
+        base_url = self.http_base_url
+        upload_file_url = f"{base_url}/upload-file"
+        upload_chunked_url = f"{base_url}/upload-file-chunked"
+        # Sized URLs are formatted once per distinct size, then looked up
+        download_path = functools.lru_cache(maxsize=None)("/download/{}".format)
+        download_file_url = functools.lru_cache(maxsize=None)(f"{base_url}/download-file/{{}}".format)
+        download_chunked_url = functools.lru_cache(maxsize=None)(
+            f"{base_url}/download-file-chunked/{{}}/{{}}".format
+        )
+        # Each session is driven by one thread: one pooled socket is enough,
+        # and retries are off so failed requests are counted, not re-sent
+        http_session_factory = functools.partial(
+            create_http_session, pool_connections=1, pool_maxsize=1, max_retries=0
+        )
 
         # Connection Benchmark
-        print(f"  - Connection benchmark ({num_serial_connections} serial connections)...")
+        logger.info("  - Connection benchmark (%d serial connections)...", num_serial_connections)
         conn_bench = ConnectionBenchmark(
             name="HTTP Connection",
             protocol="http",
             server_mode="threaded",
-            connection_factory=lambda: create_http_session(),
+            connection_factory=http_session_factory,
             num_connections=num_serial_connections,
         )
         metrics = conn_bench.execute()
         self.results.add_result(metrics)
 
         # Latency Benchmark
-        print(f"  - Latency benchmark ({num_requests} requests)...")
+        logger.info("  - Latency benchmark (%d requests)...", num_requests)
         lat_bench = LatencyBenchmark(
             name="HTTP Latency",
             protocol="http",
             server_mode="threaded",
-            connection_factory=lambda: create_http_session(),
-            request_func=lambda session: session.get(f"{self.http_base_url}/ping"),
+            connection_factory=lambda: create_http_connection(self.http_connect_host, self.http_port),
+            request_func=functools.partial(http_request, method='GET', path='/ping'),
             num_requests=num_requests,
         )
         metrics = lat_bench.execute()
         self.results.add_result(metrics)
 
         # Bandwidth Benchmark
-        print(f"  - Bandwidth benchmark...")
+        # Raw http.client connection, like the latency benchmark: each upload
+        # leaves as one vectored send of headers and body, where requests
+        # writes them separately
+        logger.info("  - Bandwidth benchmark...")
         bw_bench = BandwidthBenchmark(
             name="HTTP Bandwidth",
             protocol="http",
             server_mode="threaded",
-            connection_factory=lambda: create_http_session(),
-            upload_func=lambda session, data: session.post(f"{self.http_base_url}/upload", data=data),
-            download_func=lambda session, size: session.get(f"{self.http_base_url}/download/{size}").content,
+            connection_factory=lambda: create_http_connection(self.http_connect_host, self.http_port),
+            upload_func=lambda conn, data: http_request(conn, 'POST', '/upload', data),
+            download_func=lambda conn, size: http_request(conn, 'GET', download_path(size)),
             data_sizes=[1024, 10240, 102400, 1048576],
             iterations=10,
+            interleaved=True,
+            warmup_iterations=3,
         )
         metrics = bw_bench.execute()
         self.results.add_result(metrics)
 
         # Binary Transfer Benchmark
         if test_binary_transfer:
-            print(f"  - Binary transfer benchmark...")
+            logger.info("  - Binary transfer benchmark...")
             bin_bench = BinaryTransferBenchmark(
                 name="HTTP Binary Transfer",
                 protocol="http",
                 server_mode="threaded",
-                connection_factory=lambda: create_http_session(),
-                upload_func=lambda session, data: session.post(f"{self.http_base_url}/upload-file", data=data),
-                download_func=lambda session, size: session.get(f"{self.http_base_url}/download-file/{size}").content,
-                upload_chunked_func=lambda session, chunks: session.post(
-                    f"{self.http_base_url}/upload-file-chunked",
-                    json={'chunks': [chunk.hex() for chunk in chunks]}
+                connection_factory=http_session_factory,
+                upload_func=lambda session, data: session.post(upload_file_url, data=data),
+                download_func=lambda session, size: session.get(download_file_url(size)).content,
+                upload_chunked_func=lambda session, chunks: upload_chunks(session, upload_chunked_url, chunks),
+                download_chunked_func=lambda session, size, chunk_size: download_chunks(
+                    session, download_chunked_url(size, chunk_size)
                 ),
-                download_chunked_func=lambda session, size, chunk_size: [
-                    bytes.fromhex(chunk) for chunk in
-                    session.get(f"{self.http_base_url}/download-file-chunked/{size}/{chunk_size}").json()['chunks']
-                ],
                 file_sizes=binary_file_sizes,
                 chunk_size=binary_chunk_size,
                 iterations=binary_iterations,
@@ -318,16 +416,17 @@ class BenchmarkSuite:
             self.results.add_result(metrics)
 
         # Concurrent Benchmark
-        print(f"  - Concurrent benchmark ({num_parallel_clients} parallel clients)...")
+        logger.info("  - Concurrent benchmark (%d parallel clients)...", num_parallel_clients)
         conc_bench = ConcurrentBenchmark(
             name="HTTP Concurrent",
             protocol="http",
             server_mode="threaded",
-            connection_factory=lambda: create_http_session(),
-            request_func=lambda session: session.get(f"{self.http_base_url}/ping"),
+            connection_factory=lambda: create_http_connection(self.http_connect_host, self.http_port),
+            request_func=functools.partial(http_request, method='GET', path='/ping'),
             num_clients=num_parallel_clients,
             requests_per_client=requests_per_client,
             track_per_connection=False,  # Disable for suite (enable manually if needed)
+            executor=self._executor,
         )
         metrics = conc_bench.execute()
         self.results.add_result(metrics)
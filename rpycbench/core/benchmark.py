@@ -1,14 +1,35 @@
 """Core benchmark framework with context managers"""
 
 import time
+import asyncio
+import copy
+import functools
+import inspect
+import itertools
+import os
+import pickle
+import queue
 import threading
 import multiprocessing
+import socket
 from abc import ABC, abstractmethod
 from typing import Callable, Optional, Any, Dict, List
 from contextlib import contextmanager
 import concurrent.futures
 
-from rpycbench.core.metrics import BenchmarkMetrics, BenchmarkResults
+import numpy as np
+
+from rpycbench.core.metrics import (
+    BenchmarkMetrics,
+    BenchmarkResults,
+    HistogramRecorder,
+    PerConnectionMetrics,
+)
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 
 class BenchmarkBase(ABC):
@@ -83,49 +104,135 @@ class BenchmarkContext:
         self._request_start = None
         self._bytes_sent = 0
         self._bytes_received = 0
+        self._sampler = None
+        self._stop_sampling = None
+
+        # Pick the recorder once; the measure_* flags are fixed per context
+        self._record_duration = {
+            (True, True): self._record_latency_and_bandwidth,
+            (True, False): self._record_latency,
+            (False, True): self._record_bandwidth,
+            (False, False): self._record_nothing,
+        }[bool(measure_latency), bool(measure_bandwidth)]
 
     def __enter__(self):
         """Enter benchmark context"""
-        self.metrics.start()
         if self.measure_system:
-            self.metrics.record_system_metrics()
+            self._start_system_sampler()
+        self.metrics.start()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit benchmark context"""
+        # Close the timer first so joining the sampler is not measured
         self.metrics.end()
-        if self.measure_system:
-            self.metrics.record_system_metrics()
+        if self._sampler is not None:
+            self._stop_sampling.set()
+            self._sampler.join()
+            self._sampler = None
         return False
 
+    def _start_system_sampler(self):
+        self._stop_sampling = threading.Event()
+        self._sampler = threading.Thread(target=self._sample_system, daemon=True)
+        self._sampler.start()
+
+    def _sample_system(self):
+        """
+        Record system metrics until the context exits.
+
+        Each record_system_metrics() call blocks for its 0.1s CPU sampling
+        window, so this samples at ~10Hz off the timed thread, and always
+        takes at least one sample.
+        """
+        while True:
+            self.metrics.record_system_metrics()
+            if self._stop_sampling.is_set():
+                return
+
     @contextmanager
     def measure_connection_time(self):
         """Context manager to measure connection establishment time"""
-        start = time.time()
+        start = time.perf_counter_ns()
         try:
             yield
         finally:
-            duration = time.time() - start
+            duration = (time.perf_counter_ns() - start) * 1e-9
             if self.measure_connection:
                 self.metrics.add_connection_time(duration)
 
     @contextmanager
     def measure_request(self, bytes_sent: int = 0, bytes_received: int = 0):
-        """Context manager to measure request latency and bandwidth"""
-        start = time.time()
+        """
+        Context manager to measure request latency and bandwidth.
+
+        Timestamps are taken with the monotonic integer perf_counter_ns() and
+        converted to seconds once, when the sample is recorded.
+        """
+        start = time.perf_counter_ns()
         try:
             yield
         finally:
-            duration = time.time() - start
+            self._record_duration(
+                (time.perf_counter_ns() - start) * 1e-9, bytes_sent, bytes_received
+            )
+
+    def measure_request_fast(self) -> int:
+        """
+        Start timing a request without entering a context manager.
+
+        Returns a perf_counter_ns() timestamp to pass to record_elapsed().
+        Use in tight loops where the generator-based measure_request() adds
+        measurable overhead per call.
+        """
+        return time.perf_counter_ns()
+
+    def record_elapsed(
+        self,
+        start: int,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        success: bool = True,
+    ):
+        """Finish a request started with measure_request_fast() and count it"""
+        self._record_duration(
+            (time.perf_counter_ns() - start) * 1e-9, bytes_sent, bytes_received
+        )
+        self.record_request(success)
+
+    @contextmanager
+    def measure_requests_batch(self):
+        """
+        Collect a batch of request latencies and record them all on exit.
 
+        Yields a list; append one perf_counter_ns() delta per successful
+        request. On exit (also on error) the samples are converted and stored
+        in one call and counted as successful requests, so the per-request
+        cost is one list append. Bandwidth is not recorded for batches.
+        """
+        samples_ns = []
+        try:
+            yield samples_ns
+        finally:
             if self.measure_latency:
-                self.metrics.add_latency(duration)
+                self.metrics.add_latencies_ns(samples_ns)
+            self.metrics.total_requests += len(samples_ns)
+
+    def _record_latency(self, duration: float, bytes_sent: int, bytes_received: int):
+        self.metrics.add_latency(duration)
 
-            if self.measure_bandwidth:
-                if bytes_sent > 0:
-                    self.metrics.add_upload_bandwidth(bytes_sent, duration)
-                if bytes_received > 0:
-                    self.metrics.add_download_bandwidth(bytes_received, duration)
+    def _record_bandwidth(self, duration: float, bytes_sent: int, bytes_received: int):
+        if bytes_sent > 0:
+            self.metrics.add_upload_bandwidth(bytes_sent, duration)
+        if bytes_received > 0:
+            self.metrics.add_download_bandwidth(bytes_received, duration)
+
+    def _record_latency_and_bandwidth(self, duration: float, bytes_sent: int, bytes_received: int):
+        self.metrics.add_latency(duration)
+        self._record_bandwidth(duration, bytes_sent, bytes_received)
+
+    def _record_nothing(self, duration: float, bytes_sent: int, bytes_received: int):
+        pass
 
     def record_request(self, success: bool = True):
         """Record a request completion"""
@@ -138,6 +245,46 @@ class BenchmarkContext:
         return self.metrics
 
 
+def _ns_to_seconds(samples_ns: List[int]) -> np.ndarray:
+    """
+    Convert perf_counter_ns() deltas to seconds.
+
+    Workers collect integer nanosecond deltas in their request loop and
+    convert them here once, as an int64 array, instead of doing float
+    arithmetic per request.
+    """
+    return np.asarray(samples_ns, dtype=np.int64) * 1e-9
+
+
+def create_client_executor(
+    max_workers: int,
+    pin_threads: bool = False,
+) -> concurrent.futures.ThreadPoolExecutor:
+    """
+    Thread pool for concurrent benchmark clients.
+
+    Pass one to several ConcurrentBenchmarks (executor=...) to reuse its
+    threads across runs instead of starting and joining max_workers threads
+    per benchmark. Threads are named rpycbench_N. With pin_threads, each
+    worker thread pins itself to one usable CPU, round-robin, so it is not
+    migrated between cores mid-run (Linux only; ignored elsewhere).
+    """
+    initializer = None
+    if pin_threads and hasattr(os, 'sched_setaffinity'):
+        cpus = sorted(os.sched_getaffinity(0))
+        worker_ids = itertools.count()
+
+        def initializer():
+            # pid 0 is the calling thread on Linux
+            os.sched_setaffinity(0, {cpus[next(worker_ids) % len(cpus)]})
+
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix='rpycbench',
+        initializer=initializer,
+    )
+
+
 class ConnectionBenchmark(BenchmarkBase):
     """Benchmark for measuring connection establishment time"""
 
@@ -153,6 +300,7 @@ class ConnectionBenchmark(BenchmarkBase):
         self.connection_factory = connection_factory
         self.num_connections = num_connections
         self.connections = []
+        self._closers = []  # Bound close() of each connection that has one
 
     def setup(self):
         """Setup benchmark"""
@@ -160,29 +308,94 @@ class ConnectionBenchmark(BenchmarkBase):
 
     def run(self):
         """Run connection benchmark"""
-        for _ in range(self.num_connections):
-            start = time.time()
+        # Integer nanosecond deltas; converted to seconds once, after the loop.
+        # The factory is bound before the loop so its lookup isn't timed.
+        perf_counter_ns = time.perf_counter_ns
+        connection_factory = self.connection_factory
+        durations_ns = []
+        record = durations_ns.append
+        keep = self.connections.append
+        keep_closer = self._closers.append
+        for _ in itertools.repeat(None, self.num_connections):
+            start = perf_counter_ns()
             try:
-                conn = self.connection_factory()
-                duration = time.time() - start
-                self.metrics.add_connection_time(duration)
-                self.connections.append(conn)
+                conn = connection_factory()
+                record(perf_counter_ns() - start)
+                keep(conn)
+                close = getattr(conn, 'close', None)
+                if close is not None:
+                    keep_closer(close)
             except Exception as e:
-                self.metrics.metadata['errors'] = self.metrics.metadata.get('errors', [])
-                self.metrics.metadata['errors'].append(str(e))
+                self.metrics.add_error(e)
+        self.metrics.add_connection_times_ns(durations_ns)
 
     def teardown(self):
         """Cleanup connections"""
-        for conn in self.connections:
+        for close in self._closers:
+            try:
+                close()
+            except:
+                pass
+        self._closers.clear()
+
+
+class _SingleConnectionBenchmark(BenchmarkBase):
+    """
+    Base for benchmarks that run over one client connection.
+
+    With connection_pool, the connection is checked out of the pool in
+    setup() and handed back in teardown() instead of being opened and
+    closed, so several benchmarks in a row can share one connection.
+    """
+
+    connection_pool = None
+    _close = None  # Bound close() of an unpooled connection, resolved once
+
+    def _connect(self):
+        if self.connection_pool is not None:
+            self.connection = self.connection_pool.acquire()
+        else:
+            self.connection = self.connection_factory()
+            self._close = getattr(self.connection, 'close', None)
+
+    def teardown(self):
+        """Cleanup connection"""
+        connection, self.connection = self.connection, None
+        close, self._close = self._close, None
+        if connection is None:
+            return
+        if self.connection_pool is not None:
+            self.connection_pool.release(connection)
+        elif close is not None:
             try:
-                if hasattr(conn, 'close'):
-                    conn.close()
+                close()
             except:
                 pass
 
 
-class LatencyBenchmark(BenchmarkBase):
-    """Benchmark for measuring request/response latency"""
+class LatencyBenchmark(_SingleConnectionBenchmark):
+    """
+    Benchmark for measuring request/response latency
+
+    As with ConcurrentBenchmark, pass either request_func(connection) or
+    request_func_factory(connection) -> callable; the factory is called once
+    after connecting and what it returns is invoked with no arguments for
+    every request, e.g. ``lambda conn: conn.root.ping``.
+
+    By default setup() sends warmup_requests untimed requests. With
+    warmup_cv, warmup instead runs in batches of warmup_requests until a
+    batch's latencies have a coefficient of variation (stdev / mean) below
+    warmup_cv, or warmup_requests * 10 requests have been sent. The number
+    of warmup requests sent is recorded in metadata['warmup_requests'].
+
+    With batch_size > 1, requests are timed in back-to-back batches with one
+    clock pair per batch, and each request in a batch is recorded at the
+    batch's mean latency. A batch with a failed request records no
+    latencies, so error handling never inflates them. That takes the timestamp cost out of
+    sub-microsecond requests, but per-request variation within a batch is
+    lost, so keep batch_size=1 (the default) when tail latencies matter.
+    The batch size is recorded in metadata['latency_batch_size'].
+    """
 
     def __init__(
         self,
@@ -190,53 +403,182 @@ class LatencyBenchmark(BenchmarkBase):
         protocol: str,
         server_mode: Optional[str],
         connection_factory: Callable[[], Any],
-        request_func: Callable[[Any], Any],
+        request_func: Optional[Callable[[Any], Any]] = None,
         num_requests: int = 1000,
         warmup_requests: int = 10,
+        request_func_factory: Optional[Callable[[Any], Callable[[], Any]]] = None,
+        connection_pool: Optional[Any] = None,  # Share a connection across benchmarks
+        warmup_cv: Optional[float] = None,  # Warm up until latencies are this stable
+        batch_size: int = 1,  # Requests per clock pair
     ):
+        if (request_func is None) == (request_func_factory is None):
+            raise ValueError("Pass exactly one of request_func or request_func_factory")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, not {batch_size}")
         super().__init__(name, protocol, server_mode)
         self.connection_factory = connection_factory
         self.request_func = request_func
+        self.request_func_factory = request_func_factory
         self.num_requests = num_requests
         self.warmup_requests = warmup_requests
+        self.warmup_cv = warmup_cv
+        self.batch_size = batch_size
+        self.connection_pool = connection_pool
         self.connection = None
+        self._request = None
 
     def setup(self):
         """Setup connection and warmup"""
-        self.connection = self.connection_factory()
+        self._connect()
+        if self.request_func_factory is None:
+            self._request = functools.partial(self.request_func, self.connection)
+        else:
+            self._request = self.request_func_factory(self.connection)
 
         # Warmup
+        if self.warmup_cv is None:
+            self._warmup_batch()
+            self.metrics.metadata['warmup_requests'] = self.warmup_requests
+        else:
+            self.metrics.metadata['warmup_requests'] = self._warmup_until_stable()
+
+    def _warmup_batch(self) -> List[int]:
+        """Send warmup_requests untimed requests; return successful latencies in ns"""
+        request = self._request
+        perf_counter_ns = time.perf_counter_ns
+        latencies_ns = []
         for _ in range(self.warmup_requests):
+            start = perf_counter_ns()
             try:
-                self.request_func(self.connection)
+                request()
+                latencies_ns.append(perf_counter_ns() - start)
             except:
                 pass
+        return latencies_ns
+
+    def _warmup_until_stable(self) -> int:
+        """Warm up in batches until one is stable; return the requests sent"""
+        sent = 0
+        while sent < self.warmup_requests * 10:
+            latencies_ns = np.asarray(self._warmup_batch(), dtype=np.float64)
+            sent += self.warmup_requests
+            if len(latencies_ns) > 1 and latencies_ns.std() < self.warmup_cv * latencies_ns.mean():
+                break
+        return sent
 
     def run(self):
         """Run latency benchmark"""
-        for _ in range(self.num_requests):
-            start = time.time()
+        if self.batch_size > 1:
+            self._run_batched()
+            return
+
+        request = self._request
+        perf_counter_ns = time.perf_counter_ns
+        # Integer nanosecond deltas; converted to seconds once, after the loop.
+        # Everything the loop touches is a local, and repeat() hands out the
+        # same None instead of a fresh int per iteration.
+        latencies_ns = []
+        record = latencies_ns.append
+        for _ in itertools.repeat(None, self.num_requests):
+            start = perf_counter_ns()
             try:
-                self.request_func(self.connection)
-                duration = time.time() - start
-                self.metrics.add_latency(duration)
-                self.metrics.total_requests += 1
+                request()
+                record(perf_counter_ns() - start)
             except Exception as e:
-                self.metrics.failed_requests += 1
-                self.metrics.metadata['errors'] = self.metrics.metadata.get('errors', [])
-                self.metrics.metadata['errors'].append(str(e))
+                self.metrics.add_error(e)
+        # Every request that didn't record a latency failed; no per-request counting
+        self.metrics.add_latencies_ns(latencies_ns)
+        self.metrics.total_requests += len(latencies_ns)
+        self.metrics.failed_requests += self.num_requests - len(latencies_ns)
 
-    def teardown(self):
-        """Cleanup connection"""
-        if self.connection and hasattr(self.connection, 'close'):
-            try:
-                self.connection.close()
-            except:
-                pass
+    def _run_batched(self):
+        """
+        Time batch_size requests per clock pair; record each at the batch mean.
 
+        A batch with any failure records no latencies: its elapsed time
+        includes the failures and their error handling, so its mean would
+        misstate the successful requests. Those still count as successful.
+        """
+        request = self._request
+        perf_counter_ns = time.perf_counter_ns
+        batch_size = self.batch_size
+        self.metrics.metadata['latency_batch_size'] = batch_size
+        latencies_ns = []
+        total_succeeded = 0
+        remaining = self.num_requests
+        while remaining > 0:
+            count = min(batch_size, remaining)
+            remaining -= count
+            succeeded = 0
+            start = perf_counter_ns()
+            for _ in itertools.repeat(None, count):
+                try:
+                    request()
+                    succeeded += 1
+                except Exception as e:
+                    self.metrics.add_error(e)
+            elapsed = perf_counter_ns() - start
+            total_succeeded += succeeded
+            if succeeded == count:
+                latencies_ns.extend(itertools.repeat(elapsed // count, count))
+        self.metrics.add_latencies_ns(latencies_ns)
+        self.metrics.total_requests += total_succeeded
+        self.metrics.failed_requests += self.num_requests - total_succeeded
+
+
+_SOCKET_TUNING_OPTIONS = {
+    'sndbuf': (socket.SOL_SOCKET, socket.SO_SNDBUF),
+    'rcvbuf': (socket.SOL_SOCKET, socket.SO_RCVBUF),
+    'nodelay': (socket.IPPROTO_TCP, socket.TCP_NODELAY),
+}
+
+
+def _connection_socket(connection: Any) -> Optional[socket.socket]:
+    """The TCP socket behind an RPyC connection, http.client connection or socket"""
+    if isinstance(connection, socket.socket):
+        return connection
+    channel = getattr(connection, '_channel', None)
+    if channel is not None:
+        return getattr(channel.stream, 'sock', None)
+    sock = getattr(connection, 'sock', None)
+    return sock if isinstance(sock, socket.socket) else None
+
+
+def apply_socket_tuning(connection: Any, socket_tuning: Dict[str, int]) -> Dict[str, int]:
+    """
+    Set socket options on connection's socket and return their effective values.
 
-class BandwidthBenchmark(BenchmarkBase):
-    """Benchmark for measuring data transfer bandwidth"""
+    socket_tuning maps 'sndbuf' / 'rcvbuf' (bytes) and 'nodelay' (bool) to
+    the values to set. The kernel may round or cap buffer sizes (Linux
+    doubles them and caps them at net.core.wmem_max / rmem_max), so the
+    values read back afterwards are returned.
+    """
+    sock = _connection_socket(connection)
+    if sock is None:
+        raise ValueError(f"Cannot find the socket of {type(connection).__name__} to tune")
+    effective = {}
+    for option, value in socket_tuning.items():
+        level, name = _SOCKET_TUNING_OPTIONS[option]
+        sock.setsockopt(level, name, int(value))
+        effective[option] = sock.getsockopt(level, name)
+    return effective
+
+
+class BandwidthBenchmark(_SingleConnectionBenchmark):
+    """
+    Benchmark for measuring data transfer bandwidth
+
+    With socket_tuning, e.g. {'sndbuf': 4 << 20, 'rcvbuf': 4 << 20}, the
+    connection's socket buffers are set in setup() so throughput is not
+    bounded by the kernel's default buffer sizes. The effective values are
+    recorded in metadata['socket_tuning'].
+
+    By default each size runs all its uploads, then all its downloads.
+    interleaved=True alternates timed upload/download pairs instead, so
+    neither direction sees a connection the other left warm or cold, and
+    warmup_iterations untimed pairs per size bring the connection (TCP
+    congestion window, server caches) to steady state before timing.
+    """
 
     def __init__(
         self,
@@ -248,56 +590,132 @@ class BandwidthBenchmark(BenchmarkBase):
         download_func: Callable[[Any, int], bytes],
         data_sizes: list = None,
         iterations: int = 10,
+        connection_pool: Optional[Any] = None,  # Share a connection across benchmarks
+        socket_tuning: Optional[Dict[str, int]] = None,  # sndbuf / rcvbuf / nodelay
+        interleaved: bool = False,  # Alternate upload/download pairs
+        warmup_iterations: int = 0,  # Untimed upload/download pairs per size
     ):
+        unknown = set(socket_tuning or ()) - set(_SOCKET_TUNING_OPTIONS)
+        if unknown:
+            raise ValueError(f"Unknown socket_tuning options: {sorted(unknown)}")
         super().__init__(name, protocol, server_mode)
         self.connection_factory = connection_factory
+        self.socket_tuning = socket_tuning
         self.upload_func = upload_func
         self.download_func = download_func
         self.data_sizes = data_sizes or [1024, 10240, 102400, 1048576]  # 1KB to 1MB
         self.iterations = iterations
+        self.interleaved = interleaved
+        self.warmup_iterations = warmup_iterations
+        self.connection_pool = connection_pool
         self.connection = None
+        self._payloads = {}
 
     def setup(self):
-        """Setup connection"""
-        self.connection = self.connection_factory()
+        """Setup connection and build the upload payloads"""
+        self._connect()
+        if self.socket_tuning:
+            self.metrics.metadata['socket_tuning'] = apply_socket_tuning(
+                self.connection, self.socket_tuning
+            )
+        # Allocated here rather than in run() so building them is not part of
+        # the measured run; smaller sizes are prefixes of the largest. They
+        # stay bytes (not memoryviews) because RPyC only passes bytes by value.
+        largest = b'x' * max(self.data_sizes)
+        self._payloads = {size: largest[:size] for size in self.data_sizes}
 
     def run(self):
         """Run bandwidth benchmark"""
         for size in self.data_sizes:
-            data = b'x' * size
+            data = self._payloads[size]
 
-            # Test upload bandwidth
-            for _ in range(self.iterations):
-                start = time.time()
+            for _ in range(self.warmup_iterations):
                 try:
                     self.upload_func(self.connection, data)
-                    duration = time.time() - start
-                    self.metrics.add_upload_bandwidth(size, duration)
+                    self.download_func(self.connection, size)
                 except Exception as e:
-                    self.metrics.metadata['errors'] = self.metrics.metadata.get('errors', [])
-                    self.metrics.metadata['errors'].append(f"Upload error: {str(e)}")
+                    self.metrics.add_error(e, "Warmup error")
+
+            if self.interleaved:
+                for _ in range(self.iterations):
+                    self._time_upload(data)
+                    self._time_download(size)
+            else:
+                for _ in range(self.iterations):
+                    self._time_upload(data)
+                for _ in range(self.iterations):
+                    self._time_download(size)
+
+    def _time_upload(self, data: bytes):
+        # Resolve everything before reading the clock, so no lookup is timed
+        upload_func = self.upload_func
+        connection = self.connection
+        perf_counter_ns = time.perf_counter_ns
+        start = perf_counter_ns()
+        try:
+            upload_func(connection, data)
+            duration = (perf_counter_ns() - start) * 1e-9
+            self.metrics.add_upload_bandwidth(len(data), duration)
+        except Exception as e:
+            self.metrics.add_error(e, "Upload error")
 
-            # Test download bandwidth
-            for _ in range(self.iterations):
-                start = time.time()
-                try:
-                    received = self.download_func(self.connection, size)
-                    duration = time.time() - start
-                    self.metrics.add_download_bandwidth(len(received) if received else size, duration)
-                except Exception as e:
-                    self.metrics.metadata['errors'] = self.metrics.metadata.get('errors', [])
-                    self.metrics.metadata['errors'].append(f"Download error: {str(e)}")
+    def _time_download(self, size: int):
+        download_func = self.download_func
+        connection = self.connection
+        perf_counter_ns = time.perf_counter_ns
+        start = perf_counter_ns()
+        try:
+            received = download_func(connection, size)
+            duration = (perf_counter_ns() - start) * 1e-9
+            self.metrics.add_download_bandwidth(len(received) if received else size, duration)
+        except Exception as e:
+            self.metrics.add_error(e, "Download error")
 
     def teardown(self):
-        """Cleanup connection"""
-        if self.connection and hasattr(self.connection, 'close'):
-            try:
-                self.connection.close()
-            except:
-                pass
+        """Cleanup connection and drop the upload payloads"""
+        self._payloads = {}
+        super().teardown()
+
+
+class ChunkedPayload:
+    """
+    Read-only sequence of fixed-size chunks over a single payload buffer.
+
+    Chunks are sliced on demand through a memoryview, so chunked uploads do
+    not hold a second full-size copy of the file alongside the original.
+    Each chunk is handed out as bytes, since RPyC only passes bytes by value.
+    """
+
+    def __init__(self, data: bytes, chunk_size: int):
+        self._view = memoryview(data)
+        self.chunk_size = chunk_size
+
+    def __len__(self) -> int:
+        return -(-len(self._view) // self.chunk_size)
+
+    def __getitem__(self, index: int) -> bytes:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("chunk index out of range")
+        offset = index * self.chunk_size
+        return self._view[offset:offset + self.chunk_size].tobytes()
 
+    def __iter__(self):
+        view = self._view
+        chunk_size = self.chunk_size
+        for offset in range(0, len(view), chunk_size):
+            yield view[offset:offset + chunk_size].tobytes()
 
-class BinaryTransferBenchmark(BenchmarkBase):
+    def tobytes(self) -> bytes:
+        """The whole payload as one bytes object (no copy if built from bytes)"""
+        data = self._view.obj
+        if type(data) is bytes and len(data) == len(self._view):
+            return data
+        return self._view.tobytes()
+
+
+class BinaryTransferBenchmark(_SingleConnectionBenchmark):
     """
     Benchmark for measuring large binary file transfers.
 
@@ -321,6 +739,7 @@ class BinaryTransferBenchmark(BenchmarkBase):
         test_upload: bool = True,
         test_download: bool = True,
         test_chunked: bool = True,
+        connection_pool: Optional[Any] = None,  # Share a connection across benchmarks
     ):
         super().__init__(name, protocol, server_mode)
         self.connection_factory = connection_factory
@@ -341,6 +760,7 @@ class BinaryTransferBenchmark(BenchmarkBase):
         self.test_upload = test_upload
         self.test_download = test_download
         self.test_chunked = test_chunked
+        self.connection_pool = connection_pool
         self.connection = None
 
         self.metrics.metadata['file_sizes'] = self.file_sizes
@@ -349,24 +769,36 @@ class BinaryTransferBenchmark(BenchmarkBase):
 
     def setup(self):
         """Setup connection"""
-        self.connection = self.connection_factory()
+        self._connect()
 
     def _generate_file(self, size: int) -> bytes:
-        """Generate binary file data of specified size"""
-        return b'\x00' * size
-
-    def _chunk_data(self, data: bytes, chunk_size: int) -> List[bytes]:
-        """Split data into chunks"""
-        chunks = []
-        offset = 0
-        while offset < len(data):
-            chunks.append(data[offset:offset + chunk_size])
-            offset += chunk_size
-        return chunks
+        """
+        Generate binary file data of specified size.
+
+        bytes(size) is calloc-backed, so large payloads get lazily-zeroed
+        pages instead of an eager memset of the whole buffer.
+        """
+        return bytes(size)
+
+    def _chunk_data(self, data: bytes, chunk_size: int) -> 'ChunkedPayload':
+        """Split data into chunks (lazily, without copying the whole file)"""
+        return ChunkedPayload(data, chunk_size)
 
     def run(self):
-        """Run binary transfer benchmark"""
-        chunk_kb = self.chunk_size / 1024
+        """
+        Run binary transfer benchmark.
+
+        Downloaded data is dropped as soon as its size is known, so a
+        download never runs while the previous one is still held; peak
+        memory is one file rather than two.
+        """
+        chunk_size = self.chunk_size
+        chunk_kb = chunk_size / 1024
+        # Bound once, so no attribute lookup falls inside a timed transfer
+        connection = self.connection
+        perf_counter_ns = time.perf_counter_ns
+        upload_func, download_func = self.upload_func, self.download_func
+        upload_chunked_func, download_chunked_func = self.upload_chunked_func, self.download_chunked_func
 
         for file_size in self.file_sizes:
             file_data = self._generate_file(file_size)
@@ -376,10 +808,10 @@ class BinaryTransferBenchmark(BenchmarkBase):
             if self.test_upload:
                 print(f"  Testing upload: {size_mb:.1f} MB...")
                 for i in range(self.iterations):
-                    start = time.time()
+                    start = perf_counter_ns()
                     try:
-                        self.upload_func(self.connection, file_data)
-                        duration = time.time() - start
+                        upload_func(connection, file_data)
+                        duration = (perf_counter_ns() - start) * 1e-9
                         self.metrics.add_upload_bandwidth(file_size, duration)
 
                         result = {
@@ -393,20 +825,18 @@ class BinaryTransferBenchmark(BenchmarkBase):
                         }
                         self.metrics.metadata['transfer_results'].append(result)
                     except Exception as e:
-                        self.metrics.metadata['errors'] = self.metrics.metadata.get('errors', [])
-                        self.metrics.metadata['errors'].append(
-                            f"Upload error ({size_mb:.1f}MB): {str(e)}"
-                        )
+                        self.metrics.add_error(e, f"Upload error ({size_mb:.1f}MB)")
 
             # Test non-chunked download
             if self.test_download:
                 print(f"  Testing download: {size_mb:.1f} MB...")
                 for i in range(self.iterations):
-                    start = time.time()
+                    start = perf_counter_ns()
                     try:
-                        received = self.download_func(self.connection, file_size)
-                        duration = time.time() - start
+                        received = download_func(connection, file_size)
+                        duration = (perf_counter_ns() - start) * 1e-9
                         actual_size = len(received) if received else file_size
+                        received = None
                         self.metrics.add_download_bandwidth(actual_size, duration)
 
                         result = {
@@ -420,23 +850,20 @@ class BinaryTransferBenchmark(BenchmarkBase):
                         }
                         self.metrics.metadata['transfer_results'].append(result)
                     except Exception as e:
-                        self.metrics.metadata['errors'] = self.metrics.metadata.get('errors', [])
-                        self.metrics.metadata['errors'].append(
-                            f"Download error ({size_mb:.1f}MB): {str(e)}"
-                        )
+                        self.metrics.add_error(e, f"Download error ({size_mb:.1f}MB)")
 
             # Test chunked transfers with single chunk size
-            if self.test_chunked and self.upload_chunked_func and self.download_chunked_func:
+            if self.test_chunked and upload_chunked_func and download_chunked_func:
                 # Chunked upload
                 if self.test_upload:
                     print(f"  Testing chunked upload: {size_mb:.1f} MB, chunk={chunk_kb:.0f} KB...")
                     chunks = self._chunk_data(file_data, self.chunk_size)
 
                     for i in range(self.iterations):
-                        start = time.time()
+                        start = perf_counter_ns()
                         try:
-                            self.upload_chunked_func(self.connection, chunks)
-                            duration = time.time() - start
+                            upload_chunked_func(connection, chunks)
+                            duration = (perf_counter_ns() - start) * 1e-9
                             self.metrics.add_upload_bandwidth(file_size, duration)
 
                             result = {
@@ -452,22 +879,20 @@ class BinaryTransferBenchmark(BenchmarkBase):
                             }
                             self.metrics.metadata['transfer_results'].append(result)
                         except Exception as e:
-                            self.metrics.metadata['errors'] = self.metrics.metadata.get('errors', [])
-                            self.metrics.metadata['errors'].append(
-                                f"Chunked upload error ({size_mb:.1f}MB, {chunk_kb:.0f}KB): {str(e)}"
-                            )
+                            self.metrics.add_error(e, f"Chunked upload error ({size_mb:.1f}MB, {chunk_kb:.0f}KB)")
+                    chunks = None
 
                 # Chunked download
                 if self.test_download:
                     print(f"  Testing chunked download: {size_mb:.1f} MB, chunk={chunk_kb:.0f} KB...")
                     for i in range(self.iterations):
-                        start = time.time()
+                        start = perf_counter_ns()
                         try:
-                            chunks = self.download_chunked_func(
-                                self.connection, file_size, self.chunk_size
-                            )
-                            duration = time.time() - start
+                            chunks = download_chunked_func(connection, file_size, chunk_size)
+                            duration = (perf_counter_ns() - start) * 1e-9
                             actual_size = sum(len(chunk) for chunk in chunks) if chunks else file_size
+                            num_chunks = len(chunks) if chunks else 0
+                            chunks = None
                             self.metrics.add_download_bandwidth(actual_size, duration)
 
                             result = {
@@ -476,25 +901,87 @@ class BinaryTransferBenchmark(BenchmarkBase):
                                 'file_size_mb': size_mb,
                                 'chunk_size': self.chunk_size,
                                 'chunk_size_kb': chunk_kb,
-                                'num_chunks': len(chunks) if chunks else 0,
+                                'num_chunks': num_chunks,
                                 'duration': duration,
                                 'throughput_mbps': (actual_size / duration) / (1024 * 1024) * 8,
                                 'iteration': i + 1,
                             }
                             self.metrics.metadata['transfer_results'].append(result)
                         except Exception as e:
-                            self.metrics.metadata['errors'] = self.metrics.metadata.get('errors', [])
-                            self.metrics.metadata['errors'].append(
-                                f"Chunked download error ({size_mb:.1f}MB, {chunk_kb:.0f}KB): {str(e)}"
-                            )
+                            self.metrics.add_error(e, f"Chunked download error ({size_mb:.1f}MB, {chunk_kb:.0f}KB)")
 
-    def teardown(self):
-        """Cleanup connection"""
-        if self.connection and hasattr(self.connection, 'close'):
-            try:
-                self.connection.close()
-            except:
-                pass
+            # Release this size's payload before the next one is allocated
+            file_data = None
+
+
+class _AsyncStartBarrier:
+    """Minimal asyncio barrier (asyncio.Barrier needs Python 3.11)"""
+
+    def __init__(self, parties: int):
+        self._remaining = parties
+        self._released = asyncio.Event()
+
+    async def wait(self):
+        self._remaining -= 1
+        if self._remaining <= 0:
+            self._released.set()
+        else:
+            await self._released.wait()
+
+
+class _ClientResult:
+    """
+    What one concurrent client reports back.
+
+    A __slots__ record rather than a dict, so clients fill in attributes
+    instead of hashing string keys; it is only turned into the documented
+    per-connection dict (to_dict()) when track_per_connection is on.
+
+    start_ns/end_ns are time.perf_counter_ns() readings. That clock is
+    monotonic and shared by every thread (and, on Linux, every process), so
+    unlike the wall-clock start_time they can be compared across clients.
+    """
+
+    __slots__ = (
+        'client_id', 'start_time', 'start_ns', 'end_ns', 'connection_time',
+        'total_duration', 'total_requests', 'failed_requests', 'latencies',
+        'errors', 'connection_error',
+    )
+
+    def __init__(self, client_id: int, start_time: float, start_ns: int):
+        self.client_id = client_id
+        self.start_time = start_time
+        self.start_ns = start_ns
+        self.end_ns = start_ns
+        self.connection_time = None  # Stays None if the client never connected
+        self.total_duration = 0.0
+        self.total_requests = 0
+        self.failed_requests = 0
+        self.latencies = None
+        self.errors = None
+        self.connection_error = None
+
+    def to_dict(self, include_latencies: bool = True) -> Dict[str, Any]:
+        """Per-connection metrics dict, as returned by get_per_connection_metrics()"""
+        client_metrics = {
+            'client_id': self.client_id,
+            'total_requests': self.total_requests,
+            'failed_requests': self.failed_requests,
+            'start_time': self.start_time,
+            'end_time': self.start_time + self.total_duration,
+            'total_duration': self.total_duration,
+            'start_ns': self.start_ns,
+            'end_ns': self.end_ns,
+        }
+        if self.connection_time is not None:
+            client_metrics['connection_time'] = self.connection_time
+        if self.errors is not None:
+            client_metrics['errors'] = self.errors
+        if self.connection_error is not None:
+            client_metrics['connection_error'] = self.connection_error
+        if include_latencies:
+            client_metrics['latencies'] = self.latencies
+        return client_metrics
 
 
 class ConcurrentBenchmark(BenchmarkBase):
@@ -504,84 +991,238 @@ class ConcurrentBenchmark(BenchmarkBase):
     Supports high concurrency (e.g., 128+ connections) with per-connection
     metrics tracking. Each client connection runs in its own thread within
     the client process.
+
+    Pass either request_func(connection), called for every request, or
+    request_func_factory(connection) -> callable, called once per client
+    after connecting; the callable it returns is then invoked with no
+    arguments for every request. A factory such as
+    ``lambda conn: conn.root.ping`` resolves the remote method once instead
+    of on every request (each netref attribute lookup is a round trip).
+
+    executor, if given, runs the clients instead of a thread pool created
+    (and joined) for this run; it is left open, and max_workers is ignored.
+    See create_client_executor().
+
+    pool_type='process' runs the clients in a ProcessPoolExecutor of
+    max_workers processes instead of threads. Use it when request_func
+    spends real CPU time in Python (serialization, parsing; roughly >50µs
+    per request): threads would serialize on the GIL and measure contention
+    rather than the protocol. It costs a process per worker; latencies come
+    back through one shared-memory array, so only each client's summary is
+    pickled. connection_factory and request_func (or request_func_factory)
+    are sent to the workers, so they must be picklable: module-level
+    functions or classes, not lambdas or closures. That is checked here,
+    with a ValueError, rather than failing inside a worker at run time.
+    progress_callback runs in the calling process and is not sent.
+    connection_pool can't be shared across processes.
+
+    synchronized_start=True holds every client at a barrier once it has
+    connected, and releases them together into the request loop, so the
+    measured window has all num_clients clients active instead of a
+    staggered ramp-up. Every client then needs its own thread at once:
+    max_workers must cover num_clients (it defaults to num_clients), and it
+    can't be combined with executor or pool_type='process'.
+
+    Progress is printed at most every PROGRESS_INTERVAL seconds while
+    results come in. progress_callback(completed, num_clients), if given, is
+    called for every finished client instead, and nothing is printed for
+    progress.
+
+    With track_per_connection, each client's dict carries a fixed-bucket
+    'latency_histogram' (a HistogramRecorder). per_connection_samples=False
+    drops the client's raw 'latencies' once they have been folded into the
+    aggregate metrics, so per-connection memory stays O(num_clients).
     """
 
+    PROGRESS_INTERVAL = 0.5  # Seconds between progress lines
+
+    # perf_counter_ns() span covered by the clients, set as results come in
+    _first_start_ns = None
+    _last_end_ns = None
+
+    # Barrier the clients wait at before their request loops, while a
+    # synchronized_start run is in progress
+    _start_barrier = None
+
     def __init__(
         self,
         name: str,
         protocol: str,
         server_mode: Optional[str],
         connection_factory: Callable[[], Any],
-        request_func: Callable[[Any], Any],
+        request_func: Optional[Callable[[Any], Any]] = None,
         num_clients: int = 128,  # Default to 128 for high concurrency
         requests_per_client: int = 100,
         max_workers: Optional[int] = None,
         track_per_connection: bool = False,  # Track individual connection metrics
+        connection_pool: Optional[Any] = None,  # Reuse connections across runs
+        request_func_factory: Optional[Callable[[Any], Callable[[], Any]]] = None,
+        per_connection_samples: bool = True,  # Keep raw latencies per connection
+        executor: Optional[concurrent.futures.Executor] = None,  # Shared client threads
+        pool_type: str = 'thread',  # 'thread' or 'process'
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        synchronized_start: bool = False,  # Release all clients together
     ):
+        if (request_func is None) == (request_func_factory is None):
+            raise ValueError("Pass exactly one of request_func or request_func_factory")
+        if pool_type not in ('thread', 'process'):
+            raise ValueError(f"pool_type must be 'thread' or 'process', not {pool_type!r}")
+        if pool_type == 'process' and connection_pool is not None:
+            raise ValueError("connection_pool can't be shared with pool_type='process'")
+        if pool_type == 'process' and executor is None:
+            self._check_picklable(
+                connection_factory=connection_factory,
+                request_func=request_func,
+                request_func_factory=request_func_factory,
+            )
+        if synchronized_start:
+            if pool_type == 'process' or executor is not None:
+                raise ValueError("synchronized_start needs clients on threads of its own pool")
+            if max_workers is not None and max_workers < num_clients:
+                raise ValueError("synchronized_start needs max_workers >= num_clients")
+            max_workers = num_clients
         super().__init__(name, protocol, server_mode)
         self.connection_factory = connection_factory
+        self.connection_pool = connection_pool
         self.request_func = request_func
+        self.request_func_factory = request_func_factory
         self.num_clients = num_clients
         self.requests_per_client = requests_per_client
-        self.max_workers = max_workers or min(num_clients, 128)  # Cap thread pool
+        self.max_workers = max_workers or self._default_max_workers(num_clients)
         self.track_per_connection = track_per_connection
+        self.per_connection_samples = per_connection_samples
+        self.executor = executor
+        self.pool_type = pool_type
+        self.progress_callback = progress_callback
+        self.synchronized_start = synchronized_start
+        self._last_progress = 0.0
         self.metrics.concurrent_connections = num_clients
 
         # Per-connection tracking
+        self._record_request_error = (
+            self._keep_request_error if track_per_connection else self._drop_request_error
+        )
         self.per_connection_metrics = [] if track_per_connection else None
+        self.per_connection_arrays = (
+            PerConnectionMetrics.allocate(num_clients) if track_per_connection else None
+        )
+
+    @staticmethod
+    def _default_max_workers(num_clients: int) -> int:
+        """Cap the thread pool at 128 threads"""
+        return min(num_clients, 128)
+
+    @staticmethod
+    def _check_picklable(**callables):
+        """Raise ValueError naming any callable that can't be sent to a worker process"""
+        for name, func in callables.items():
+            if func is None:
+                continue
+            try:
+                pickle.dumps(func)
+            except Exception as e:
+                raise ValueError(
+                    f"pool_type='process' sends {name} to worker processes, so it must be "
+                    f"picklable (a module-level function, not a lambda or closure): {e}"
+                ) from e
 
     def setup(self):
-        """Setup benchmark"""
-        pass
+        """Size the latency buffer for every request up front"""
+        self.metrics.latencies.reserve(self.num_clients * self.requests_per_client)
+        self._first_start_ns = None
+        self._last_end_ns = None
 
-    def _client_worker(self, client_id: int) -> Dict[str, Any]:
+    def _client_worker(self, client_id: int) -> '_ClientResult':
         """
         Worker function for each concurrent client.
 
-        Each worker establishes its own connection and tracks its metrics.
+        Each worker establishes its own connection (or checks one out of
+        connection_pool, if given) and tracks its metrics.
         Runs in a separate thread within the client process.
         """
-        client_metrics = {
-            'client_id': client_id,
-            'latencies': [],
-            'total_requests': 0,
-            'failed_requests': 0,
-            'start_time': time.time(),
-        }
+        perf_counter_ns = time.perf_counter_ns
+        latencies_ns = []
+        # One monotonic epoch for the client: the connection is timed from it
+        # and end_time is derived from it instead of reading the wall clock again
+        client_start = perf_counter_ns()
+        result = _ClientResult(client_id, time.time(), client_start)
+        start_barrier = self._start_barrier
 
         try:
             # Establish connection
-            conn_start = time.time()
-            connection = self.connection_factory()
-            conn_duration = time.time() - conn_start
-            client_metrics['connection_time'] = conn_duration
-
-            # Make requests
+            if self.connection_pool is not None:
+                connection = self.connection_pool.acquire()
+            else:
+                connection = self.connection_factory()
+            result.connection_time = (perf_counter_ns() - client_start) * 1e-9
+            request = self._bind_request(connection)
+
+            if start_barrier is not None:
+                start_barrier, barrier = None, start_barrier
+                barrier.wait()
+
+            # Make requests. Failures are counted once, after the loop, as the
+            # requests that didn't record a latency.
+            record = latencies_ns.append
             for req_num in range(self.requests_per_client):
-                start = time.time()
+                start = perf_counter_ns()
                 try:
-                    self.request_func(connection)
-                    duration = time.time() - start
-                    client_metrics['latencies'].append(duration)
-                    client_metrics['total_requests'] += 1
+                    request()
+                    record(perf_counter_ns() - start)
                 except Exception as e:
-                    client_metrics['failed_requests'] += 1
-                    if self.track_per_connection:
-                        if 'errors' not in client_metrics:
-                            client_metrics['errors'] = []
-                        client_metrics['errors'].append(f"Request {req_num}: {str(e)}")
+                    self._record_request_error(result, req_num, e)
+            result.failed_requests = self.requests_per_client - len(latencies_ns)
 
             # Cleanup
-            if hasattr(connection, 'close'):
-                connection.close()
+            self._return_connection(connection)
 
         except Exception as e:
-            client_metrics['connection_error'] = str(e)
+            result.connection_error = str(e)
 
-        client_metrics['end_time'] = time.time()
-        client_metrics['total_duration'] = client_metrics['end_time'] - client_metrics['start_time']
+        # A client that failed to connect still arrives, so the rest start
+        if start_barrier is not None:
+            start_barrier.wait()
 
-        return client_metrics
+        result.end_ns = perf_counter_ns()
+        result.total_duration = (result.end_ns - client_start) * 1e-9
+        result.total_requests = len(latencies_ns)
+        result.latencies = _ns_to_seconds(latencies_ns)
+
+        return result
+
+    @staticmethod
+    def _keep_request_error(result: '_ClientResult', req_num: int, error: Exception):
+        if result.errors is None:
+            result.errors = []
+        result.errors.append(f"Request {req_num}: {str(error)}")
+
+    @staticmethod
+    def _drop_request_error(result: '_ClientResult', req_num: int, error: Exception):
+        pass
+
+    def _bind_request(self, connection: Any) -> Callable[[], Any]:
+        """
+        Build the zero-argument callable a client invokes per request.
+
+        If request_func_factory raises, the connection is handed back before
+        the error propagates.
+        """
+        if self.request_func_factory is None:
+            return functools.partial(self.request_func, connection)
+        try:
+            return self.request_func_factory(connection)
+        except Exception:
+            self._return_connection(connection)
+            raise
+
+    def _return_connection(self, connection: Any):
+        """Release a client's connection to the pool, or close it"""
+        if self.connection_pool is not None:
+            self.connection_pool.release(connection)
+            return
+        close = getattr(connection, 'close', None)
+        if close is not None:
+            close()
 
     def run(self):
         """
@@ -593,43 +1234,157 @@ class ConcurrentBenchmark(BenchmarkBase):
         """
         print(f"  Starting {self.num_clients} concurrent clients...")
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = [
-                executor.submit(self._client_worker, i)
-                for i in range(self.num_clients)
-            ]
+        if self.executor is not None:
+            self._run_clients_on(self.executor)
+        elif self.pool_type == 'process':
+            # Latencies come back through one shared-memory array, not pickled per client
+            shared_latencies = multiprocessing.RawArray('d', self.num_clients * self.requests_per_client)
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_process_client,
+                initargs=(self._process_client_state(), shared_latencies),
+            ) as executor:
+                self._run_process_clients_on(executor, shared_latencies)
+        else:
+            if self.synchronized_start:
+                self._start_barrier = threading.Barrier(self.num_clients)
+            try:
+                with create_client_executor(self.max_workers) as executor:
+                    self._run_clients_on(executor)
+            finally:
+                self._start_barrier = None
 
-            completed = 0
-            for future in concurrent.futures.as_completed(futures):
-                try:
-                    result = future.result()
+        self._finish_run()
 
-                    # Store per-connection metrics if tracking
-                    if self.track_per_connection:
-                        self.per_connection_metrics.append(result)
+    def _run_clients_on(self, executor: concurrent.futures.Executor):
+        """
+        Submit every client to executor and fold in results as they finish.
 
-                    # Aggregate metrics
-                    if 'connection_time' in result:
-                        self.metrics.add_connection_time(result['connection_time'])
+        Each client hands its result (or the exception it raised) to a
+        SimpleQueue that this thread drains, instead of waking an
+        as_completed() waiter through every future's condition variable.
+        """
+        results = queue.SimpleQueue()
 
-                    for latency in result.get('latencies', []):
-                        self.metrics.add_latency(latency)
+        def _client(client_id):
+            try:
+                results.put(self._client_worker(client_id))
+            except BaseException as e:
+                results.put(e)
 
-                    self.metrics.total_requests += result['total_requests']
-                    self.metrics.failed_requests += result['failed_requests']
+        for i in range(self.num_clients):
+            executor.submit(_client, i)
 
-                    completed += 1
-                    if completed % 10 == 0:
-                        print(f"    {completed}/{self.num_clients} clients completed...")
+        self._drain_results(results)
 
-                except Exception as e:
-                    self.metrics.failed_requests += self.requests_per_client
-                    self.metrics.metadata['errors'] = self.metrics.metadata.get('errors', [])
-                    self.metrics.metadata['errors'].append(str(e))
-                    completed += 1
+    def _run_process_clients_on(self, executor: concurrent.futures.ProcessPoolExecutor, shared_latencies):
+        """
+        Like _run_clients_on, for clients running in worker processes.
 
+        Each result's latencies are picked up from its client's slots in
+        shared_latencies (see _run_process_client).
+        """
+        results = queue.SimpleQueue()
+        latencies = np.frombuffer(shared_latencies, dtype=np.float64)
+        requests_per_client = self.requests_per_client
+
+        def _done(future):
+            try:
+                result = future.result()
+                offset = result.client_id * requests_per_client
+                result.latencies = latencies[offset:offset + result.total_requests]
+                results.put(result)
+            except BaseException as e:
+                results.put(e)
+
+        for i in range(self.num_clients):
+            executor.submit(_run_process_client, i).add_done_callback(_done)
+
+        self._drain_results(results)
+
+    def _process_client_state(self) -> 'ConcurrentBenchmark':
+        """
+        Copy of this benchmark holding only what _client_worker needs.
+
+        Sent to each worker process once, so the parent's metrics and
+        per-connection results are not pickled along with it.
+        """
+        state = copy.copy(self)
+        state.metrics = None
+        state.progress_callback = None  # Called in this process only
+        state.per_connection_metrics = None
+        state.per_connection_arrays = None
+        return state
+
+    def _drain_results(self, results: queue.SimpleQueue):
+        """Fold in num_clients results (or client exceptions) from results"""
+        report = self.progress_callback or self._print_progress
+        self._last_progress = time.monotonic()
+        for completed in range(1, self.num_clients + 1):
+            result = results.get()
+            try:
+                if isinstance(result, BaseException):
+                    raise result
+                self._record_client_result(result)
+            except Exception as e:
+                self._record_client_error(e)
+
+            report(completed, self.num_clients)
+
+    def _print_progress(self, completed: int, total: int):
+        """Print progress at most once per PROGRESS_INTERVAL seconds"""
+        now = time.monotonic()
+        if now - self._last_progress >= self.PROGRESS_INTERVAL:
+            self._last_progress = now
+            print(f"    {completed}/{total} clients completed...")
+
+    def _record_client_result(self, result: '_ClientResult'):
+        """Fold one client's metrics into the aggregate metrics"""
+        # Aggregate metrics
+        if result.connection_time is not None:
+            self.metrics.add_connection_time(result.connection_time)
+        self.metrics.latencies.extend(result.latencies)
+        self.metrics.total_requests += result.total_requests
+        self.metrics.failed_requests += result.failed_requests
+        if self._first_start_ns is None or result.start_ns < self._first_start_ns:
+            self._first_start_ns = result.start_ns
+        if self._last_end_ns is None or result.end_ns > self._last_end_ns:
+            self._last_end_ns = result.end_ns
+
+        # Store per-connection metrics if tracking
+        if self.track_per_connection:
+            client_metrics = result.to_dict(self.per_connection_samples)
+            histogram = HistogramRecorder()
+            histogram.record_many(result.latencies)
+            client_metrics['latency_histogram'] = histogram
+            self.per_connection_metrics.append(client_metrics)
+            self.per_connection_arrays.record(
+                result.client_id,
+                result.connection_time,
+                result.total_duration,
+                result.total_requests,
+                result.failed_requests,
+            )
+
+    def _record_client_error(self, error: BaseException):
+        """Record a client that failed outright"""
+        self.metrics.failed_requests += self.requests_per_client
+        self.metrics.add_error(error)
+
+    def _finish_run(self):
+        """Report completion and store the per-connection summary"""
         print(f"  All {self.num_clients} clients completed")
 
+        # Aggregate throughput over the span from the first client starting to
+        # the last one finishing, on the monotonic clock the clients share
+        if self._first_start_ns is not None:
+            span_ns = self._last_end_ns - self._first_start_ns
+            self.metrics.metadata['clients_span'] = span_ns * 1e-9
+            if span_ns > 0:
+                self.metrics.metadata['throughput_rps'] = (
+                    self.metrics.total_requests * 1_000_000_000 / span_ns
+                )
+
         # Store per-connection summary if tracking
         if self.track_per_connection:
             self.metrics.metadata['per_connection_count'] = len(self.per_connection_metrics)
@@ -644,3 +1399,227 @@ class ConcurrentBenchmark(BenchmarkBase):
         if not self.track_per_connection:
             return []
         return sorted(self.per_connection_metrics, key=lambda x: x['client_id'])
+
+    def get_latency_histogram(self) -> Optional[HistogramRecorder]:
+        """
+        Merge every client's latency histogram into one.
+
+        Returns None if tracking is disabled.
+        """
+        if not self.track_per_connection:
+            return None
+        merged = HistogramRecorder()
+        for result in self.per_connection_metrics:
+            merged.merge(result['latency_histogram'])
+        return merged
+
+    def get_per_connection_arrays(self) -> Optional[PerConnectionMetrics]:
+        """
+        Get per-connection metrics as NumPy columns (one row per client).
+
+        Returns None if tracking is disabled.
+        """
+        return self.per_connection_arrays
+
+
+# The benchmark a client worker process runs, set once per process by the
+# ProcessPoolExecutor initializer
+_process_benchmark = None
+_process_latencies = None
+
+
+def _init_process_client(benchmark: ConcurrentBenchmark, shared_latencies):
+    global _process_benchmark, _process_latencies
+    _process_benchmark = benchmark
+    _process_latencies = np.frombuffer(shared_latencies, dtype=np.float64)
+
+
+def _run_process_client(client_id: int) -> _ClientResult:
+    """
+    Run one client and leave its latencies in the shared array.
+
+    Client client_id owns the requests_per_client slots starting at
+    client_id * requests_per_client; its total_requests successful samples
+    are written there, and the result travels back without them.
+    """
+    result = _process_benchmark._client_worker(client_id)
+    offset = client_id * _process_benchmark.requests_per_client
+    _process_latencies[offset:offset + result.total_requests] = result.latencies
+    result.latencies = None
+    return result
+
+
+def _rpyc_result_future(loop: asyncio.AbstractEventLoop, async_result) -> asyncio.Future:
+    """Wrap an rpyc AsyncResult in an asyncio future resolved by its callback"""
+    future = loop.create_future()
+
+    def _resolve(res):
+        if future.done():
+            return
+        try:
+            future.set_result(res.value)
+        except Exception as e:
+            future.set_exception(e)
+
+    async_result.add_callback(_resolve)
+    return future
+
+
+class AsyncConcurrentBenchmark(ConcurrentBenchmark):
+    """
+    Concurrent benchmark driven by asyncio coroutines instead of threads.
+
+    All clients share a single event loop thread, so 128+ clients don't pay
+    for 128+ OS threads and their context switches. request_func may be:
+
+    - a coroutine function, e.g. ``async def request(conn): ...``
+    - a function returning an rpyc AsyncResult, e.g.
+      ``lambda conn: rpyc.async_(conn.root.ping)()``
+
+    The same applies to what request_func_factory returns, e.g.
+    ``lambda conn: rpyc.async_(conn.root.ping)``. connection_factory may
+    also return an awaitable, such as open_async_http_connection().
+
+    RPyC connections are served from the loop: their sockets are registered
+    with loop.add_reader(), and replies resolve the awaiting coroutine via
+    AsyncResult callbacks. Plain blocking request functions still work but
+    serialize all clients on the loop thread.
+
+    When uvloop is installed (pip install rpycbench[fast]) the loop is a
+    uvloop loop unless use_uvloop=False; the loop used is recorded in
+    metadata['event_loop'].
+
+    Coroutines cost no OS thread, so unless max_workers is given every
+    client runs at once, however large num_clients is. pool_type and
+    executor belong to the threaded run; anything but the defaults raises
+    ValueError.
+    """
+
+    def __init__(self, *args, use_uvloop: bool = True, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.pool_type != 'thread':
+            raise ValueError("AsyncConcurrentBenchmark runs clients on one event loop; pool_type must be 'thread'")
+        if self.executor is not None:
+            raise ValueError("AsyncConcurrentBenchmark runs clients on one event loop and takes no executor")
+        self.use_uvloop = use_uvloop and uvloop is not None
+
+    @staticmethod
+    def _default_max_workers(num_clients: int) -> int:
+        """Run every client at once"""
+        return num_clients
+
+    def run(self):
+        """Run all clients as coroutines on one event loop"""
+        event_loop = 'uvloop' if self.use_uvloop else 'asyncio'
+        print(f"  Starting {self.num_clients} concurrent clients ({event_loop})...")
+        self.metrics.metadata['event_loop'] = event_loop
+
+        if self.use_uvloop:
+            loop = uvloop.new_event_loop()
+            try:
+                results = loop.run_until_complete(self._run_clients())
+            finally:
+                loop.close()
+        else:
+            results = asyncio.run(self._run_clients())
+        for result in results:
+            if isinstance(result, BaseException):
+                self._record_client_error(result)
+            else:
+                self._record_client_result(result)
+
+        self._finish_run()
+
+    async def _run_clients(self) -> List[Any]:
+        if self.max_workers >= self.num_clients:
+            if self.synchronized_start:
+                self._start_barrier = _AsyncStartBarrier(self.num_clients)
+            try:
+                return await asyncio.gather(
+                    *(self._client_coroutine(i) for i in range(self.num_clients)),
+                    return_exceptions=True,
+                )
+            finally:
+                self._start_barrier = None
+
+        limit = asyncio.Semaphore(self.max_workers)
+
+        async def _bounded(client_id):
+            async with limit:
+                return await self._client_coroutine(client_id)
+
+        return await asyncio.gather(
+            *(_bounded(i) for i in range(self.num_clients)),
+            return_exceptions=True,
+        )
+
+    async def _request(self, loop: asyncio.AbstractEventLoop, request: Callable[[], Any]) -> Any:
+        result = request()
+        if inspect.isawaitable(result):
+            return await result
+        if hasattr(result, 'add_callback'):
+            return await _rpyc_result_future(loop, result)
+        return result
+
+    async def _client_coroutine(self, client_id: int) -> '_ClientResult':
+        """Coroutine counterpart of _client_worker"""
+        loop = asyncio.get_running_loop()
+        perf_counter_ns = time.perf_counter_ns
+        latencies_ns = []
+        # One monotonic epoch for the client: the connection is timed from it
+        # and end_time is derived from it instead of reading the wall clock again
+        client_start = perf_counter_ns()
+        result = _ClientResult(client_id, time.time(), client_start)
+        start_barrier = self._start_barrier
+
+        try:
+            # Establish connection
+            if self.connection_pool is not None:
+                connection = self.connection_pool.acquire()
+            else:
+                connection = self.connection_factory()
+                if inspect.isawaitable(connection):
+                    connection = await connection
+            result.connection_time = (perf_counter_ns() - client_start) * 1e-9
+            request = self._bind_request(connection)
+
+            if start_barrier is not None:
+                start_barrier, barrier = None, start_barrier
+                await barrier.wait()
+
+            # Serve RPyC replies from the event loop
+            fd = None
+            if hasattr(connection, 'poll_all') and hasattr(connection, 'fileno'):
+                fd = connection.fileno()
+                loop.add_reader(fd, connection.poll_all, 0)
+
+            try:
+                # Make requests
+                for req_num in range(self.requests_per_client):
+                    start = perf_counter_ns()
+                    try:
+                        await self._request(loop, request)
+                        latencies_ns.append(perf_counter_ns() - start)
+                    except Exception as e:
+                        self._record_request_error(result, req_num, e)
+                result.failed_requests = self.requests_per_client - len(latencies_ns)
+            finally:
+                if fd is not None:
+                    loop.remove_reader(fd)
+
+            # Cleanup
+            self._return_connection(connection)
+
+        except Exception as e:
+            result.connection_error = str(e)
+
+        # A client that failed to connect still arrives, so the rest start
+        if start_barrier is not None:
+            await start_barrier.wait()
+
+        result.end_ns = perf_counter_ns()
+        result.total_duration = (result.end_ns - client_start) * 1e-9
+        result.total_requests = len(latencies_ns)
+        result.latencies = _ns_to_seconds(latencies_ns)
+
+        return result
@@ -2,11 +2,222 @@
 
 import time
 import psutil
+import numpy as np
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
-from statistics import mean, median, stdev
+from typing import Iterable, List, Dict, Optional, Any
+from statistics import mean
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class SampleBuffer:
+    """
+    Growable float64 buffer for per-request samples.
+
+    Drop-in replacement for the plain list that used to hold latencies:
+    supports append/extend/len/iteration/indexing, but stores samples in a
+    preallocated NumPy array that doubles when full. Recording a sample is an
+    indexed store, and statistics run as vectorized reductions over view().
+    A sorted copy is cached by sorted() until the next sample is recorded;
+    select() reads order statistics without sorting.
+    """
+
+    __slots__ = ('_data', '_n', '_sorted')
+
+    def __init__(self, values: Iterable[float] = (), capacity: int = 1024):
+        self._data = np.empty(max(capacity, 1), dtype=np.float64)
+        self._n = 0
+        self._sorted = None
+        self.extend(values)
+
+    def _reserve(self, needed: int):
+        if needed > len(self._data):
+            capacity = len(self._data)
+            while capacity < needed:
+                capacity *= 2
+            self._resize(capacity)
+
+    def _resize(self, capacity: int):
+        grown = np.empty(capacity, dtype=np.float64)
+        grown[:self._n] = self._data[:self._n]
+        self._data = grown
+
+    def reserve(self, capacity: int):
+        """Make room for capacity samples in total, so filling it never reallocates"""
+        if capacity > len(self._data):
+            self._resize(capacity)
+
+    def append(self, value: float):
+        """Record one sample"""
+        if self._n == len(self._data):
+            self._reserve(self._n + 1)
+        self._data[self._n] = value
+        self._n += 1
+        self._sorted = None
+
+    def extend(self, values: Iterable[float]):
+        """Record many samples at once"""
+        if isinstance(values, SampleBuffer):
+            values = values.view()
+        elif not hasattr(values, '__len__'):
+            values = list(values)
+        arr = np.asarray(values, dtype=np.float64).ravel()
+        end = self._n + len(arr)
+        self._reserve(end)
+        self._data[self._n:end] = arr
+        self._n = end
+        self._sorted = None
+
+    def clear(self):
+        """Drop all samples, keeping the allocated capacity"""
+        self._n = 0
+        self._sorted = None
+
+    def view(self) -> np.ndarray:
+        """NumPy view of the recorded samples (no copy)"""
+        return self._data[:self._n]
+
+    def sorted(self) -> np.ndarray:
+        """Sorted copy of the samples, reused until the buffer changes"""
+        if self._sorted is None:
+            self._sorted = np.sort(self.view())
+        return self._sorted
+
+    def select(self, ranks: Iterable[int]) -> np.ndarray:
+        """
+        Samples at the given ranks (0-based positions in sorted order).
+
+        Reads the cached sorted copy if there is one; otherwise a single
+        np.partition pass (introselect, O(n)) places every requested rank
+        without sorting the whole buffer.
+        """
+        ranks = np.asarray(ranks, dtype=np.intp)
+        if self._sorted is not None:
+            return self._sorted[ranks]
+        return np.partition(self.view(), np.unique(ranks))[ranks]
+
+    def tolist(self) -> List[float]:
+        return self.view().tolist()
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.tolist()[index]
+        return float(self.view()[index])
+
+    def __eq__(self, other):
+        if isinstance(other, SampleBuffer):
+            other = other.view()
+        try:
+            return self.tolist() == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return f"SampleBuffer({self.tolist()!r})"
+
+
+# Upper bounds (seconds) of the default latency histogram buckets
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# metadata['errors'] keeps at most this many messages, each truncated to
+# MAX_ERROR_LENGTH characters; metadata['error_count'] counts every error
+MAX_ERRORS = 1024
+MAX_ERROR_LENGTH = 200
+
+
+class HistogramRecorder:
+    """
+    Fixed-bucket latency histogram.
+
+    counts[i] is the number of samples in (buckets[i-1], buckets[i]]; the
+    extra last count holds samples above buckets[-1]. Memory is one int64
+    per bucket however many samples are recorded, so a connection can be
+    summarized without keeping each of its latencies.
+    """
+
+    __slots__ = ('buckets', 'counts')
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = np.asarray(buckets, dtype=np.float64)
+        self.counts = np.zeros(len(self.buckets) + 1, dtype=np.int64)
+
+    def record(self, value: float):
+        """Count one sample"""
+        self.counts[np.searchsorted(self.buckets, value)] += 1
+
+    def record_many(self, values: Iterable[float]):
+        """Count many samples in one vectorized pass"""
+        indices = np.searchsorted(self.buckets, np.asarray(values, dtype=np.float64))
+        self.counts += np.bincount(indices, minlength=len(self.counts))
+
+    def merge(self, other: 'HistogramRecorder'):
+        """Add another histogram's counts (buckets must match)"""
+        if not np.array_equal(self.buckets, other.buckets):
+            raise ValueError("Cannot merge histograms with different buckets")
+        self.counts += other.counts
+
+    @property
+    def count(self) -> int:
+        """Total number of samples recorded"""
+        return int(self.counts.sum())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Bucket bounds and counts as plain lists"""
+        return {'buckets': self.buckets.tolist(), 'counts': self.counts.tolist()}
+
+    def __repr__(self):
+        return f"HistogramRecorder({self.to_dict()!r})"
+
+
+@dataclass
+class PerConnectionMetrics:
+    """
+    Per-client summary of a concurrent run, stored column-wise.
+
+    Row i of every array describes client i, so aggregates are single
+    vectorized calls (connection_time.mean(), total_duration.argmax()).
+    connection_time is NaN for clients that never connected.
+    """
+
+    client_id: np.ndarray
+    connection_time: np.ndarray
+    total_duration: np.ndarray
+    total_requests: np.ndarray
+    failed_requests: np.ndarray
+
+    @classmethod
+    def allocate(cls, num_clients: int) -> 'PerConnectionMetrics':
+        """Create zeroed columns for num_clients clients"""
+        return cls(
+            client_id=np.arange(num_clients),
+            connection_time=np.full(num_clients, np.nan),
+            total_duration=np.zeros(num_clients),
+            total_requests=np.zeros(num_clients, dtype=np.int64),
+            failed_requests=np.zeros(num_clients, dtype=np.int64),
+        )
+
+    def record(self, client_id: int, connection_time: Optional[float],
+               total_duration: float, total_requests: int, failed_requests: int):
+        """Fill in client_id's row"""
+        if connection_time is not None:
+            self.connection_time[client_id] = connection_time
+        self.total_duration[client_id] = total_duration
+        self.total_requests[client_id] = total_requests
+        self.failed_requests[client_id] = failed_requests
+
+    def __len__(self) -> int:
+        return len(self.client_id)
+
 
 @dataclass
 class BenchmarkMetrics:
@@ -20,7 +231,7 @@ class BenchmarkMetrics:
     connection_times: List[float] = field(default_factory=list)
 
     # Latency metrics (round-trip time)
-    latencies: List[float] = field(default_factory=list)
+    latencies: SampleBuffer = field(default_factory=SampleBuffer)
 
     # Bandwidth metrics (bytes/second)
     upload_bandwidth: List[float] = field(default_factory=list)
@@ -35,9 +246,11 @@ class BenchmarkMetrics:
     cpu_usage: List[float] = field(default_factory=list)
     memory_usage: List[float] = field(default_factory=list)
 
-    # Timing
+    # Timing: wall-clock marks for reporting, perf_counter_ns() marks for the duration
     start_time: Optional[float] = None
     end_time: Optional[float] = None
+    _start_ns: Optional[int] = field(default=None, repr=False)
+    _end_ns: Optional[int] = field(default=None, repr=False)
 
     # Additional metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
@@ -50,6 +263,29 @@ class BenchmarkMetrics:
         """Record request/response latency"""
         self.latencies.append(duration)
 
+    def add_connection_times_ns(self, durations_ns: Iterable[int]):
+        """Record many connection times given as integer perf_counter_ns() deltas"""
+        self.connection_times.extend((np.asarray(durations_ns, dtype=np.int64) * 1e-9).tolist())
+
+    def add_latencies_ns(self, durations_ns: Iterable[int]):
+        """Record many latencies given as integer perf_counter_ns() deltas"""
+        self.latencies.extend(np.asarray(durations_ns, dtype=np.int64) * 1e-9)
+
+    def add_error(self, error: Any, context: str = ''):
+        """
+        Record a failed operation in metadata['errors'].
+
+        Only the first MAX_ERRORS messages are kept (the earliest errors
+        usually point at the root cause); later ones are just counted in
+        metadata['error_count'], without being stringified.
+        """
+        metadata = self.metadata
+        metadata['error_count'] = metadata.get('error_count', 0) + 1
+        errors = metadata.setdefault('errors', [])
+        if len(errors) < MAX_ERRORS:
+            message = f"{context}: {error}" if context else str(error)
+            errors.append(message[:MAX_ERROR_LENGTH])
+
     def add_upload_bandwidth(self, bytes_sent: int, duration: float):
         """Record upload bandwidth"""
         if duration > 0:
@@ -68,13 +304,18 @@ class BenchmarkMetrics:
     def start(self):
         """Mark benchmark start"""
         self.start_time = time.time()
+        self._start_ns = time.perf_counter_ns()
 
     def end(self):
         """Mark benchmark end"""
+        self._end_ns = time.perf_counter_ns()
         self.end_time = time.time()
 
     def get_duration(self) -> Optional[float]:
         """Get total benchmark duration"""
+        # Prefer the monotonic marks; a wall-clock step cannot skew them
+        if self._start_ns is not None and self._end_ns is not None:
+            return (self._end_ns - self._start_ns) * 1e-9
         if self.start_time and self.end_time:
             return self.end_time - self.start_time
         return None
@@ -88,49 +329,20 @@ class BenchmarkMetrics:
             'duration': self.get_duration(),
         }
 
-        # Connection time statistics
+        # Connection time, latency and bandwidth statistics are vectorized:
+        # the median and percentiles come from one O(n) partition over all
+        # their ranks instead of a full sort
         if self.connection_times:
-            stats['connection_time'] = {
-                'mean': mean(self.connection_times),
-                'median': median(self.connection_times),
-                'min': min(self.connection_times),
-                'max': max(self.connection_times),
-                'stdev': stdev(self.connection_times) if len(self.connection_times) > 1 else 0,
-                'count': len(self.connection_times),
-            }
+            stats['connection_time'] = self._summarize(np.asarray(self.connection_times))
 
-        # Latency statistics
         if self.latencies:
-            stats['latency'] = {
-                'mean': mean(self.latencies),
-                'median': median(self.latencies),
-                'min': min(self.latencies),
-                'max': max(self.latencies),
-                'stdev': stdev(self.latencies) if len(self.latencies) > 1 else 0,
-                'p95': self._percentile(self.latencies, 95),
-                'p99': self._percentile(self.latencies, 99),
-                'count': len(self.latencies),
-            }
+            stats['latency'] = self._summarize(self.latencies.view(), self.latencies.select)
 
-        # Upload bandwidth statistics
         if self.upload_bandwidth:
-            stats['upload_bandwidth'] = {
-                'mean': mean(self.upload_bandwidth),
-                'median': median(self.upload_bandwidth),
-                'min': min(self.upload_bandwidth),
-                'max': max(self.upload_bandwidth),
-                'stdev': stdev(self.upload_bandwidth) if len(self.upload_bandwidth) > 1 else 0,
-            }
+            stats['upload_bandwidth'] = self._summarize(np.asarray(self.upload_bandwidth))
 
-        # Download bandwidth statistics
         if self.download_bandwidth:
-            stats['download_bandwidth'] = {
-                'mean': mean(self.download_bandwidth),
-                'median': median(self.download_bandwidth),
-                'min': min(self.download_bandwidth),
-                'max': max(self.download_bandwidth),
-                'stdev': stdev(self.download_bandwidth) if len(self.download_bandwidth) > 1 else 0,
-            }
+            stats['download_bandwidth'] = self._summarize(np.asarray(self.download_bandwidth))
 
         # Concurrent connection statistics
         stats['concurrent'] = {
@@ -159,6 +371,33 @@ class BenchmarkMetrics:
 
         return stats
 
+    @classmethod
+    def _summarize(cls, values: np.ndarray, select=None) -> Dict[str, float]:
+        """
+        Summary statistics of a non-empty float array.
+
+        select(ranks) returns the samples at the given sorted-order ranks;
+        by default a single np.partition pass over values.
+        """
+        n = len(values)
+        ranks = [(n - 1) // 2, n // 2, *cls._percentile_ranks(n, (95, 99, 99.9))]
+        if select is None:
+            picked = np.partition(values, np.unique(ranks))[ranks]
+        else:
+            picked = select(ranks)
+        lower, upper, p95, p99, p999 = picked.tolist()
+        return {
+            'mean': float(values.mean()),
+            'median': upper if n % 2 else (lower + upper) / 2,
+            'min': float(values.min()),
+            'max': float(values.max()),
+            'stdev': float(values.std(ddof=1)) if n > 1 else 0,
+            'p95': p95,
+            'p99': p99,
+            'p999': p999,
+            'count': n,
+        }
+
     @staticmethod
     def _percentile(data: List[float], percentile: float) -> float:
         """Calculate percentile of data"""
@@ -166,6 +405,15 @@ class BenchmarkMetrics:
         index = int(len(sorted_data) * percentile / 100)
         return sorted_data[min(index, len(sorted_data) - 1)]
 
+    @staticmethod
+    def _percentile_ranks(n: int, percentiles: Iterable[float]) -> List[int]:
+        """
+        Sorted-order ranks of several percentiles of n samples.
+
+        Uses the same rank rule as _percentile, so results are identical.
+        """
+        return [min(int(n * p / 100), n - 1) for p in percentiles]
+
 
 @dataclass
 class BenchmarkResults:
@@ -191,8 +439,17 @@ class BenchmarkResults:
         return comparison
 
     def to_json(self) -> str:
-        """Export results as JSON"""
-        return json.dumps(self.get_comparison_table(), indent=2)
+        """Export results as JSON (uses orjson when it is installed)"""
+        comparison = self.get_comparison_table()
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    comparison,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                ).decode()
+            except TypeError:
+                pass  # Metadata orjson can't encode; fall back to the stdlib encoder
+        return json.dumps(comparison, indent=2)
 
     def to_dict(self) -> Dict[str, Any]:
         """Export results as dictionary"""
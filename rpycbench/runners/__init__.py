@@ -1 +1,20 @@
 """Benchmark runners"""
+
+import logging
+import sys
+
+
+def log_progress_to_stdout() -> logging.Handler:
+    """
+    Print rpycbench's progress messages (e.g. the suite's per-benchmark
+    lines) to stdout, for the command-line runners.
+
+    The library itself only logs; applications that call it directly
+    decide where those messages go through their own logging setup.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    package_logger = logging.getLogger('rpycbench')
+    package_logger.addHandler(handler)
+    package_logger.setLevel(logging.INFO)
+    return handler
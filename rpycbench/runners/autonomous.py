@@ -6,6 +6,7 @@ import sys
 from pathlib import Path
 
 from rpycbench.benchmarks.suite import BenchmarkSuite
+from rpycbench.runners import log_progress_to_stdout
 
 
 def main():
@@ -113,6 +114,13 @@ def main():
         help='Number of iterations per binary transfer test'
     )
 
+    parser.add_argument(
+        '--no-connection-reuse',
+        action='store_true',
+        help='Open a fresh RPyC connection for every latency/bandwidth/binary benchmark '
+             'instead of sharing one per server mode'
+    )
+
     # Output options
     parser.add_argument(
         '--output',
@@ -127,6 +135,7 @@ def main():
     )
 
     args = parser.parse_args()
+    log_progress_to_stdout()
 
     # Create and run benchmark suite
     suite = BenchmarkSuite(
@@ -135,6 +144,7 @@ def main():
         http_host=args.http_host,
         http_port=args.http_port,
         remote_host=args.remote_host,
+        reuse_connections=not args.no_connection_reuse,
     )
 
     try:
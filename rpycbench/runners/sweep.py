@@ -9,6 +9,7 @@ from typing import Dict, Any, Optional, List
 import psutil
 
 from rpycbench.benchmarks.suite import BenchmarkSuite
+from rpycbench.runners import log_progress_to_stdout
 from rpycbench.analysis.graphs import generate_graphs_from_json
 
 
@@ -141,6 +142,12 @@ def main():
         action='store_true',
         help='Skip graph generation'
     )
+    parser.add_argument(
+        '--graph-format',
+        choices=['svg', 'png'],
+        default='svg',
+        help='File format for generated graphs'
+    )
     parser.add_argument(
         '--description',
         default='',
@@ -163,6 +170,7 @@ def main():
     )
 
     args = parser.parse_args()
+    log_progress_to_stdout()
 
     if not args.description:
         if args.remote_host:
@@ -188,7 +196,7 @@ def main():
             location_suffix = 'remote' if args.remote_host else 'local'
             results_file = args.output_dir / f'results_{location_suffix}.json'
 
-            graph_files = generate_graphs_from_json(results_file, graphs_dir)
+            graph_files = generate_graphs_from_json(results_file, graphs_dir, args.graph_format)
             print(f"Generated {len(graph_files)} graphs in {graphs_dir}")
 
         print("\n" + "="*80)
@@ -1,6 +1,11 @@
 """HTTP/REST server implementations for benchmarking"""
 
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, request, jsonify, send_file
+import asyncio
+import http.client
+import requests
+import urllib3
+from urllib3.connection import HTTPConnection
 import multiprocessing
 import socket
 import time
@@ -9,6 +14,18 @@ import signal
 import sys
 
 
+_ZERO_BLOCK = bytes(1024 * 1024)
+
+
+def _zero_stream(size):
+    """Yield size zero bytes, reusing one shared 1MB block for every full block"""
+    full_blocks, remainder = divmod(size, len(_ZERO_BLOCK))
+    for _ in range(full_blocks):
+        yield _ZERO_BLOCK
+    if remainder:
+        yield _ZERO_BLOCK[:remainder]
+
+
 def _run_http_server(host, port, threaded, ready_event):
     """
     HTTP server process target function.
@@ -30,6 +47,10 @@ def _run_http_server(host, port, threaded, ready_event):
         def ping():
             return jsonify({'response': 'pong'})
 
+        @app.route('/ping-batch/<int:n>', methods=['GET'])
+        def ping_batch(n):
+            return jsonify({'responses': ['pong'] * n})
+
         @app.route('/echo', methods=['POST'])
         def echo():
             data = request.get_data()
@@ -67,32 +88,36 @@ def _run_http_server(host, port, threaded, ready_event):
 
         @app.route('/download-file/<int:size>', methods=['GET'])
         def download_file(size):
-            data = b'\x00' * size
-            return send_file(
-                io.BytesIO(data),
+            # Stream a shared zero block instead of materializing size bytes
+            return Response(
+                _zero_stream(size),
                 mimetype='application/octet-stream',
-                as_attachment=True,
-                download_name='file.bin'
+                headers={
+                    'Content-Length': str(size),
+                    'Content-Disposition': 'attachment; filename=file.bin',
+                },
+                direct_passthrough=True,
             )
 
         @app.route('/upload-file-chunked', methods=['POST'])
         def upload_file_chunked():
-            import json
-            chunks_data = request.get_json()
-            chunks = [bytes.fromhex(chunk) for chunk in chunks_data['chunks']]
-            total_size = sum(len(chunk) for chunk in chunks)
-            return jsonify({'size': total_size})
+            # Raw concatenated chunks; X-Chunk-Size gives the chunk length
+            total_size = len(request.get_data())
+            chunk_size = int(request.headers.get('X-Chunk-Size') or 0) or total_size or 1
+            return jsonify({'size': total_size, 'chunks': -(-total_size // chunk_size)})
 
         @app.route('/download-file-chunked/<int:size>/<int:chunk_size>', methods=['GET'])
         def download_file_chunked(size, chunk_size):
-            import json
-            chunks = []
-            remaining = size
-            while remaining > 0:
-                current_chunk = min(chunk_size, remaining)
-                chunks.append((b'\x00' * current_chunk).hex())
-                remaining -= current_chunk
-            return jsonify({'chunks': chunks})
+            # The client splits the raw body at X-Chunk-Size boundaries
+            return Response(
+                _zero_stream(size),
+                mimetype='application/octet-stream',
+                headers={
+                    'Content-Length': str(size),
+                    'X-Chunk-Size': str(chunk_size),
+                },
+                direct_passthrough=True,
+            )
 
         # Signal ready
         ready_event.set()
@@ -187,16 +212,318 @@ class HTTPBenchmarkServer:
         return False
 
 
-def create_http_session():
-    """Create HTTP session for benchmarking"""
-    import requests
+class NoDelayHTTPAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter whose pooled sockets disable Nagle and enable keep-alive"""
+
+    # urllib3's defaults already carry TCP_NODELAY; keep them and add SO_KEEPALIVE
+    socket_options = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+def create_http_session(pool_connections=10, pool_maxsize=100, max_retries=3):
+    """
+    Create HTTP session for benchmarking
+
+    pool_maxsize bounds the keep-alive sockets kept per host, so size it to
+    the number of threads sharing the session. max_retries=0 makes a failed
+    request count as a failure instead of being silently re-sent.
+    """
     session = requests.Session()
-    # Keep-alive connection
-    adapter = requests.adapters.HTTPAdapter(
-        pool_connections=10,
-        pool_maxsize=100,
-        max_retries=3
+    # Keep-alive connection with TCP_NODELAY on every pooled socket
+    adapter = NoDelayHTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries,
     )
     session.mount('http://', adapter)
     session.mount('https://', adapter)
     return session
+
+
+def create_http_pool_manager(maxsize=128):
+    """
+    Create one urllib3 PoolManager to share between many client threads.
+
+    A requests.Session per client gives every client its own connection pool,
+    so N clients keep N pools (and handshake N times) for the same host. A
+    single thread-safe PoolManager holds one pool per host with up to maxsize
+    keep-alive sockets; block=False lets a burst open extra connections
+    instead of waiting, and retries are disabled so failures are counted
+    rather than hidden.
+
+    Read responses fully (or drain them) and call release_conn() when
+    requesting with preload_content=False, so the socket returns to the pool.
+    Pool reuse shows in pool.num_connections vs pool.num_requests, where
+    pool = manager.connection_from_url(url).
+    """
+    return urllib3.PoolManager(
+        maxsize=maxsize,
+        block=False,
+        retries=False,
+        socket_options=NoDelayHTTPAdapter.socket_options,
+    )
+
+
+def send_buffers(sock, buffers):
+    """
+    Send several buffers on sock with as few syscalls as possible.
+
+    Uses one vectored sendmsg() per attempt where the platform has it, so a
+    framed message (header, body) leaves in a single syscall instead of one
+    write per part; partial sends resume where the kernel stopped. Without
+    sendmsg() (Windows) the buffers are joined once and sent with sendall().
+    """
+    if not hasattr(sock, 'sendmsg'):
+        sock.sendall(b''.join(buffers))
+        return
+    views = [memoryview(b).cast('B') for b in buffers if len(b)]
+    while views:
+        sent = sock.sendmsg(views)
+        while views and sent >= len(views[0]):
+            sent -= len(views[0])
+            views.pop(0)
+        if views:
+            views[0] = views[0][sent:]
+
+
+class _VectoredHTTPConnection(http.client.HTTPConnection):
+    """
+    HTTPConnection that sends the headers and a bytes body in one syscall.
+
+    http.client sends the header block and the body with separate send()
+    calls. For plain bytes-like bodies this joins them into one
+    send_buffers() call, while keeping what send() does for each part: the
+    "http.client.send" audit event and the debuglevel trace. Any other body
+    (file-like, iterable, chunked encoding) goes through the stdlib path.
+    test_servers checks this override against http.client's own output, so
+    a change in the stdlib contract fails the tests rather than drifting.
+    """
+
+    def _send_output(self, message_body=None, encode_chunked=False):
+        if encode_chunked or not isinstance(message_body, (bytes, bytearray, memoryview)):
+            return super()._send_output(message_body, encode_chunked)
+        if self.sock is None:
+            if not self.auto_open:
+                raise http.client.NotConnected()
+            self.connect()
+        self._buffer.extend((b"", b""))
+        header = b"\r\n".join(self._buffer)
+        del self._buffer[:]
+        # Same per-part trace and audit event as http.client's send() calls
+        parts = (header, message_body) if len(message_body) else (header,)
+        for part in parts:
+            if self.debuglevel > 0:
+                print("send:", repr(part))
+            sys.audit("http.client.send", self, part)
+        if self.debuglevel > 0 and not len(message_body):
+            print('Zero length chunk ignored')
+        send_buffers(self.sock, parts)
+
+
+def create_http_connection(host='localhost', port=5000, timeout=5):
+    """
+    Create a raw HTTP connection for latency-sensitive loops.
+
+    Unlike create_http_session(), requests go straight through http.client
+    (conn.request(...); conn.getresponse().read()), skipping the per-call
+    URL parsing, header merging and hook dispatch done by requests. Bytes
+    bodies are sent with a Content-Length in the same syscall as the headers
+    (see send_buffers()), and http.client sets TCP_NODELAY itself.
+
+    The socket is opened eagerly so connection setup can be timed separately
+    from the first request. It is reused while the server keeps the
+    connection alive; Flask's development server closes after every
+    response, in which case http.client reconnects transparently.
+    """
+    conn = _VectoredHTTPConnection(host, port, timeout=timeout)
+    conn.connect()
+    return conn
+
+
+_RETRYABLE_METHODS = frozenset(('GET', 'HEAD'))
+
+
+def http_request(conn, method, path, body=None):
+    """
+    Send one request on a create_http_connection() connection and return
+    the response body.
+
+    If the server dropped an idle keep-alive connection, the first attempt
+    fails; the connection is reopened and the request sent once more. A
+    failure while sending is always retried. Once the request has been sent,
+    the server may have processed it, so a connection dropped before the
+    response is only retried for idempotent GET/HEAD requests; anything
+    else (e.g. an upload POST) raises rather than being sent, and timed,
+    twice. Other errors propagate.
+    """
+    stale = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+    for attempt in (1, 2):
+        try:
+            conn.request(method, path, body=body)
+        except stale:
+            conn.close()
+            if attempt == 2:
+                raise
+            continue
+        try:
+            return conn.getresponse().read()
+        except stale:
+            conn.close()
+            if attempt == 2 or method not in _RETRYABLE_METHODS:
+                raise
+
+
+def upload_chunks(session, url, chunks):
+    """
+    POST chunks to an /upload-file-chunked endpoint with a requests session.
+
+    The chunks are sent as one raw application/octet-stream body with the
+    chunk length in an X-Chunk-Size header, rather than as a JSON list of
+    hex strings, which doubled the bytes on the wire. A ChunkedPayload
+    hands over its underlying buffer, so the chunks are never sliced out
+    and joined back together.
+    """
+    chunk_size = len(chunks[0]) if len(chunks) else 0
+    body = chunks.tobytes() if hasattr(chunks, 'tobytes') else b''.join(chunks)
+    return session.post(
+        url,
+        data=body,
+        headers={
+            'Content-Type': 'application/octet-stream',
+            'X-Chunk-Size': str(chunk_size),
+        },
+    )
+
+
+def download_chunks(session, url):
+    """
+    GET a /download-file-chunked payload and split it into its chunks.
+
+    Chunks are memoryview slices of the response body, not copies.
+    """
+    response = session.get(url)
+    response.raise_for_status()
+    view = memoryview(response.content)
+    chunk_size = int(response.headers.get('X-Chunk-Size') or 0) or len(view) or 1
+    return [view[offset:offset + chunk_size] for offset in range(0, len(view), chunk_size)]
+
+
+class AsyncHTTPConnection:
+    """
+    Minimal HTTP/1.1 client on asyncio streams, for AsyncConcurrentBenchmark.
+
+    All clients share the event loop's selector (epoll on Linux, or libuv
+    under uvloop), so 128 clients waiting on the network cost one polling
+    thread instead of 128 blocked ones. Use open_async_http_connection() to
+    create one and ``await conn.request('GET', '/ping')`` to get a body.
+
+    The socket is kept open while the server allows it; after a
+    ``Connection: close`` reply (Flask's development server sends one every
+    time) the next request opens a new socket.
+    """
+
+    def __init__(self, host='localhost', port=5000, timeout=5):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._reader = None
+        self._writer = None
+        self._sent = False  # Whether the current request was fully written
+
+    async def connect(self):
+        """Open the socket if it is not already open"""
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout
+            )
+
+    async def request(self, method, path, body=None):
+        """
+        Send one request and return the response body.
+
+        A request on a connection the server already dropped is sent once
+        more on a fresh socket, like http_request(): always if the failure
+        came while writing, and only for GET/HEAD once the request was fully
+        written, since the server may have processed it. On a timeout the
+        socket is closed, so a late reply is never read as the next
+        request's response.
+        """
+        for attempt in (1, 2):
+            await self.connect()
+            self._sent = False
+            try:
+                return await asyncio.wait_for(self._exchange(method, path, body), self.timeout)
+            except (ConnectionResetError, BrokenPipeError, asyncio.IncompleteReadError):
+                self.close()
+                if attempt == 2 or (self._sent and method not in _RETRYABLE_METHODS):
+                    raise
+            except asyncio.TimeoutError:
+                self.close()
+                raise
+
+    async def _exchange(self, method, path, body):
+        body = body or b''
+        head = (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        ).encode('latin-1')
+        self._writer.writelines((head, body))
+        await self._writer.drain()
+        self._sent = True
+
+        reader = self._reader
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("server closed the connection")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if 'content-length' in headers:
+            data = await reader.readexactly(int(headers['content-length']))
+        elif headers.get('transfer-encoding', '').lower() == 'chunked':
+            parts = []
+            while True:
+                size = int((await reader.readline()).split(b';')[0], 16)
+                if not size:
+                    await reader.readline()
+                    break
+                parts.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            data = b''.join(parts)
+        else:
+            data = await reader.read()
+            headers['connection'] = 'close'
+
+        if headers.get('connection', '').lower() == 'close':
+            self.close()
+        return data
+
+    def close(self):
+        """Close the socket (a later request reopens it)"""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+
+async def open_async_http_connection(host='localhost', port=5000, timeout=5):
+    """
+    Create and connect an AsyncHTTPConnection.
+
+    AsyncConcurrentBenchmark awaits a connection_factory that returns a
+    coroutine, so ``connection_factory=lambda: open_async_http_connection()``
+    times the connect like any other connection.
+    """
+    conn = AsyncHTTPConnection(host, port, timeout)
+    await conn.connect()
+    return conn
@@ -1,9 +1,15 @@
 """RPyC server implementations for benchmarking"""
 
 import rpyc
-from rpyc.utils.server import ThreadedServer, ForkingServer, OneShotServer
+from rpyc.core.stream import SocketStream
+from rpyc.utils.factory import connect_stream
+from rpyc.utils.server import ThreadedServer, ThreadPoolServer, ForkingServer, OneShotServer
 import multiprocessing
+import os
 import socket
+import threading
+from collections import deque
+from contextlib import contextmanager
 import time
 import signal
 import sys
@@ -12,10 +18,19 @@ import sys
 class BenchmarkService(rpyc.Service):
     """RPyC service for benchmarking"""
 
+    def __init__(self):
+        super().__init__()
+        # Payloads cached per connection by put_blob(), keyed by handle
+        self._blobs = {}
+
     def exposed_ping(self):
         """Simple ping method for latency testing"""
         return "pong"
 
+    def exposed_ping_batch(self, n):
+        """Answer n pings in a single round trip (amortizes network latency)"""
+        return ("pong",) * n
+
     def exposed_echo(self, data):
         """Echo data back for bandwidth testing"""
         return data
@@ -33,6 +48,12 @@ class BenchmarkService(rpyc.Service):
         result = sum(i * i for i in range(n))
         return result
 
+    def exposed_batch_compute(self, items):
+        """compute() over every item in one round trip"""
+        # A tuple is sent back by value; a list would arrive as a netref and
+        # cost a round trip per element access
+        return tuple(self.exposed_compute(n) for n in items)
+
     def exposed_sleep(self, duration):
         """Sleep for testing async behavior"""
         time.sleep(duration)
@@ -42,23 +63,99 @@ class BenchmarkService(rpyc.Service):
         return len(data)
 
     def exposed_download_file(self, size):
-        return b'\x00' * size
+        # calloc-backed: large payloads are never memset in user space
+        return bytes(size)
 
     def exposed_upload_file_chunked(self, chunks):
-        total_size = sum(len(chunk) for chunk in chunks)
-        return total_size
+        # Only the sizes are needed; chunks are never joined into one buffer
+        return sum(map(len, chunks))
+
+    def exposed_put_blob(self, data):
+        """Cache data server-side and return a handle for later calls"""
+        handle = len(self._blobs) + 1
+        while handle in self._blobs:
+            handle += 1
+        self._blobs[handle] = data
+        return handle
+
+    def exposed_upload_blob(self, handle):
+        """Like upload(), but for a payload previously cached with put_blob()"""
+        return len(self._blobs[handle])
+
+    def exposed_drop_blob(self, handle):
+        """Release a payload cached with put_blob()"""
+        self._blobs.pop(handle, None)
 
     def exposed_download_file_chunked(self, size, chunk_size):
-        chunks = []
-        remaining = size
-        while remaining > 0:
-            current_chunk = min(chunk_size, remaining)
-            chunks.append(b'\x00' * current_chunk)
-            remaining -= current_chunk
+        # Every full chunk shares one zero buffer instead of allocating its own
+        full_chunks, remainder = divmod(size, chunk_size)
+        chunks = [bytes(chunk_size)] * full_chunks
+        if remainder:
+            chunks.append(bytes(remainder))
         return chunks
 
 
-def _run_rpyc_server(host, port, mode, ready_event):
+def _set_nodelay(sock):
+    """Disable Nagle's algorithm so small RPC frames are sent immediately"""
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+class _NoDelayMixin:
+    """Server mixin that sets TCP_NODELAY on every accepted client socket"""
+
+    def _accept_method(self, sock):
+        _set_nodelay(sock)
+        super()._accept_method(sock)
+
+
+class _ReusePortMixin:
+    """
+    Server mixin that can bind the listener with SO_REUSEPORT.
+
+    rpyc binds its listener inside Server.__init__, before options other than
+    SO_REUSEADDR can be set, so with reuse_port=True the server is created on
+    an ephemeral port and the listener is then replaced by one bound to the
+    requested port with SO_REUSEPORT. Several server processes can then
+    listen on the same port and the kernel spreads incoming connections
+    across their accept queues.
+    """
+
+    def __init__(self, *args, hostname=None, port=0, reuse_port=False, **kwargs):
+        if not reuse_port:
+            super().__init__(*args, hostname=hostname, port=port, **kwargs)
+            return
+
+        super().__init__(*args, hostname=hostname, port=0, **kwargs)
+        ephemeral = self.listener
+        listener = socket.socket(ephemeral.family, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        listener.bind((hostname or '', port))
+        listener.settimeout(ephemeral.gettimeout())
+        ephemeral.close()
+
+        self.listener = listener
+        self.host, self.port = listener.getsockname()[:2]
+
+
+class BenchmarkThreadedServer(_NoDelayMixin, _ReusePortMixin, ThreadedServer):
+    pass
+
+
+class BenchmarkThreadPoolServer(_NoDelayMixin, _ReusePortMixin, ThreadPoolServer):
+    pass
+
+
+class BenchmarkForkingServer(_NoDelayMixin, _ReusePortMixin, ForkingServer):
+    pass
+
+
+class BenchmarkOneShotServer(_NoDelayMixin, _ReusePortMixin, OneShotServer):
+    pass
+
+
+def _run_rpyc_server(host, port, mode, ready_event, service=BenchmarkService, reuse_port=False,
+                     worker_threads=None):
     """
     Server process target function.
     Runs in a separate process to isolate from client GIL.
@@ -72,27 +169,51 @@ def _run_rpyc_server(host, port, mode, ready_event):
         'sync_request_timeout': 30,
     }
 
+    # listener_timeout=None makes accept() block in the kernel instead of
+    # poll()ing every 0.5s to re-check server.active; the process is stopped
+    # by signal, so the periodic wakeup (and extra poll per accept) is unneeded
+
     try:
-        if mode == 'threaded':
-            server = ThreadedServer(
-                BenchmarkService,
+        # A preforked worker is a threaded server; the forking happened once,
+        # when RPyCServer started the worker processes. With worker_threads it
+        # serves requests from a fixed thread pool instead of a thread per
+        # connection.
+        if mode == 'preforked' and worker_threads:
+            server = BenchmarkThreadPoolServer(
+                service,
+                hostname=host,
+                port=port,
+                protocol_config=protocol_config,
+                listener_timeout=None,
+                reuse_port=reuse_port,
+                nbThreads=worker_threads,
+            )
+        elif mode in ('threaded', 'preforked'):
+            server = BenchmarkThreadedServer(
+                service,
                 hostname=host,
                 port=port,
                 protocol_config=protocol_config,
+                listener_timeout=None,
+                reuse_port=reuse_port,
             )
         elif mode == 'forking':
-            server = ForkingServer(
-                BenchmarkService,
+            server = BenchmarkForkingServer(
+                service,
                 hostname=host,
                 port=port,
                 protocol_config=protocol_config,
+                listener_timeout=None,
+                reuse_port=reuse_port,
             )
         elif mode == 'oneshot':
-            server = OneShotServer(
-                BenchmarkService,
+            server = BenchmarkOneShotServer(
+                service,
                 hostname=host,
                 port=port,
                 protocol_config=protocol_config,
+                listener_timeout=None,
+                reuse_port=reuse_port,
             )
         else:
             raise ValueError(f"Unknown server mode: {mode}")
@@ -114,21 +235,57 @@ class RPyCServer:
 
     Runs server in a separate process to isolate from client GIL.
     Server lifecycle is managed by the parent process.
+
+    With acceptors > 1, that many server processes listen on the same port
+    via SO_REUSEPORT, so a burst of new connections (e.g. 128 concurrent
+    clients against a forking server) is not funnelled through one accept
+    queue. server_process is the first of server_processes.
+
+    mode='preforked' starts num_workers (default: CPU count) threaded server
+    processes up front, sharing the port the same way. Unlike 'forking',
+    which forks a new interpreter for every connection, no fork happens on
+    the connection path, so connection and request timings measure
+    multi-process parallelism without per-connection fork cost. By default
+    each worker starts a thread per connection; worker_threads=N makes each
+    worker serve requests from a fixed pool of N threads instead. acceptors
+    does not apply to this mode, since num_workers sets the process count.
     """
 
-    def __init__(self, host='localhost', port=18812, mode='threaded', auto_register=False):
+    def __init__(self, host='localhost', port=18812, mode='threaded', auto_register=False,
+                 service=BenchmarkService, acceptors=None, num_workers=None, worker_threads=None):
+        if mode == 'preforked':
+            if acceptors is not None:
+                raise ValueError("acceptors does not apply to mode='preforked'; use num_workers")
+            num_workers = num_workers or os.cpu_count() or 1
+        elif num_workers is not None or worker_threads is not None:
+            raise ValueError("num_workers and worker_threads only apply to mode='preforked'")
+        else:
+            acceptors = acceptors or 1
+        processes = num_workers if mode == 'preforked' else acceptors
+        if processes > 1 and not hasattr(socket, 'SO_REUSEPORT'):
+            raise ValueError(
+                "multiple server processes require SO_REUSEPORT, which this platform lacks"
+            )
         self.host = host
         self.port = port
         self.mode = mode
         self.auto_register = auto_register
+        self.service = service
+        self.acceptors = acceptors
+        self.num_workers = num_workers
+        self.worker_threads = worker_threads
+        self._num_processes = processes
         self.server_process = None
+        self.server_processes = []
         self.ready_event = None
+        self.ready_events = []
 
     def _wait_for_server(self, timeout=10):
         """Wait for server to be ready to accept connections"""
-        # First wait for the ready event
-        if not self.ready_event.wait(timeout=timeout):
-            raise TimeoutError(f"Server did not signal ready within {timeout}s")
+        # First wait for every server process to signal ready
+        for ready_event in self.ready_events:
+            if not ready_event.wait(timeout=timeout):
+                raise TimeoutError(f"Server did not signal ready within {timeout}s")
 
         # Then verify we can actually connect
         start_time = time.time()
@@ -145,34 +302,47 @@ class RPyCServer:
         raise TimeoutError(f"Server not accepting connections after {timeout}s")
 
     def start(self):
-        """Start the RPyC server in a separate process"""
-        # Create event for signaling server readiness
-        self.ready_event = multiprocessing.Event()
-
-        # Create and start server process
-        self.server_process = multiprocessing.Process(
-            target=_run_rpyc_server,
-            args=(self.host, self.port, self.mode, self.ready_event),
-            daemon=True,
-        )
-        self.server_process.start()
+        """Start the RPyC server in a separate process (one per acceptor/worker)"""
+        reuse_port = self._num_processes > 1
+        self.ready_events = []
+        self.server_processes = []
+
+        for _ in range(self._num_processes):
+            # Create event for signaling server readiness
+            ready_event = multiprocessing.Event()
+
+            # Create and start server process
+            server_process = multiprocessing.Process(
+                target=_run_rpyc_server,
+                args=(self.host, self.port, self.mode, ready_event, self.service, reuse_port,
+                      self.worker_threads),
+                daemon=True,
+            )
+            server_process.start()
+            self.ready_events.append(ready_event)
+            self.server_processes.append(server_process)
+
+        self.ready_event = self.ready_events[0]
+        self.server_process = self.server_processes[0]
 
         # Wait for server to be ready
         self._wait_for_server()
 
     def stop(self):
         """Stop the RPyC server"""
-        if self.server_process and self.server_process.is_alive():
-            # Terminate the process
-            self.server_process.terminate()
+        for server_process in self.server_processes:
+            if server_process.is_alive():
+                # Terminate the process
+                server_process.terminate()
 
+        for server_process in self.server_processes:
             # Wait for clean shutdown (with timeout)
-            self.server_process.join(timeout=5)
+            server_process.join(timeout=5)
 
             # Force kill if still alive
-            if self.server_process.is_alive():
-                self.server_process.kill()
-                self.server_process.join()
+            if server_process.is_alive():
+                server_process.kill()
+                server_process.join()
 
     def __enter__(self):
         """Context manager entry"""
@@ -185,14 +355,189 @@ class RPyCServer:
         return False
 
 
+# (host, port) -> numeric IPv4 address, resolved once per process
+_ADDRINFO_CACHE = {}
+
+
+def _resolve_address(host, port):
+    """
+    Resolve host to a numeric address, caching the result per process.
+
+    Benchmarks open many connections to one fixed server; resolving the name
+    once skips repeated getaddrinfo() calls (and glibc's NSS lookup chain)
+    on every connect. Numeric addresses pass straight through the resolver.
+    """
+    key = (host, port)
+    address = _ADDRINFO_CACHE.get(key)
+    if address is None:
+        sockaddr = socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_STREAM)[0][4]
+        address = _ADDRINFO_CACHE[key] = sockaddr[0]
+    return address
+
+
 def create_rpyc_connection(host='localhost', port=18812, timeout=5):
-    """Create RPyC connection for benchmarking"""
-    return rpyc.connect(
-        host,
-        port,
-        config={
+    """
+    Create RPyC connection for benchmarking.
+
+    TCP_NODELAY and SO_KEEPALIVE are set on the client socket so that small
+    request frames are not held back by Nagle's algorithm / delayed ACKs.
+    rpyc's SocketStream applies them before the connection handshake, and
+    timeout bounds both connecting and each synchronous request. The host
+    name is resolved on the first connection only.
+    """
+    stream = SocketStream.connect(
+        _resolve_address(host, port), port, timeout=timeout, nodelay=True, keepalive=True
+    )
+    return connect_stream(
+        stream,
+        rpyc.VoidService,
+        {
             'allow_public_attrs': True,
             'allow_pickle': True,
             'sync_request_timeout': timeout,
-        }
+        },
     )
+
+
+class ConnectionPool:
+    """
+    Bounded LRU pool of reusable client connections.
+
+    Connections are checked out with acquire() and handed back with
+    release(), or borrowed with get_connection() as a context manager. Up to
+    max_size idle connections are kept open, so repeated benchmark runs
+    against the same server don't pay the TCP + RPyC handshake for every
+    client again. When the pool is full, the least recently used idle
+    connection is closed.
+
+    burst_limit caps the total number of open connections (idle + checked
+    out). Between max_size and burst_limit, extra connections are created for
+    bursts and closed again as they are released; at burst_limit, acquire()
+    waits for a release instead of opening another socket. None (default)
+    means no cap.
+    """
+
+    def __init__(self, connection_factory, max_size=128, burst_limit=None):
+        if burst_limit is not None and burst_limit < max_size:
+            raise ValueError("burst_limit must be at least max_size")
+        self.connection_factory = connection_factory
+        self.max_size = max_size
+        self.burst_limit = burst_limit
+        self.created = 0
+        self._idle = deque()
+        self._in_use = 0
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+
+    def acquire(self, timeout=None):
+        """
+        Return an idle connection, or create a new one if none is available.
+
+        If burst_limit connections are already open, waits up to timeout
+        seconds (forever if None) for one to be released.
+        """
+        with self._lock:
+            while True:
+                while self._idle:
+                    conn = self._idle.pop()  # Most recently used first
+                    if not getattr(conn, 'closed', False):
+                        self._in_use += 1
+                        return conn
+                if self.burst_limit is None or self._in_use < self.burst_limit:
+                    break
+                if not self._released.wait(timeout):
+                    raise TimeoutError(
+                        f"No connection released within {timeout}s "
+                        f"(burst_limit={self.burst_limit})"
+                    )
+            self._in_use += 1
+            self.created += 1
+        try:
+            return self.connection_factory()
+        except BaseException:
+            self._discard()
+            raise
+
+    def release(self, conn):
+        """Return a connection to the pool for reuse"""
+        if getattr(conn, 'closed', False):
+            self._discard()
+            return
+        evicted = None
+        with self._lock:
+            self._in_use -= 1
+            self._idle.append(conn)
+            if len(self._idle) > self.max_size:
+                evicted = self._idle.popleft()
+            self._released.notify()
+        if evicted is not None:
+            self._close(evicted)
+
+    def _discard(self):
+        """Forget a checked-out connection that won't be returned"""
+        with self._lock:
+            self._in_use -= 1
+            self._released.notify()
+
+    @contextmanager
+    def get_connection(self, timeout=None):
+        """Borrow a connection for the duration of a with block"""
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close_all(self):
+        """Close every idle connection held by the pool"""
+        with self._lock:
+            idle, self._idle = self._idle, deque()
+        for conn in idle:
+            self._close(conn)
+
+    @staticmethod
+    def _close(conn):
+        try:
+            if hasattr(conn, 'close'):
+                conn.close()
+        except Exception:
+            pass
+
+    def __len__(self):
+        return len(self._idle)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close_all()
+        return False
+
+
+class BlobCache:
+    """
+    Client-side record of payloads already cached on a BenchmarkService.
+
+    handle(data) uploads data with put_blob() the first time a given object
+    is seen and returns the server-side handle; later calls with the same
+    object return the cached handle. Repeated calls can then pass a small
+    int instead of re-serializing and re-sending the payload.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._entries = {}  # id(data) -> (data, handle); holding data keeps the id valid
+
+    def handle(self, data):
+        """Return the server-side handle for data, uploading it on first use"""
+        entry = self._entries.get(id(data))
+        if entry is None or entry[0] is not data:
+            entry = (data, self.conn.root.put_blob(data))
+            self._entries[id(data)] = entry
+        return entry[1]
+
+    def clear(self):
+        """Release every cached payload on the server"""
+        entries, self._entries = self._entries, {}
+        for _, handle in entries.values():
+            self.conn.root.drop_blob(handle)
@@ -1,5 +1,7 @@
 """Tests for autobench automatic profiling"""
 
+from pathlib import Path
+
 import rpyc
 from rpycbench.autobench.patcher import install_patches, uninstall_patches, is_patched
 from rpycbench.utils.telemetry import enable_telemetry, get_telemetry
@@ -31,6 +33,65 @@ def test_patcher_wraps_connections():
         uninstall_patches()
 
 
+def test_patcher_install_is_idempotent_across_threads(rpyc_port):
+    """Test concurrent installs patch once and uninstall restores the original"""
+    import threading
+    from rpycbench.servers.rpyc_servers import RPyCServer
+    from rpycbench.utils.telemetry import RPyCTelemetry
+
+    original_connect = rpyc.connect
+    telemetry = RPyCTelemetry(enabled=True)
+    barrier = threading.Barrier(8)
+
+    def install():
+        barrier.wait()
+        install_patches(telemetry_inst=telemetry)
+
+    threads = [threading.Thread(target=install) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    try:
+        assert is_patched()
+        patched_connect = rpyc.connect
+        assert patched_connect is not original_connect
+        install_patches()
+        assert rpyc.connect is patched_connect
+
+        with RPyCServer(host='localhost', port=rpyc_port, mode='threaded'):
+            conn = rpyc.connect('localhost', rpyc_port)
+            assert isinstance(conn, ProfiledConnection)
+            assert conn.telemetry is telemetry
+            conn.close()
+    finally:
+        uninstall_patches()
+
+    assert rpyc.connect is original_connect
+
+
+def test_patched_connections_follow_the_global_telemetry(rpyc_port):
+    """Test patches installed without telemetry_inst record into the current global instance"""
+    from rpycbench.servers.rpyc_servers import RPyCServer
+    from rpycbench.utils.telemetry import telemetry_context
+
+    install_patches()
+    try:
+        with RPyCServer(host='localhost', port=rpyc_port, mode='threaded'):
+            with telemetry_context() as scoped:
+                conn = rpyc.connect('localhost', rpyc_port)
+                assert conn.telemetry is scoped
+                conn.close()
+
+            later = enable_telemetry()
+            conn = rpyc.connect('localhost', rpyc_port)
+            assert conn.telemetry is later
+            conn.close()
+    finally:
+        uninstall_patches()
+
+
 def test_marker_manager():
     """Test marker manager tracks critical sections"""
     manager = get_marker_manager()
@@ -110,3 +171,34 @@ def test_nested_markers():
     assert markers[0].name == "Outer"
     assert markers[1].name == "Inner"
     assert markers[1].parent_marker == "Outer"
+
+
+def test_run_script_as_main_with_cached_bytecode(tmp_path, monkeypatch):
+    """Test scripts run as __main__ and their bytecode is reused across runs"""
+    import importlib.util
+    import sys
+    from rpycbench.autobench.__main__ import run_script
+
+    script = tmp_path / 'script.py'
+    out = tmp_path / 'out.txt'
+    script.write_text(
+        "import pickle\n"
+        "class Point:\n"
+        "    pass\n"
+        "pickle.dumps(Point())\n"
+        f"open({str(out)!r}, 'a').write(__name__ + '\\n')\n"
+    )
+    monkeypatch.setattr(sys, 'dont_write_bytecode', False)
+
+    saved_main = sys.modules['__main__']
+    try:
+        run_script(script)
+        cached = Path(importlib.util.cache_from_source(str(script)))
+        assert cached.exists()
+        mtime_ns = cached.stat().st_mtime_ns
+        run_script(script)
+        assert cached.stat().st_mtime_ns == mtime_ns
+    finally:
+        sys.modules['__main__'] = saved_main
+
+    assert out.read_text() == "__main__\n__main__\n"
@@ -9,9 +9,15 @@ from rpycbench.core.benchmark import (
     BinaryTransferBenchmark,
     ConcurrentBenchmark,
     BenchmarkContext,
+    ChunkedPayload,
 )
 from rpycbench.servers.rpyc_servers import RPyCServer, create_rpyc_connection
-from rpycbench.servers.http_servers import HTTPBenchmarkServer, create_http_session
+from rpycbench.servers.http_servers import (
+    HTTPBenchmarkServer,
+    create_http_session,
+    download_chunks,
+    upload_chunks,
+)
 
 
 class TestConnectionBenchmark:
@@ -53,6 +59,28 @@ class TestConnectionBenchmark:
             assert 'connection_time' in stats
             assert stats['connection_time']['count'] == 10
 
+    def test_teardown_closes_connections_that_can_close(self):
+        """Test teardown closes each closable connection once and skips the rest"""
+        closed = []
+
+        class Closable:
+            def close(self):
+                closed.append(self)
+
+        factories = iter([Closable, object, Closable])
+        bench = ConnectionBenchmark(
+            name="Test Close",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=lambda: next(factories)(),
+            num_connections=3,
+        )
+
+        bench.execute()
+
+        assert len(closed) == 2
+        assert all(isinstance(conn, Closable) for conn in closed)
+
 
 class TestLatencyBenchmark:
     """Test latency benchmarking"""
@@ -100,6 +128,167 @@ class TestLatencyBenchmark:
             assert 'latency' in stats
             assert stats['latency']['count'] == 50
 
+    def test_warmup_until_stable(self):
+        """Test CV-based warmup stops at the first stable batch, or at the cap"""
+        import time as _time
+
+        def make_request(noisy_batches):
+            calls = {"n": 0}
+
+            def request(conn):
+                calls["n"] += 1
+                # Alternate 0 / 4ms sleeps until the noisy batches are done,
+                # then a steady 1ms per request
+                if calls["n"] > noisy_batches * 5:
+                    _time.sleep(0.001)
+                elif calls["n"] % 2:
+                    _time.sleep(0.004)
+            return request
+
+        for noisy_batches, expected in ((2, 15), (10, 50)):
+            bench = LatencyBenchmark(
+                name="Test Warmup",
+                protocol="custom",
+                server_mode=None,
+                connection_factory=lambda: None,
+                request_func=make_request(noisy_batches),
+                num_requests=1,
+                warmup_requests=5,
+                warmup_cv=0.5,
+            )
+            metrics = bench.execute()
+            assert metrics.metadata['warmup_requests'] == expected
+
+    def test_batched_timing(self):
+        """Test batch_size times requests in batches and records the batch mean"""
+        calls = {"n": 0}
+
+        def request(conn):
+            calls["n"] += 1
+
+        bench = LatencyBenchmark(
+            name="Test Batched",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=lambda: None,
+            request_func=request,
+            num_requests=25,
+            warmup_requests=0,
+            batch_size=10,
+        )
+        metrics = bench.execute()
+
+        assert calls["n"] == 25
+        assert metrics.total_requests == 25
+        assert metrics.failed_requests == 0
+        assert metrics.metadata['latency_batch_size'] == 10
+        # One distinct value per batch of 10, 10 and 5 requests
+        latencies = metrics.latencies.tolist()
+        assert len(latencies) == 25
+        assert [len(set(latencies[:10])), len(set(latencies[10:20])), len(set(latencies[20:]))] == [1, 1, 1]
+
+        with pytest.raises(ValueError):
+            LatencyBenchmark(
+                name="Invalid", protocol="custom", server_mode=None,
+                connection_factory=lambda: None, request_func=request, batch_size=0,
+            )
+
+    def test_batched_timing_skips_batches_with_failures(self):
+        """Test a batch with a failed request records no latencies"""
+        calls = {"n": 0}
+
+        def request(conn):
+            calls["n"] += 1
+            if calls["n"] % 7 == 0:
+                time.sleep(0.05)
+                raise RuntimeError("boom")
+
+        bench = LatencyBenchmark(
+            name="Test Batched Failures",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=lambda: None,
+            request_func=request,
+            num_requests=30,
+            warmup_requests=0,
+            batch_size=5,
+        )
+        metrics = bench.execute()
+
+        # Requests 7, 14, 21 and 28 fail, in batches 2, 3, 5 and 6
+        assert calls["n"] == 30
+        assert metrics.total_requests == 26
+        assert metrics.failed_requests == 4
+        # Only batches 1 and 4 are clean; the slow failures never show up
+        latencies = metrics.latencies.tolist()
+        assert len(latencies) == 10
+        assert max(latencies) < 0.05
+
+    def test_request_func_factory_binds_once(self, rpyc_port):
+        """Test request_func_factory is called once and its callable reused"""
+        factory_calls = []
+
+        def factory(conn):
+            factory_calls.append(conn)
+            return conn.root.ping
+
+        with RPyCServer(host='localhost', port=rpyc_port, mode='threaded'):
+            bench = LatencyBenchmark(
+                name="Test Latency",
+                protocol="rpyc",
+                server_mode="threaded",
+                connection_factory=lambda: create_rpyc_connection('localhost', rpyc_port),
+                request_func_factory=factory,
+                num_requests=20,
+                warmup_requests=2,
+            )
+            stats = bench.execute().compute_statistics()
+
+        assert len(factory_calls) == 1
+        assert stats['latency']['count'] == 20
+        assert bench.metrics.failed_requests == 0
+
+        with pytest.raises(ValueError):
+            LatencyBenchmark(
+                name="Bad", protocol="rpyc", server_mode=None,
+                connection_factory=lambda: None,
+            )
+
+    def test_benchmarks_share_pooled_connection(self, rpyc_port):
+        """Test benchmarks given one connection_pool reuse a single connection"""
+        from rpycbench.servers.rpyc_servers import ConnectionPool
+
+        factory = lambda: create_rpyc_connection('localhost', rpyc_port)
+        with RPyCServer(host='localhost', port=rpyc_port, mode='threaded'):
+            with ConnectionPool(factory, max_size=1) as pool:
+                for _ in range(2):
+                    bench = LatencyBenchmark(
+                        name="Test Latency",
+                        protocol="rpyc",
+                        server_mode="threaded",
+                        connection_factory=factory,
+                        connection_pool=pool,
+                        request_func_factory=lambda conn: conn.root.ping,
+                        num_requests=5,
+                    )
+                    assert bench.execute().total_requests == 5
+
+                bench = BandwidthBenchmark(
+                    name="Test Bandwidth",
+                    protocol="rpyc",
+                    server_mode="threaded",
+                    connection_factory=factory,
+                    connection_pool=pool,
+                    upload_func=lambda conn, data: conn.root.upload(data),
+                    download_func=lambda conn, size: conn.root.download(size),
+                    data_sizes=[1024],
+                    iterations=2,
+                )
+                bench.execute()
+
+                assert pool.created == 1
+                assert len(pool) == 1
+
 
 class TestBandwidthBenchmark:
     """Test bandwidth benchmarking"""
@@ -126,6 +315,90 @@ class TestBandwidthBenchmark:
             assert stats['upload_bandwidth']['mean'] > 0
             assert stats['download_bandwidth']['mean'] > 0
 
+    def test_socket_tuning_applied_in_setup(self, rpyc_port):
+        """Test socket buffer sizes are set on the connection and recorded"""
+        import socket
+
+        with RPyCServer(host='localhost', port=rpyc_port, mode='threaded'):
+            bench = BandwidthBenchmark(
+                name="Test Tuning",
+                protocol="rpyc",
+                server_mode="threaded",
+                connection_factory=lambda: create_rpyc_connection('localhost', rpyc_port),
+                upload_func=lambda conn, data: conn.root.upload(data),
+                download_func=lambda conn, size: conn.root.download(size),
+                data_sizes=[1024],
+                iterations=1,
+                socket_tuning={'sndbuf': 256 * 1024, 'rcvbuf': 128 * 1024},
+            )
+
+            bench.setup()
+            sock = bench.connection._channel.stream.sock
+            tuning = bench.metrics.metadata['socket_tuning']
+            assert tuning['sndbuf'] == sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+            assert tuning['rcvbuf'] == sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+            assert tuning['sndbuf'] >= 128 * 1024
+            bench.run()
+            bench.teardown()
+
+        with pytest.raises(ValueError):
+            BandwidthBenchmark(
+                name="Bad Tuning",
+                protocol="rpyc",
+                server_mode=None,
+                connection_factory=lambda: None,
+                upload_func=lambda conn, data: None,
+                download_func=lambda conn, size: b'',
+                socket_tuning={'sndbuff': 1},
+            )
+
+    def test_interleaved_with_warmup(self):
+        """Test warmup pairs are untimed and timed transfers alternate direction"""
+        calls = []
+        bench = BandwidthBenchmark(
+            name="Test Interleaved",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=lambda: None,
+            upload_func=lambda conn, data: calls.append(('up', len(data))),
+            download_func=lambda conn, size: calls.append(('down', size)) or b'x' * size,
+            data_sizes=[10, 20],
+            iterations=2,
+            interleaved=True,
+            warmup_iterations=1,
+        )
+
+        metrics = bench.execute()
+
+        per_size = lambda size: [('up', size), ('down', size)] * 3
+        assert calls == per_size(10) + per_size(20)
+        assert len(metrics.upload_bandwidth) == 4
+        assert len(metrics.download_bandwidth) == 4
+
+    def test_upload_payloads_built_in_setup(self):
+        """Test each size uploads a bytes payload of that size, built before run()"""
+        uploads = []
+        bench = BandwidthBenchmark(
+            name="Test Payloads",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=lambda: None,
+            upload_func=lambda conn, data: uploads.append(data),
+            download_func=lambda conn, size: b'x' * size,
+            data_sizes=[10, 1000, 100],
+            iterations=2,
+        )
+
+        bench.setup()
+        payloads = dict(bench._payloads)
+        bench.run()
+        bench.teardown()
+
+        assert [len(data) for data in uploads] == [10, 10, 1000, 1000, 100, 100]
+        assert all(type(data) is bytes and data == b'x' * len(data) for data in uploads)
+        assert uploads[0] is payloads[10]
+        assert bench._payloads == {}
+
     def test_http_bandwidth_benchmark(self, http_port):
         """Test HTTP bandwidth measurement"""
         with HTTPBenchmarkServer(host='localhost', port=http_port):
@@ -194,14 +467,12 @@ class TestBinaryTransferBenchmark:
                 connection_factory=lambda: create_http_session(),
                 upload_func=lambda session, data: session.post(f'http://localhost:{http_port}/upload-file', data=data),
                 download_func=lambda session, size: session.get(f'http://localhost:{http_port}/download-file/{size}').content,
-                upload_chunked_func=lambda session, chunks: session.post(
-                    f'http://localhost:{http_port}/upload-file-chunked',
-                    json={'chunks': [chunk.hex() for chunk in chunks]}
+                upload_chunked_func=lambda session, chunks: upload_chunks(
+                    session, f'http://localhost:{http_port}/upload-file-chunked', chunks
+                ),
+                download_chunked_func=lambda session, size, chunk_size: download_chunks(
+                    session, f'http://localhost:{http_port}/download-file-chunked/{size}/{chunk_size}'
                 ),
-                download_chunked_func=lambda session, size, chunk_size: [
-                    bytes.fromhex(chunk) for chunk in
-                    session.get(f'http://localhost:{http_port}/download-file-chunked/{size}/{chunk_size}').json()['chunks']
-                ],
                 file_sizes=[102_400, 1_048_576],
                 chunk_size=8_192,
                 iterations=2,
@@ -216,6 +487,25 @@ class TestBinaryTransferBenchmark:
             assert 'upload_bandwidth' in stats
             assert 'download_bandwidth' in stats
             assert len(metrics.metadata['transfer_results']) > 0
+            assert not metrics.metadata.get('errors')
+
+            chunked_downloads = [r for r in metrics.metadata['transfer_results'] if r['type'] == 'download_chunked']
+            assert len(chunked_downloads) == 4
+            for r in chunked_downloads:
+                assert r['num_chunks'] == -(-r['file_size'] // 8_192)
+
+    def test_http_chunked_empty_round_trip(self, http_port):
+        """Test a 0-byte chunked upload and download (X-Chunk-Size: 0) succeed"""
+        base_url = f'http://localhost:{http_port}'
+        with HTTPBenchmarkServer(host='localhost', port=http_port):
+            session = create_http_session()
+
+            response = upload_chunks(session, f'{base_url}/upload-file-chunked', ChunkedPayload(b'', 8_192))
+            assert response.status_code == 200
+            assert response.json() == {'size': 0, 'chunks': 0}
+
+            assert download_chunks(session, f'{base_url}/download-file-chunked/0/0') == []
+            session.close()
 
     def test_binary_transfer_no_chunked(self, rpyc_port):
         """Test binary transfer without chunked mode"""
@@ -244,6 +534,63 @@ class TestBinaryTransferBenchmark:
             assert len(download_results) == 2
             assert len(chunked_results) == 0
 
+    def test_downloads_released_before_the_next(self):
+        """Test each downloaded payload is dropped before the next download starts"""
+        import weakref
+
+        class Payload:
+            def __init__(self, chunks):
+                self.chunks = chunks
+
+            def __len__(self):
+                return self.chunks
+
+            def __iter__(self):
+                return iter([b"x"] * self.chunks)
+
+        live = []
+
+        def download(size, chunks=1):
+            assert all(ref() is None for ref in live)
+            payload = Payload(chunks)
+            live.append(weakref.ref(payload))
+            return payload
+
+        bench = BinaryTransferBenchmark(
+            name="Release",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=lambda: None,
+            upload_func=lambda conn, data: None,
+            download_func=lambda conn, size: download(size),
+            upload_chunked_func=lambda conn, chunks: None,
+            download_chunked_func=lambda conn, size, chunk_size: download(size, 3),
+            file_sizes=[1024, 2048],
+            chunk_size=512,
+            iterations=3,
+        )
+
+        metrics = bench.execute()
+
+        assert not metrics.metadata.get('errors')
+        assert len(live) == 12
+        chunked = [r for r in metrics.metadata['transfer_results'] if r['type'] == 'download_chunked']
+        assert [r['num_chunks'] for r in chunked] == [3] * 6
+
+    def test_chunked_payload_slices_lazily(self):
+        """Test chunked payload covers the buffer without copying it up front"""
+        data = bytes(range(256)) * 40
+        chunks = ChunkedPayload(data, 1000)
+
+        assert len(chunks) == 11
+        assert len(chunks[-1]) == 240
+        assert chunks[2] == data[2000:3000]
+        assert b''.join(chunks) == data
+        assert chunks.tobytes() is data
+        assert ChunkedPayload(bytearray(data), 1000).tobytes() == data
+        with pytest.raises(IndexError):
+            chunks[11]
+
 
 class TestBenchmarkContext:
     """Test context manager for custom benchmarking"""
@@ -276,6 +623,64 @@ class TestBenchmarkContext:
             assert stats['latency']['count'] == 10
             assert stats['concurrent']['total_requests'] == 10
 
+    def test_benchmark_context_fast_path(self, rpyc_port):
+        """Test timing requests without the measure_request() context manager"""
+        with RPyCServer(host='localhost', port=rpyc_port, mode='threaded'):
+            with BenchmarkContext(
+                name="Test",
+                protocol="rpyc",
+                measure_bandwidth=True,
+            ) as bench:
+                conn = create_rpyc_connection('localhost', rpyc_port)
+
+                for _ in range(10):
+                    t = bench.measure_request_fast()
+                    conn.root.ping()
+                    bench.record_elapsed(t)
+
+                t = bench.measure_request_fast()
+                conn.root.upload(b'x' * 1024)
+                bench.record_elapsed(t, bytes_sent=1024, success=False)
+
+                conn.close()
+
+            metrics = bench.get_results()
+            stats = metrics.compute_statistics()
+
+            assert stats['latency']['count'] == 11
+            assert stats['latency']['min'] > 0
+            assert len(metrics.upload_bandwidth) == 1
+            assert metrics.total_requests == 11
+            assert metrics.failed_requests == 1
+
+    def test_benchmark_context_batch(self):
+        """Test batched samples are recorded on exit, even after an error"""
+        with BenchmarkContext(name="Test", protocol="custom", measure_system=False) as bench:
+            with bench.measure_requests_batch() as samples:
+                samples.extend([1000, 2000, 3000])
+                assert len(bench.metrics.latencies) == 0
+
+            with pytest.raises(RuntimeError):
+                with bench.measure_requests_batch() as samples:
+                    samples.append(4000)
+                    raise RuntimeError("boom")
+
+        metrics = bench.get_results()
+        assert metrics.latencies.tolist() == pytest.approx([1e-6, 2e-6, 3e-6, 4e-6])
+        assert metrics.total_requests == 4
+
+    def test_system_sampled_off_the_timed_window(self):
+        """Test system metrics are sampled in the background while the context runs"""
+        with BenchmarkContext(name="Test", protocol="custom") as bench:
+            assert bench._sampler.is_alive()
+            time.sleep(0.35)
+
+        metrics = bench.get_results()
+        assert bench._sampler is None
+        assert metrics.get_duration() < 0.45
+        assert len(metrics.cpu_usage) >= 2
+        assert len(metrics.cpu_usage) == len(metrics.memory_usage)
+
     def test_benchmark_context_bandwidth(self, rpyc_port, test_data_small):
         """Test bandwidth measurement with context manager"""
         with RPyCServer(host='localhost', port=rpyc_port, mode='threaded'):
@@ -298,3 +703,40 @@ class TestBenchmarkContext:
 
             assert 'upload_bandwidth' in stats
             assert stats['upload_bandwidth']['mean'] > 0
+
+
+class TestPackageImports:
+    """Test the top-level package API"""
+
+    def test_top_level_names_load_lazily(self):
+        """Test importing rpycbench defers its submodules until first use"""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, rpycbench\n"
+            "assert 'rpycbench.core.benchmark' not in sys.modules\n"
+            "assert 'rpyc' not in sys.modules\n"
+            "from rpycbench import ConcurrentBenchmark, RPyCTelemetry, mark\n"
+            "assert ConcurrentBenchmark.__module__ == 'rpycbench.core.benchmark'\n"
+            "assert set(rpycbench.__all__) <= set(dir(rpycbench))\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+        import rpycbench
+        with pytest.raises(AttributeError):
+            rpycbench.NoSuchName
+
+    def test_graphs_module_defers_matplotlib(self):
+        """Test importing the graph module does not import matplotlib"""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from rpycbench.analysis.graphs import GraphGenerator, generate_graphs_from_json\n"
+            "import rpycbench.runners.sweep\n"
+            "import rpycbench.autobench\n"
+            "assert 'matplotlib' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
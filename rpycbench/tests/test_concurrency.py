@@ -2,9 +2,18 @@
 
 import pytest
 import time
-from rpycbench.core.benchmark import ConcurrentBenchmark
+import rpyc
+from rpycbench.core.benchmark import (
+    AsyncConcurrentBenchmark,
+    ConcurrentBenchmark,
+    create_client_executor,
+)
 from rpycbench.servers.rpyc_servers import RPyCServer, create_rpyc_connection
-from rpycbench.servers.http_servers import HTTPBenchmarkServer, create_http_session
+from rpycbench.servers.http_servers import (
+    HTTPBenchmarkServer,
+    create_http_session,
+    open_async_http_connection,
+)
 
 
 class TestHighConcurrency:
@@ -128,6 +137,33 @@ class TestPerConnectionMetrics:
                 assert "connection_time" in conn_metrics
                 assert "total_duration" in conn_metrics
 
+    def test_per_connection_histograms_without_samples(self, rpyc_port):
+        """Test per_connection_samples=False keeps histograms but no raw latencies"""
+        with RPyCServer(host="localhost", port=rpyc_port, mode="threaded"):
+            bench = ConcurrentBenchmark(
+                name="Per Connection Histograms",
+                protocol="rpyc",
+                server_mode="threaded",
+                connection_factory=lambda: create_rpyc_connection(
+                    "localhost", rpyc_port
+                ),
+                request_func=lambda conn: conn.root.ping(),
+                num_clients=8,
+                requests_per_client=5,
+                track_per_connection=True,
+                per_connection_samples=False,
+            )
+
+            metrics = bench.execute()
+
+            for conn_metrics in bench.get_per_connection_metrics():
+                assert "latencies" not in conn_metrics
+                assert conn_metrics["latency_histogram"].count == 5
+
+            histogram = bench.get_latency_histogram()
+            assert histogram.count == len(metrics.latencies) == 8 * 5
+            assert len(histogram.counts) == len(histogram.buckets) + 1
+
     def test_per_connection_tracking_disabled(self, rpyc_port):
         """Test per-connection metrics not collected when disabled"""
         with RPyCServer(host="localhost", port=rpyc_port, mode="threaded"):
@@ -178,6 +214,390 @@ class TestPerConnectionMetrics:
                 f"\nSlowest client: #{slowest['client_id']} took {slowest['total_duration']:.3f}s"
             )
 
+    def test_request_func_factory(self, rpyc_port):
+        """Test each client builds its request callable once after connecting"""
+        bound = []
+
+        def factory(conn):
+            ping = conn.root.ping
+            bound.append(ping)
+            return ping
+
+        with RPyCServer(host="localhost", port=rpyc_port, mode="threaded"):
+            bench = ConcurrentBenchmark(
+                name="Request Factory",
+                protocol="rpyc",
+                server_mode="threaded",
+                connection_factory=lambda: create_rpyc_connection(
+                    "localhost", rpyc_port
+                ),
+                request_func_factory=factory,
+                num_clients=5,
+                requests_per_client=10,
+            )
+
+            metrics = bench.execute()
+
+            assert len(bound) == 5
+            assert metrics.total_requests == 50
+            assert metrics.failed_requests == 0
+
+        with pytest.raises(ValueError):
+            ConcurrentBenchmark(
+                name="Both",
+                protocol="rpyc",
+                server_mode=None,
+                connection_factory=lambda: None,
+                request_func=lambda conn: None,
+                request_func_factory=lambda conn: (lambda: None),
+            )
+
+    def test_per_connection_arrays(self, rpyc_port):
+        """Test column-wise per-connection metrics match the per-client dicts"""
+        with RPyCServer(host="localhost", port=rpyc_port, mode="threaded"):
+            bench = ConcurrentBenchmark(
+                name="Per Connection Arrays",
+                protocol="rpyc",
+                server_mode="threaded",
+                connection_factory=lambda: create_rpyc_connection(
+                    "localhost", rpyc_port
+                ),
+                request_func=lambda conn: conn.root.ping(),
+                num_clients=10,
+                requests_per_client=5,
+                track_per_connection=True,
+            )
+
+            bench.execute()
+            per_conn = bench.get_per_connection_metrics()
+            arrays = bench.get_per_connection_arrays()
+
+            assert len(arrays) == 10
+            assert arrays.client_id.tolist() == list(range(10))
+            assert arrays.total_requests.sum() == 50
+            assert arrays.connection_time.tolist() == [c["connection_time"] for c in per_conn]
+            slowest = max(per_conn, key=lambda c: c["total_duration"])
+            assert arrays.total_duration.argmax() == slowest["client_id"]
+
+
+    def test_request_errors_kept_only_when_tracking(self):
+        """Test per-request error messages are only collected with track_per_connection"""
+        def request(conn):
+            conn["calls"] += 1
+            if conn["calls"] % 2 == 0:
+                raise RuntimeError("boom")
+
+        for track in (True, False):
+            bench = ConcurrentBenchmark(
+                name="Request Errors",
+                protocol="custom",
+                server_mode=None,
+                connection_factory=lambda: {"calls": 0},
+                request_func=request,
+                num_clients=2,
+                requests_per_client=4,
+                track_per_connection=track,
+            )
+
+            metrics = bench.execute()
+
+            assert metrics.total_requests == 4
+            assert metrics.failed_requests == 4
+            if track:
+                per_conn = bench.get_per_connection_metrics()
+                assert [c["errors"] for c in per_conn] == [["Request 1: boom", "Request 3: boom"]] * 2
+                assert [c["total_requests"] for c in per_conn] == [2, 2]
+                for c in per_conn:
+                    assert c["end_time"] - c["start_time"] == pytest.approx(c["total_duration"], abs=1e-6)
+                    assert 0 <= c["connection_time"] <= c["total_duration"]
+
+    def test_throughput_over_monotonic_span(self):
+        """Test aggregate throughput is measured from the first client start to the last end"""
+        bench = ConcurrentBenchmark(
+            name="Span",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=lambda: None,
+            request_func=lambda conn: time.sleep(0.001),
+            num_clients=3,
+            requests_per_client=5,
+            track_per_connection=True,
+        )
+
+        metrics = bench.execute()
+
+        per_conn = bench.get_per_connection_metrics()
+        span_ns = max(c["end_ns"] for c in per_conn) - min(c["start_ns"] for c in per_conn)
+        for c in per_conn:
+            assert (c["end_ns"] - c["start_ns"]) * 1e-9 == pytest.approx(c["total_duration"])
+        assert metrics.metadata['clients_span'] == pytest.approx(span_ns * 1e-9)
+        assert metrics.metadata['throughput_rps'] == pytest.approx(15 / (span_ns * 1e-9))
+
+class TestSharedExecutor:
+    """Test running concurrent clients on a caller-owned thread pool"""
+
+    def test_executor_reused_across_runs(self):
+        """Test benchmarks reuse a shared executor and leave it open"""
+        import threading
+
+        thread_names = set()
+
+        def request(conn):
+            thread_names.add(threading.current_thread().name)
+
+        with create_client_executor(4) as executor:
+            for run in range(2):
+                bench = ConcurrentBenchmark(
+                    name=f"Shared Executor {run}",
+                    protocol="custom",
+                    server_mode=None,
+                    connection_factory=object,
+                    request_func=request,
+                    num_clients=8,
+                    requests_per_client=5,
+                    executor=executor,
+                )
+                metrics = bench.execute()
+                assert metrics.total_requests == 8 * 5
+
+            # Still usable: the benchmarks did not shut it down
+            assert executor.submit(lambda: 42).result() == 42
+
+        assert 0 < len(thread_names) <= 4
+        assert all(name.startswith("rpycbench") for name in thread_names)
+
+    def test_progress_callback_replaces_printing(self, capsys):
+        """Test progress goes to the callback for every client, not to stdout"""
+        progress = []
+        bench = ConcurrentBenchmark(
+            name="Progress",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=object,
+            request_func=lambda conn: None,
+            num_clients=25,
+            requests_per_client=1,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        bench.execute()
+
+        assert progress == [(i, 25) for i in range(1, 26)]
+        assert "clients completed..." not in capsys.readouterr().out
+
+    def test_worker_exception_counts_as_client_error(self):
+        """Test a client whose worker raises is recorded as failed, not lost"""
+
+        class FlakyBenchmark(ConcurrentBenchmark):
+            def _client_worker(self, client_id):
+                if client_id == 3:
+                    raise RuntimeError("worker crashed")
+                return super()._client_worker(client_id)
+
+        bench = FlakyBenchmark(
+            name="Flaky Worker",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=object,
+            request_func=lambda conn: None,
+            num_clients=6,
+            requests_per_client=2,
+        )
+
+        metrics = bench.execute()
+
+        assert metrics.total_requests == 5 * 2
+        assert metrics.failed_requests == 2
+        assert metrics.metadata["errors"] == ["worker crashed"]
+
+    @pytest.mark.skipif(
+        not hasattr(__import__("os"), "sched_setaffinity"),
+        reason="thread pinning needs sched_setaffinity",
+    )
+    def test_pinned_threads_run_on_one_cpu(self):
+        """Test pin_threads pins each worker thread to a single CPU"""
+        import os
+
+        with create_client_executor(2, pin_threads=True) as executor:
+            affinity = executor.submit(os.sched_getaffinity, 0).result()
+
+        assert len(affinity) == 1
+        assert affinity <= os.sched_getaffinity(0)
+
+
+    def test_process_pool_clients(self):
+        """Test pool_type='process' runs clients outside the calling process"""
+        import os
+
+        bench = ConcurrentBenchmark(
+            name="Process Clients",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=os.getpid,
+            request_func=_fail_with_connection,
+            num_clients=4,
+            requests_per_client=3,
+            max_workers=2,
+            track_per_connection=True,
+            pool_type="process",
+        )
+
+        metrics = bench.execute()
+
+        assert metrics.failed_requests == 4 * 3
+        per_conn = bench.get_per_connection_metrics()
+        assert [c["client_id"] for c in per_conn] == [0, 1, 2, 3]
+        pids = {int(c["errors"][0].split(": ")[1]) for c in per_conn}
+        assert os.getpid() not in pids
+        assert 1 <= len(pids) <= 2
+
+    def test_process_pool_latencies_via_shared_memory(self):
+        """Test worker processes hand their latencies back through the shared array"""
+        bench = ConcurrentBenchmark(
+            name="Process Latencies",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=object,
+            request_func=_sleep_briefly,
+            num_clients=4,
+            requests_per_client=3,
+            max_workers=2,
+            track_per_connection=True,
+            pool_type="process",
+        )
+
+        metrics = bench.execute()
+
+        assert metrics.total_requests == 12
+        assert len(metrics.latencies) == 12
+        assert min(metrics.latencies.tolist()) >= 0.001
+        for c in bench.get_per_connection_metrics():
+            assert len(c["latencies"]) == 3
+            assert c["latency_histogram"].count == 3
+
+    def test_process_pool_requires_picklable_callables(self):
+        """Test lambdas are refused up front, and progress_callback may be one"""
+        kwargs = dict(name="Process Pickling", protocol="custom", server_mode=None, pool_type="process")
+        with pytest.raises(ValueError, match="connection_factory"):
+            ConcurrentBenchmark(connection_factory=lambda: None, request_func=_sleep_briefly, **kwargs)
+        with pytest.raises(ValueError, match="request_func_factory"):
+            ConcurrentBenchmark(
+                connection_factory=object, request_func_factory=lambda conn: _sleep_briefly, **kwargs
+            )
+
+        progress = []
+        bench = ConcurrentBenchmark(
+            connection_factory=object,
+            request_func=_sleep_briefly,
+            num_clients=2,
+            requests_per_client=1,
+            max_workers=2,
+            progress_callback=lambda completed, total: progress.append(completed),
+            **kwargs,
+        )
+        metrics = bench.execute()
+
+        assert metrics.total_requests == 2
+        assert progress == [1, 2]
+
+    def test_process_pool_rejects_connection_pool(self):
+        """Test a connection pool can't be combined with worker processes"""
+        with pytest.raises(ValueError):
+            ConcurrentBenchmark(
+                name="Process Pool",
+                protocol="custom",
+                server_mode=None,
+                connection_factory=object,
+                request_func=_fail_with_connection,
+                connection_pool=object(),
+                pool_type="process",
+            )
+
+class TestSynchronizedStart:
+    """Test releasing every client into its request loop at once"""
+
+    def _connect_slowly(self, connected):
+        """Connection factory whose clients connect one after another; the third fails"""
+        import threading
+
+        lock = threading.Lock()
+
+        def factory():
+            with lock:
+                time.sleep(0.01)
+                connected.append(time.perf_counter())
+                if len(connected) == 3:
+                    raise ConnectionError("refused")
+            return None
+
+        return factory
+
+    def test_clients_start_requests_together(self):
+        """Test no request is sent before the last client has connected"""
+        connected, first_requests = [], []
+
+        bench = ConcurrentBenchmark(
+            name="Synchronized",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=self._connect_slowly(connected),
+            request_func=lambda conn: first_requests.append(time.perf_counter()),
+            num_clients=150,
+            requests_per_client=2,
+            synchronized_start=True,
+        )
+
+        metrics = bench.execute()
+
+        assert bench.max_workers == 150  # Not capped at 128: every client needs a thread
+        assert metrics.total_requests == 298
+        assert min(first_requests) >= max(connected)
+        assert bench._start_barrier is None
+
+    def test_async_clients_start_requests_together(self):
+        """Test the coroutine clients wait for each other the same way"""
+        connected, first_requests = [], []
+
+        async def request(conn):
+            first_requests.append(time.perf_counter())
+
+        bench = AsyncConcurrentBenchmark(
+            name="Async Synchronized",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=self._connect_slowly(connected),
+            request_func=request,
+            num_clients=5,
+            requests_per_client=2,
+            synchronized_start=True,
+        )
+
+        metrics = bench.execute()
+
+        assert metrics.total_requests == 8
+        assert min(first_requests) >= max(connected)
+
+    def test_rejects_pools_that_cannot_hold_every_client(self):
+        """Test synchronized_start refuses configurations that would deadlock"""
+        import concurrent.futures
+
+        kwargs = dict(
+            name="Invalid",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=lambda: None,
+            request_func=lambda conn: None,
+            num_clients=4,
+            synchronized_start=True,
+        )
+        with pytest.raises(ValueError):
+            ConcurrentBenchmark(max_workers=2, **kwargs)
+        with pytest.raises(ValueError):
+            ConcurrentBenchmark(pool_type="process", **kwargs)
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            with pytest.raises(ValueError):
+                ConcurrentBenchmark(executor=executor, **kwargs)
+
 
 class TestServerModeComparison:
     """Test comparing different server modes under load"""
@@ -215,3 +635,161 @@ class TestServerModeComparison:
             f"\nThreaded latency: {results['threaded']['latency']['mean']*1000:.2f}ms"
         )
         print(f"Forking latency: {results['forking']['latency']['mean']*1000:.2f}ms")
+
+
+class TestAsyncConcurrency:
+    """Test the asyncio-driven concurrent client driver"""
+
+    def test_async_rpyc_clients(self, rpyc_port):
+        """Test coroutine clients awaiting rpyc async results on one loop"""
+        with RPyCServer(host="localhost", port=rpyc_port, mode="threaded"):
+            bench = AsyncConcurrentBenchmark(
+                name="Async Concurrent",
+                protocol="rpyc",
+                server_mode="threaded",
+                connection_factory=lambda: create_rpyc_connection(
+                    "localhost", rpyc_port
+                ),
+                request_func=lambda conn: rpyc.async_(conn.root.echo)(b"data"),
+                num_clients=32,
+                requests_per_client=10,
+                track_per_connection=True,
+            )
+
+            metrics = bench.execute()
+            stats = metrics.compute_statistics()
+
+            assert stats["concurrent"]["total_requests"] == 32 * 10
+            assert metrics.failed_requests == 0
+            assert len(bench.get_per_connection_metrics()) == 32
+
+    def test_async_http_clients(self, http_port):
+        """Test HTTP clients on asyncio streams with an awaitable connection_factory"""
+        import json
+
+        with HTTPBenchmarkServer(host="localhost", port=http_port):
+            responses = []
+
+            async def ping(conn):
+                responses.append(await conn.request("GET", "/ping"))
+
+            bench = AsyncConcurrentBenchmark(
+                name="Async HTTP",
+                protocol="http",
+                server_mode="threaded",
+                connection_factory=lambda: open_async_http_connection(
+                    "localhost", http_port
+                ),
+                request_func=ping,
+                num_clients=16,
+                requests_per_client=5,
+                track_per_connection=True,
+            )
+
+            metrics = bench.execute()
+
+            assert metrics.total_requests == 16 * 5
+            assert metrics.failed_requests == 0
+            assert len(metrics.connection_times) == 16
+            assert {json.loads(body)["response"] for body in responses} == {"pong"}
+
+    def test_async_coroutine_request_func(self):
+        """Test coroutine request functions and error accounting"""
+        import asyncio
+
+        async def request(conn):
+            await asyncio.sleep(0)
+            if conn["calls"] == 2:
+                conn["calls"] += 1
+                raise RuntimeError("boom")
+            conn["calls"] += 1
+
+        bench = AsyncConcurrentBenchmark(
+            name="Async Coroutines",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=lambda: {"calls": 0},
+            request_func=request,
+            num_clients=4,
+            requests_per_client=5,
+        )
+
+        metrics = bench.execute()
+
+        assert metrics.total_requests == 4 * 4
+        assert metrics.failed_requests == 4
+        assert len(metrics.latencies) == 16
+        assert metrics.metadata["event_loop"] in ("asyncio", "uvloop")
+
+    def test_async_without_uvloop(self):
+        """Test use_uvloop=False always runs on the stock asyncio loop"""
+        bench = AsyncConcurrentBenchmark(
+            name="Async Stock Loop",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=lambda: None,
+            request_func=lambda conn: None,
+            num_clients=2,
+            requests_per_client=3,
+            use_uvloop=False,
+        )
+
+        metrics = bench.execute()
+
+        assert metrics.metadata["event_loop"] == "asyncio"
+        assert metrics.total_requests == 6
+
+    def test_async_runs_every_client_at_once(self):
+        """Test the async variant is not capped at 128 clients by default"""
+        import asyncio
+
+        state = {"active": 0, "peak": 0}
+
+        async def request(conn):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+
+        bench = AsyncConcurrentBenchmark(
+            name="Async Uncapped",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=lambda: None,
+            request_func=request,
+            num_clients=200,
+            requests_per_client=1,
+        )
+
+        metrics = bench.execute()
+
+        assert bench.max_workers == 200
+        assert state["peak"] == 200
+        assert metrics.total_requests == 200
+
+    def test_async_rejects_pool_type_and_executor(self):
+        """Test pool_type and executor, which only the threaded run uses, are refused"""
+        import concurrent.futures
+
+        kwargs = dict(
+            name="Async Invalid",
+            protocol="custom",
+            server_mode=None,
+            connection_factory=lambda: None,
+            request_func=lambda conn: None,
+        )
+        with pytest.raises(ValueError):
+            AsyncConcurrentBenchmark(pool_type="process", **kwargs)
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            with pytest.raises(ValueError):
+                AsyncConcurrentBenchmark(executor=executor, **kwargs)
+
+
+def _fail_with_connection(conn):
+    """Module-level request function, so worker processes can unpickle it"""
+    raise RuntimeError(str(conn))
+
+
+def _sleep_briefly(conn):
+    """Module-level request function that takes at least 1ms"""
+    time.sleep(0.001)
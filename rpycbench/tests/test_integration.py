@@ -41,6 +41,47 @@ class TestEndToEnd:
         assert 'latency' in comparison['rpyc_threaded']
         assert 'latency' in comparison['http_threaded']
 
+    def test_suite_progress_is_left_to_the_application(self, caplog, capsys):
+        """Test the suite only logs; the CLI runners route progress to stdout"""
+        import logging
+        from rpycbench.benchmarks.suite import logger
+        from rpycbench.runners import log_progress_to_stdout
+
+        assert logger.handlers == []
+        assert logger.propagate
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            logger.info("  - Latency benchmark (%d requests)...", 10)
+        assert caplog.messages == ["  - Latency benchmark (10 requests)..."]
+        assert capsys.readouterr().out == ""
+
+        package_logger = logging.getLogger('rpycbench')
+        handler = log_progress_to_stdout()
+        try:
+            logger.info("  - Bandwidth benchmark...")
+        finally:
+            package_logger.removeHandler(handler)
+            package_logger.setLevel(logging.NOTSET)
+        assert capsys.readouterr().out == "  - Bandwidth benchmark...\n"
+
+    def test_suite_shared_connection_toggle(self):
+        """Test reuse_connections=False gives each benchmark its own connection"""
+        opened = []
+
+        def factory():
+            opened.append(object())
+            return opened[-1]
+
+        shared = BenchmarkSuite()
+        with shared._shared_connection(factory) as pool:
+            first = pool.acquire()
+            pool.release(first)
+            assert pool.acquire() is first
+        assert len(opened) == 1
+
+        unshared = BenchmarkSuite(reuse_connections=False)
+        with unshared._shared_connection(factory) as pool:
+            assert pool is None
+
     def test_app_integration_workflow(self, rpyc_port):
         """Test integrating benchmarks into an app"""
 
@@ -1,7 +1,7 @@
 """Tests for metrics collection and statistics"""
 
 import pytest
-from rpycbench.core.metrics import BenchmarkMetrics, BenchmarkResults
+from rpycbench.core.metrics import BenchmarkMetrics, BenchmarkResults, HistogramRecorder, SampleBuffer
 import time
 
 
@@ -47,6 +47,33 @@ class TestBenchmarkMetrics:
         assert stats['latency']['p95'] > 0
         assert stats['latency']['p99'] > 0
 
+    def test_metrics_add_nanosecond_samples(self):
+        """Test integer nanosecond samples are stored in seconds"""
+        metrics = BenchmarkMetrics(name="Test", protocol="rpyc")
+
+        metrics.add_latencies_ns([1_000, 2_500_000, 3_000_000_000])
+        metrics.add_connection_times_ns([])
+        metrics.add_connection_times_ns([40_000])
+
+        assert metrics.latencies.tolist() == pytest.approx([1e-6, 2.5e-3, 3.0])
+        assert metrics.connection_times == pytest.approx([4e-5])
+        assert type(metrics.connection_times[0]) is float
+
+    def test_metrics_add_error_is_bounded(self):
+        """Test errors keep the first MAX_ERRORS truncated messages and count the rest"""
+        from rpycbench.core.metrics import MAX_ERRORS, MAX_ERROR_LENGTH
+
+        metrics = BenchmarkMetrics(name="Test", protocol="rpyc")
+        metrics.add_error(ValueError("x" * 1000), "Upload error")
+        for i in range(MAX_ERRORS + 10):
+            metrics.add_error(f"error {i}")
+
+        errors = metrics.metadata['errors']
+        assert len(errors) == MAX_ERRORS
+        assert errors[0] == ("Upload error: " + "x" * 1000)[:MAX_ERROR_LENGTH]
+        assert errors[1] == "error 0"
+        assert metrics.metadata['error_count'] == MAX_ERRORS + 11
+
     def test_metrics_add_bandwidth(self):
         """Test adding bandwidth measurements"""
         metrics = BenchmarkMetrics(name="Test", protocol="rpyc")
@@ -91,6 +118,17 @@ class TestBenchmarkMetrics:
         assert duration is not None
         assert duration >= 0.1
 
+    def test_duration_ignores_wall_clock_steps(self):
+        """Test get_duration() uses the monotonic marks, not start_time/end_time"""
+        metrics = BenchmarkMetrics(name="Test", protocol="rpyc")
+
+        metrics.start()
+        time.sleep(0.01)
+        metrics.end()
+        metrics.end_time = metrics.start_time - 3600  # As if the clock stepped back
+
+        assert 0.01 <= metrics.get_duration() < 1
+
 
 class TestBenchmarkResults:
     """Test results aggregation"""
@@ -187,6 +225,42 @@ class TestStatisticsComputation:
         # Should have some standard deviation
         assert stats['latency']['stdev'] > 0
 
+    def test_vectorized_percentiles_match_reference(self):
+        """Test vectorized latency percentiles use the same rank rule as _percentile"""
+        metrics = BenchmarkMetrics(name="Test", protocol="rpyc")
+        samples = [((i * 37) % 101) * 0.001 for i in range(1000)]
+        for sample in samples:
+            metrics.add_latency(sample)
+
+        stats = metrics.compute_statistics()
+
+        assert stats['latency']['p95'] == BenchmarkMetrics._percentile(samples, 95)
+        assert stats['latency']['p99'] == BenchmarkMetrics._percentile(samples, 99)
+        assert stats['latency']['p999'] == BenchmarkMetrics._percentile(samples, 99.9)
+
+    def test_connection_and_bandwidth_percentiles(self):
+        """Test connection time and bandwidth summaries match the reference statistics"""
+        import statistics
+
+        metrics = BenchmarkMetrics(name="Test", protocol="rpyc")
+        samples = [((i * 37) % 101) * 0.001 + 0.001 for i in range(200)]
+        metrics.connection_times.extend(samples)
+        for sample in samples:
+            metrics.add_upload_bandwidth(1, sample)
+
+        stats = metrics.compute_statistics()
+
+        conn = stats['connection_time']
+        assert conn['median'] == statistics.median(samples)
+        assert conn['mean'] == pytest.approx(statistics.mean(samples))
+        assert conn['stdev'] == pytest.approx(statistics.stdev(samples))
+        assert conn['p99'] == BenchmarkMetrics._percentile(samples, 99)
+        assert conn['count'] == 200
+
+        bandwidth = [1 / s for s in samples]
+        assert stats['upload_bandwidth']['median'] == statistics.median(bandwidth)
+        assert stats['upload_bandwidth']['p95'] == BenchmarkMetrics._percentile(bandwidth, 95)
+
     def test_success_rate_calculation(self):
         """Test success rate calculation"""
         metrics = BenchmarkMetrics(name="Test", protocol="rpyc")
@@ -207,3 +281,97 @@ class TestStatisticsComputation:
         # Should not crash, should have basic info
         assert stats['name'] == "Test"
         assert stats['protocol'] == "rpyc"
+
+
+class TestSampleBuffer:
+    """Test the array-backed latency sample buffer"""
+
+    def test_buffer_grows_past_capacity(self):
+        """Test appends beyond the initial capacity keep every sample"""
+        buf = SampleBuffer(capacity=4)
+        for i in range(10):
+            buf.append(float(i))
+
+        assert len(buf) == 10
+        assert buf[-1] == 9.0
+        assert list(buf) == [float(i) for i in range(10)]
+        assert buf.view().sum() == sum(range(10))
+
+    def test_buffer_behaves_like_list(self):
+        """Test list-style access used by existing callers"""
+        buf = SampleBuffer()
+        assert not buf
+
+        buf.extend([0.1, 0.2])
+        buf.extend(x for x in [0.3])
+
+        assert buf
+        assert buf == [0.1, 0.2, 0.3]
+        assert buf[1:] == [0.2, 0.3]
+
+    def test_reserve_preallocates_exact_capacity(self):
+        """Test reserve() sizes the buffer once and keeps existing samples"""
+        buf = SampleBuffer([1.0, 2.0], capacity=2)
+        buf.reserve(1000)
+        data = buf._data
+
+        assert len(data) == 1000
+        buf.extend([0.5] * 998)
+        assert buf._data is data
+        assert buf[:2] == [1.0, 2.0]
+
+        buf.reserve(10)
+        assert buf._data is data
+
+    def test_sorted_copy_is_cached_until_modified(self):
+        """Test sorted() reuses its result until a new sample is recorded"""
+        buf = SampleBuffer([0.3, 0.1, 0.2])
+        ordered = buf.sorted()
+        assert ordered.tolist() == [0.1, 0.2, 0.3]
+        assert buf.sorted() is ordered
+        assert buf.tolist() == [0.3, 0.1, 0.2]
+
+        buf.append(0.0)
+        assert buf.sorted().tolist() == [0.0, 0.1, 0.2, 0.3]
+
+        buf.clear()
+        assert len(buf.sorted()) == 0
+
+    def test_select_matches_sorted_order(self):
+        """Test select() reads ranks without reordering the samples"""
+        import statistics
+
+        samples = [((i * 37) % 101) * 0.001 for i in range(1000)]
+        buf = SampleBuffer(samples)
+        ranks = [0, 499, 500, 950, 999]
+
+        assert buf.select(ranks).tolist() == [sorted(samples)[r] for r in ranks]
+        assert buf.tolist() == samples
+
+        buf.sorted()
+        assert buf.select(ranks).tolist() == [sorted(samples)[r] for r in ranks]
+
+        metrics = BenchmarkMetrics(name="Test", protocol="rpyc")
+        metrics.latencies.extend(samples)
+        assert metrics.compute_statistics()['latency']['median'] == statistics.median(samples)
+
+
+class TestHistogramRecorder:
+    """Test the fixed-bucket latency histogram"""
+
+    def test_bucket_boundaries(self):
+        """Test samples land in (lower, upper] buckets with an overflow bucket"""
+        histogram = HistogramRecorder(buckets=[0.001, 0.01])
+        histogram.record_many([0.0005, 0.001, 0.002, 0.01, 0.5])
+        histogram.record(0.02)
+
+        assert histogram.counts.tolist() == [2, 2, 2]
+        assert histogram.count == 6
+
+        other = HistogramRecorder(buckets=[0.001, 0.01])
+        other.record(0.0001)
+        histogram.merge(other)
+        assert histogram.to_dict() == {'buckets': [0.001, 0.01], 'counts': [3, 2, 2]}
+
+        with pytest.raises(ValueError):
+            histogram.merge(HistogramRecorder())
@@ -4,8 +4,21 @@ import pytest
 import time
 import psutil
 import os
-from rpycbench.servers.rpyc_servers import RPyCServer, create_rpyc_connection
-from rpycbench.servers.http_servers import HTTPBenchmarkServer, create_http_session
+from rpycbench.servers.rpyc_servers import (
+    RPyCServer,
+    BlobCache,
+    ConnectionPool,
+    create_rpyc_connection,
+)
+from rpycbench.servers.http_servers import (
+    HTTPBenchmarkServer,
+    create_http_connection,
+    create_http_pool_manager,
+    create_http_session,
+    http_request,
+    open_async_http_connection,
+    send_buffers,
+)
 
 
 class TestServerProcessIsolation:
@@ -81,6 +94,56 @@ class TestServerModes:
             assert result == "pong"
             conn.close()
 
+    def test_rpyc_forking_server_multiple_acceptors(self, rpyc_port):
+        """Test SO_REUSEPORT acceptor processes share one port"""
+        with RPyCServer(host='localhost', port=rpyc_port, mode='forking', acceptors=2) as server:
+            assert len(server.server_processes) == 2
+            assert all(p.is_alive() for p in server.server_processes)
+
+            conns = [create_rpyc_connection('localhost', rpyc_port) for _ in range(8)]
+            for conn in conns:
+                assert conn.root.ping() == "pong"
+            for conn in conns:
+                conn.close()
+
+        assert not any(p.is_alive() for p in server.server_processes)
+
+    def test_rpyc_preforked_server(self, rpyc_port):
+        """Test preforked workers are started once and serve every connection"""
+        with RPyCServer(host='localhost', port=rpyc_port, mode='preforked', num_workers=2) as server:
+            assert len(server.server_processes) == 2
+            assert server.num_workers == 2
+
+            conns = [create_rpyc_connection('localhost', rpyc_port) for _ in range(8)]
+            for conn in conns:
+                assert conn.root.ping() == "pong"
+            for conn in conns:
+                conn.close()
+
+        assert not any(p.is_alive() for p in server.server_processes)
+
+    def test_rpyc_preforked_thread_pool_workers(self, rpyc_port):
+        """Test preforked workers serving requests from a fixed thread pool"""
+        with RPyCServer(host='localhost', port=rpyc_port, mode='preforked',
+                        num_workers=2, worker_threads=4) as server:
+            assert len(server.server_processes) == 2
+
+            conns = [create_rpyc_connection('localhost', rpyc_port) for _ in range(8)]
+            for conn in conns:
+                assert conn.root.ping() == "pong"
+                assert conn.root.echo(b"data") == b"data"
+            for conn in conns:
+                conn.close()
+
+    def test_num_workers_requires_preforked(self):
+        """Test num_workers and acceptors are rejected for modes that don't use them"""
+        with pytest.raises(ValueError):
+            RPyCServer(mode='threaded', num_workers=2)
+        with pytest.raises(ValueError):
+            RPyCServer(mode='forking', worker_threads=4)
+        with pytest.raises(ValueError):
+            RPyCServer(mode='preforked', acceptors=2)
+
     def test_multiple_concurrent_connections_threaded(self, rpyc_port):
         """Test multiple concurrent connections to threaded server"""
         with RPyCServer(host='localhost', port=rpyc_port, mode='threaded'):
@@ -147,6 +210,9 @@ class TestServerEndpoints:
             # Test ping
             assert conn.root.ping() == "pong"
 
+            # Test batched ping
+            assert conn.root.ping_batch(3) == ("pong", "pong", "pong")
+
             # Test echo
             test_data = b"hello world"
             assert conn.root.echo(test_data) == test_data
@@ -165,6 +231,57 @@ class TestServerEndpoints:
 
             conn.close()
 
+    def test_rpyc_batch_compute(self, rpyc_port):
+        """Test batch_compute matches per-item compute calls"""
+        with RPyCServer(host='localhost', port=rpyc_port, mode='threaded'):
+            conn = create_rpyc_connection('localhost', rpyc_port)
+            results = conn.root.batch_compute((10, 20, 30))
+            assert isinstance(results, tuple)
+            assert results == tuple(conn.root.compute(n) for n in (10, 20, 30))
+            conn.close()
+
+    def test_rpyc_connection_resolves_host_once(self, rpyc_port, monkeypatch):
+        """Test create_rpyc_connection() caches the host name lookup"""
+        import socket
+        from rpycbench.servers import rpyc_servers
+
+        lookups = []
+        getaddrinfo = socket.getaddrinfo
+
+        def counting_getaddrinfo(host, *args, **kwargs):
+            lookups.append(host)
+            return getaddrinfo(host, *args, **kwargs)
+
+        monkeypatch.setattr(socket, 'getaddrinfo', counting_getaddrinfo)
+        monkeypatch.setattr(rpyc_servers, '_ADDRINFO_CACHE', {})
+
+        with RPyCServer(host='localhost', port=rpyc_port, mode='threaded'):
+            for _ in range(3):
+                conn = create_rpyc_connection('localhost', rpyc_port)
+                assert conn.root.ping() == "pong"
+                conn.close()
+
+        assert lookups.count('localhost') == 1
+        assert rpyc_servers._ADDRINFO_CACHE == {('localhost', rpyc_port): '127.0.0.1'}
+
+    def test_rpyc_blob_cache(self, rpyc_port):
+        """Test repeated payloads are uploaded once and referenced by handle"""
+        with RPyCServer(host='localhost', port=rpyc_port, mode='threaded'):
+            conn = create_rpyc_connection('localhost', rpyc_port)
+            blobs = BlobCache(conn)
+
+            data = b"x" * 4096
+            handle = blobs.handle(data)
+            assert blobs.handle(data) == handle
+            assert blobs.handle(b"y" * 10) != handle
+            assert conn.root.upload_blob(handle) == len(data)
+
+            blobs.clear()
+            with pytest.raises(KeyError):
+                conn.root.upload_blob(handle)
+
+            conn.close()
+
     def test_http_endpoints(self, http_port):
         """Test all HTTP endpoints"""
         with HTTPBenchmarkServer(host='localhost', port=http_port):
@@ -176,6 +293,11 @@ class TestServerEndpoints:
             assert response.status_code == 200
             assert response.json()['response'] == 'pong'
 
+            # Test batched ping
+            response = session.get(f'{base_url}/ping-batch/3')
+            assert response.status_code == 200
+            assert response.json()['responses'] == ['pong'] * 3
+
             # Test echo
             test_data = b"hello world"
             response = session.post(f'{base_url}/echo', data=test_data)
@@ -199,3 +321,352 @@ class TestServerEndpoints:
             assert response.json()['result'] == expected
 
             session.close()
+
+
+class TestSocketOptions:
+    """Test latency-related socket options on benchmark connections"""
+
+    def test_rpyc_client_socket_nodelay(self, rpyc_port):
+        """Test RPyC client sockets disable Nagle's algorithm"""
+        import socket
+
+        with RPyCServer(host='localhost', port=rpyc_port, mode='threaded'):
+            conn = create_rpyc_connection('localhost', rpyc_port)
+            sock = conn._channel.stream.sock
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) != 0
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE) != 0
+            assert conn.root.ping() == "pong"
+            conn.close()
+
+
+    def test_http_raw_connection(self, http_port):
+        """Test raw http.client connections disable Nagle and survive server closes"""
+        import socket
+
+        with HTTPBenchmarkServer(host='localhost', port=http_port):
+            conn = create_http_connection('localhost', http_port)
+            assert conn.sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) != 0
+
+            for _ in range(3):
+                conn.request('GET', '/ping')
+                response = conn.getresponse()
+                assert response.status == 200
+                response.read()
+
+            conn.request('POST', '/upload', body=b"hello world")
+            response = conn.getresponse()
+            assert response.status == 200
+            response.read()
+
+            conn.close()
+
+    def test_http_request_reconnects(self, http_port):
+        """Test http_request() reopens a connection the server has dropped"""
+        import json
+        import socket
+
+        with HTTPBenchmarkServer(host='localhost', port=http_port):
+            conn = create_http_connection('localhost', http_port)
+            for _ in range(3):
+                assert json.loads(http_request(conn, 'GET', '/ping')) == {'response': 'pong'}
+
+            # Simulate an idle keep-alive socket that was closed under us
+            conn = create_http_connection('localhost', http_port)
+            conn.sock.shutdown(socket.SHUT_RDWR)
+            assert json.loads(http_request(conn, 'GET', '/ping')) == {'response': 'pong'}
+            conn.close()
+
+    def test_http_request_retries_only_idempotent_after_send(self):
+        """Test a request dropped after sending is resent for GET, but not for POST"""
+        import http.client
+        import socket
+        import threading
+
+        listener = socket.socket()
+        listener.bind(('localhost', 0))
+        listener.listen()
+        received = []
+
+        def drop_after_reading():
+            # Read each request fully, then hang up without a response
+            while True:
+                try:
+                    client, _ = listener.accept()
+                except OSError:
+                    return
+                with client:
+                    data = b""
+                    while b"\r\n\r\n" not in data:
+                        data += client.recv(65536)
+                    received.append(data.split(b" ", 1)[0])
+
+        threading.Thread(target=drop_after_reading, daemon=True).start()
+        port = listener.getsockname()[1]
+        try:
+            conn = create_http_connection('localhost', port)
+            with pytest.raises(http.client.RemoteDisconnected):
+                http_request(conn, 'POST', '/upload-file', b"payload")
+            assert received == [b"POST"]
+
+            del received[:]
+            with pytest.raises(http.client.RemoteDisconnected):
+                http_request(conn, 'GET', '/ping')
+            assert received == [b"GET", b"GET"]
+            conn.close()
+        finally:
+            listener.close()
+
+    def test_async_request_retries_only_idempotent_after_send(self):
+        """Test the async client resends a dropped GET, but not a POST it already wrote"""
+        import asyncio
+
+        received = []
+
+        async def drop_after_reading(reader, writer):
+            # Read the request head, then hang up without a response
+            received.append((await reader.readuntil(b"\r\n\r\n")).split(b" ", 1)[0])
+            writer.close()
+
+        async def main():
+            server = await asyncio.start_server(drop_after_reading, 'localhost', 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                conn = await open_async_http_connection('localhost', port)
+                with pytest.raises(ConnectionResetError):
+                    await conn.request('POST', '/upload-file', b"payload")
+                assert received == [b"POST"]
+
+                del received[:]
+                with pytest.raises(ConnectionResetError):
+                    await conn.request('GET', '/ping')
+                assert received == [b"GET", b"GET"]
+                conn.close()
+
+        asyncio.run(main())
+
+    def test_async_request_timeout_discards_late_reply(self):
+        """Test a timed-out request's late reply is not read as the next response"""
+        import asyncio
+
+        requests_seen = []
+
+        async def reply(reader, writer):
+            # The first request is answered late; every later one at once
+            try:
+                while True:
+                    await reader.readuntil(b"\r\n\r\n")
+                    requests_seen.append(None)
+                    if len(requests_seen) == 1:
+                        await asyncio.sleep(0.3)
+                        body = b"stale"
+                    else:
+                        body = b"fresh"
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body))
+                    await writer.drain()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                writer.close()
+
+        async def main():
+            server = await asyncio.start_server(reply, 'localhost', 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                conn = await open_async_http_connection('localhost', port, timeout=0.1)
+                with pytest.raises(asyncio.TimeoutError):
+                    await conn.request('GET', '/slow')
+                conn.timeout = 1
+                assert await conn.request('GET', '/ping') == b"fresh"
+                conn.close()
+
+        asyncio.run(main())
+
+    def test_http_upload_sent_in_one_syscall(self, http_port):
+        """Test a bytes upload goes out with its headers in a single sendmsg()"""
+        import json
+
+        class RecordingSocket:
+            def __init__(self, sock):
+                self.sock = sock
+                self.calls = []
+
+            def sendmsg(self, buffers):
+                self.calls.append([bytes(b) for b in buffers])
+                return self.sock.sendmsg(buffers)
+
+            def __getattr__(self, name):
+                return getattr(self.sock, name)
+
+        with HTTPBenchmarkServer(host='localhost', port=http_port):
+            conn = create_http_connection('localhost', http_port)
+            conn.sock = recorder = RecordingSocket(conn.sock)
+            assert json.loads(http_request(conn, 'POST', '/upload', b"x" * 1024)) == {'size': 1024}
+
+            assert len(recorder.calls) == 1
+            header, body = recorder.calls[0]
+            assert header.startswith(b"POST /upload HTTP/1.1\r\n")
+            assert b"Content-Length: 1024\r\n" in header
+            assert body == b"x" * 1024
+            conn.close()
+
+    def test_vectored_connection_matches_http_client(self, monkeypatch, capsys):
+        """Test the single-write override sends, audits and traces exactly what http.client does"""
+        import http.client
+        import sys
+        from rpycbench.servers.http_servers import _VectoredHTTPConnection
+
+        class CapturingSocket:
+            def __init__(self):
+                self.sent = b""
+                self.calls = 0
+
+            def sendall(self, data):
+                self.sent += bytes(data)
+                self.calls += 1
+
+            def sendmsg(self, buffers):
+                data = b"".join(bytes(b) for b in buffers)
+                self.sent += data
+                self.calls += 1
+                return len(data)
+
+        def capture(connection_class, body):
+            events = []
+            monkeypatch.setattr(sys, "audit", lambda event, *args: events.append((event, args[1])))
+            conn = connection_class('localhost', 1)
+            conn.set_debuglevel(1)
+            conn.sock = sock = CapturingSocket()
+            conn.request('POST', '/upload', body=body)
+            monkeypatch.undo()
+            return sock, [e for e in events if e[0] == "http.client.send"], capsys.readouterr().out
+
+        for body in (b"x" * 1024, bytearray(b"abc"), b""):
+            stdlib_sock, stdlib_events, stdlib_trace = capture(http.client.HTTPConnection, body)
+            vectored_sock, vectored_events, vectored_trace = capture(_VectoredHTTPConnection, body)
+
+            assert vectored_sock.sent == stdlib_sock.sent
+            assert vectored_events == stdlib_events
+            assert vectored_trace == stdlib_trace
+            assert vectored_sock.calls == 1
+
+    def test_send_buffers_resumes_partial_sends(self):
+        """Test send_buffers() continues from wherever a short sendmsg() stopped"""
+        class ShortSocket:
+            def __init__(self):
+                self.received = b""
+
+            def sendmsg(self, buffers):
+                sent = bytes(buffers[0])[:3]  # At most 3 bytes per call
+                self.received += sent
+                return len(sent)
+
+        sock = ShortSocket()
+        send_buffers(sock, (b"head", b"", b"payload"))
+        assert sock.received == b"headpayload"
+
+    def test_http_shared_pool_manager(self, http_port):
+        """Test one PoolManager serves requests from many threads"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        pm = create_http_pool_manager(maxsize=4)
+        url = f'http://localhost:{http_port}/ping'
+
+        def ping(_):
+            response = pm.request('GET', url, preload_content=False)
+            response.drain_conn()
+            response.release_conn()
+            return response.status
+
+        with HTTPBenchmarkServer(host='localhost', port=http_port):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                assert set(executor.map(ping, range(32))) == {200}
+
+        pool = pm.connection_from_url(url)
+        assert pool.num_requests == 32
+        pm.clear()
+
+    def test_http_session_pool_settings(self):
+        """Test session pool sizing and retries are configurable"""
+        session = create_http_session(pool_connections=1, pool_maxsize=2, max_retries=0)
+        adapter = session.get_adapter('http://localhost/')
+        assert adapter._pool_maxsize == 2
+        assert adapter.max_retries.total == 0
+        session.close()
+
+
+class TestConnectionPool:
+    """Test client connection reuse across benchmark runs"""
+
+    def test_pool_reuses_and_bounds_connections(self):
+        """Test idle connections are reused and the LRU one is evicted when full"""
+        class FakeConnection:
+            closed = False
+
+            def close(self):
+                self.closed = True
+
+        pool = ConnectionPool(FakeConnection, max_size=2)
+        first, second, third = pool.acquire(), pool.acquire(), pool.acquire()
+        assert pool.created == 3
+
+        pool.release(first)
+        pool.release(second)
+        pool.release(third)
+        assert len(pool) == 2
+        assert first.closed
+
+        assert pool.acquire() is third
+        assert pool.created == 3
+
+        pool.close_all()
+        assert len(pool) == 0
+        assert second.closed
+
+    def test_pool_burst_limit(self):
+        """Test burst connections beyond max_size are capped and closed on release"""
+        class FakeConnection:
+            closed = False
+
+            def close(self):
+                self.closed = True
+
+        pool = ConnectionPool(FakeConnection, max_size=1, burst_limit=2)
+        first = pool.acquire()
+        with pool.get_connection() as second:
+            assert pool.created == 2
+            with pytest.raises(TimeoutError):
+                pool.acquire(timeout=0.05)
+
+        # The burst connection was released; one more can be checked out
+        assert pool.acquire(timeout=0.05) is second
+        pool.release(second)
+        pool.release(first)
+        assert len(pool) == 1
+        assert second.closed
+        assert pool.created == 2
+
+        with pytest.raises(ValueError):
+            ConnectionPool(FakeConnection, max_size=4, burst_limit=2)
+
+    def test_concurrent_benchmark_with_pool(self, rpyc_port):
+        """Test repeated concurrent runs only open connections once"""
+        from rpycbench.core.benchmark import ConcurrentBenchmark
+
+        factory = lambda: create_rpyc_connection('localhost', rpyc_port)
+
+        with RPyCServer(host='localhost', port=rpyc_port, mode='threaded'):
+            with ConnectionPool(factory, max_size=4) as pool:
+                for _ in range(2):
+                    bench = ConcurrentBenchmark(
+                        name="Pooled",
+                        protocol="rpyc",
+                        server_mode="threaded",
+                        connection_factory=factory,
+                        request_func=lambda conn: conn.root.ping(),
+                        num_clients=4,
+                        requests_per_client=5,
+                        connection_pool=pool,
+                    )
+                    metrics = bench.execute()
+                    assert metrics.total_requests == 20
+                    assert metrics.failed_requests == 0
+
+                assert pool.created <= 4
@@ -1,7 +1,7 @@
 """Tests for telemetry and profiling"""
 
 import pytest
-import time
+import threading
 from rpycbench.utils.telemetry import RPyCTelemetry, get_telemetry, enable_telemetry
 from rpycbench.utils.profiler import (
     ProfiledConnection,
@@ -31,6 +31,10 @@ class TestTelemetry:
             for _ in range(10):
                 conn.root.ping()
 
+            assert conn._connection._config['allow_pickle'] is False
+            created = telemetry.total_netrefs_created
+            assert conn.root is conn.root
+            assert telemetry.total_netrefs_created == created
             conn.close()
 
             # Verify telemetry
@@ -174,6 +178,60 @@ class TestTelemetryStatistics:
             # Each ping() call involves 2 operations: getattr('ping') + __call__()
             assert stats['total_calls'] == 40
 
+    def test_counters_exact_under_threads(self):
+        """Test lock-free call counting loses no increments across threads"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        telemetry = RPyCTelemetry(enabled=True, track_stacks=False)
+
+        def calls(_):
+            for _ in range(500):
+                telemetry.end_call(telemetry.start_call('ping'))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(calls, range(8)))
+
+        stats = telemetry.get_statistics()
+        assert stats['total_calls'] == stats['total_network_roundtrips'] == 8 * 500
+        assert telemetry.total_network_roundtrips == 8 * 500
+        assert len({c.call_id for c in telemetry._call_history}) == 8 * 500
+
+    def test_counter_reads_exact_under_threads(self):
+        """Test concurrent reads of the call count never over- or under-count"""
+        import sys
+        from concurrent.futures import ThreadPoolExecutor
+
+        telemetry = RPyCTelemetry(enabled=True, track_stacks=False)
+        done = threading.Event()
+
+        def increment(_):
+            for _ in range(2000):
+                telemetry.start_call('ping')
+
+        def read(_):
+            # The count only grows, so one reader must never see it drop
+            seen = []
+            while not done.is_set():
+                seen.append(telemetry.total_calls)
+            seen.extend(telemetry.total_network_roundtrips for _ in range(500))
+            return seen
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                readers = [executor.submit(read, i) for i in range(4)]
+                list(executor.map(increment, range(4)))
+                done.set()
+                reads = [reader.result() for reader in readers]
+        finally:
+            sys.setswitchinterval(interval)
+
+        for seen in reads:
+            assert seen == sorted(seen)
+            assert seen[-500:] == [4 * 2000] * 500
+        assert telemetry.get_statistics()['total_calls'] == 4 * 2000
+
     def test_telemetry_reset(self, rpyc_port):
         """Test that telemetry can be reset"""
         telemetry = RPyCTelemetry(enabled=True)
@@ -199,3 +257,45 @@ class TestTelemetryStatistics:
         stats = telemetry.get_statistics()
         assert stats['total_calls'] == 0
         assert stats['total_network_roundtrips'] == 0
+
+    def test_slowest_calls_ranked_from_durations(self):
+        """Test slow calls are found and ranked from the recorded durations"""
+        telemetry = RPyCTelemetry(enabled=True, track_stacks=False, slow_call_threshold=0.5)
+
+        for name, duration in [('a', 0.1), ('b', 0.9), ('c', 0.5), ('d', 2.0), ('e', 0.7)]:
+            call_id = telemetry.start_call(name)
+            telemetry._calls[call_id].start_ns -= int(duration * 1e9)
+            telemetry.end_call(call_id)
+
+        assert [c.method_name for c in telemetry.slow_calls] == ['b', 'c', 'd', 'e']
+        assert [c.method_name for c in telemetry.get_slowest_calls(2)] == ['d', 'b']
+        assert [c.method_name for c in telemetry.get_slowest_calls(10)] == ['d', 'b', 'e', 'c']
+        assert telemetry.get_statistics()['num_slow_calls'] == 4
+
+        telemetry.reset()
+        assert telemetry.slow_calls == []
+        assert telemetry.get_statistics()['num_slow_calls'] == 0
+
+
+class TestVisualizerStreaming:
+    """Test report formatters writing to a stream"""
+
+    def test_reports_stream_to_out(self):
+        """Test out= writes the same lines the returned string would contain"""
+        import io
+        from rpycbench.utils.visualizer import (
+            format_call_tree,
+            format_timeline,
+            format_slow_calls_report,
+            format_full_report,
+        )
+
+        telemetry = RPyCTelemetry(enabled=True, track_stacks=False, slow_call_threshold=0)
+        for name in ('ping', 'echo', 'compute'):
+            telemetry.end_call(telemetry.start_call(name))
+
+        for formatter in (format_call_tree, format_timeline, format_slow_calls_report, format_full_report):
+            out = io.StringIO()
+            assert formatter(telemetry, out=out) is None
+            assert out.getvalue() == formatter(telemetry) + "\n"
+            assert 'compute' in out.getvalue()
@@ -26,9 +26,14 @@ class Marker:
     end_netrefs: int = 0
     start_stack_depth: int = 0
     parent_marker: Optional[str] = None
+    # perf_counter_ns() marks; duration uses these when set, not the wall clock
+    start_ns: Optional[int] = field(default=None, repr=False)
+    end_ns: Optional[int] = field(default=None, repr=False)
 
     @property
     def duration(self) -> Optional[float]:
+        if self.start_ns is not None and self.end_ns is not None:
+            return (self.end_ns - self.start_ns) * 1e-9
         if self.end_time:
             return self.end_time - self.start_time
         return None
@@ -76,6 +81,7 @@ class MarkerManager:
         marker = Marker(
             name=name,
             start_time=time.time(),
+            start_ns=time.perf_counter_ns(),
             start_round_trips=telemetry.total_network_roundtrips,
             start_netrefs=telemetry.total_netrefs_created,
             start_stack_depth=telemetry.get_current_stack_depth(),
@@ -94,6 +100,7 @@ class MarkerManager:
         marker = self._active_markers.pop()
         telemetry = get_telemetry()
 
+        marker.end_ns = time.perf_counter_ns()
         marker.end_time = time.time()
         marker.end_round_trips = telemetry.total_network_roundtrips
         marker.end_netrefs = telemetry.total_netrefs_created
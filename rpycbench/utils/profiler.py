@@ -10,7 +10,13 @@ from rpycbench.utils.telemetry import get_telemetry
 
 
 class ProfiledNetRef:
-    """Wrapper around RPyC netref that tracks accesses"""
+    """
+    Wrapper around RPyC netref that tracks accesses
+
+    __getattr__ only runs for names not found on the wrapper itself, so the
+    wrapper's own _netref_obj/_telemetry/_netref_id are read with plain
+    attribute access (a C-level instance dict hit) on every proxied call.
+    """
 
     def __init__(self, netref_obj: Any, telemetry_inst, netref_id: int):
         object.__setattr__(self, '_netref_obj', netref_obj)
@@ -21,9 +27,9 @@ class ProfiledNetRef:
         if name.startswith('_'):
             return object.__getattribute__(self, name)
 
-        telemetry = object.__getattribute__(self, '_telemetry')
-        netref_obj = object.__getattribute__(self, '_netref_obj')
-        netref_id = object.__getattribute__(self, '_netref_id')
+        telemetry = self._telemetry
+        netref_obj = self._netref_obj
+        netref_id = self._netref_id
 
         call_id = telemetry.start_call(
             method_name=f"getattr({name})",
@@ -54,9 +60,9 @@ class ProfiledNetRef:
             object.__setattr__(self, name, value)
             return
 
-        telemetry = object.__getattribute__(self, '_telemetry')
-        netref_obj = object.__getattribute__(self, '_netref_obj')
-        netref_id = object.__getattribute__(self, '_netref_id')
+        telemetry = self._telemetry
+        netref_obj = self._netref_obj
+        netref_id = self._netref_id
 
         call_id = telemetry.start_call(
             method_name=f"setattr({name})",
@@ -73,9 +79,9 @@ class ProfiledNetRef:
             raise
 
     def __call__(self, *args, **kwargs):
-        telemetry = object.__getattribute__(self, '_telemetry')
-        netref_obj = object.__getattribute__(self, '_netref_obj')
-        netref_id = object.__getattribute__(self, '_netref_id')
+        telemetry = self._telemetry
+        netref_obj = self._netref_obj
+        netref_id = self._netref_id
 
         call_id = telemetry.start_call(
             method_name="__call__",
@@ -102,8 +108,8 @@ class ProfiledNetRef:
             raise
 
     def __repr__(self):
-        netref_obj = object.__getattribute__(self, '_netref_obj')
-        netref_id = object.__getattribute__(self, '_netref_id')
+        netref_obj = self._netref_obj
+        netref_id = self._netref_id
         return f"<ProfiledNetRef #{netref_id} wrapping {repr(netref_obj)}>"
 
 
@@ -130,19 +136,17 @@ class ProfiledConnection:
         self._auto_print_on_slow = auto_print_on_slow
         self._auto_print_on_deep = auto_print_on_deep
         self._root_netref_id = None
+        self._root = None
 
     @property
     def root(self):
-        """Get profiled root object"""
-        if self._root_netref_id is None:
+        """Get profiled root object (wrapped once, like rpyc caches root)"""
+        root = self._root
+        if root is None:
             root_obj = self._connection.root
             self._root_netref_id = self._telemetry.register_netref(root_obj)
-
-        return ProfiledNetRef(
-            self._connection.root,
-            self._telemetry,
-            self._root_netref_id
-        )
+            root = self._root = ProfiledNetRef(root_obj, self._telemetry, self._root_netref_id)
+        return root
 
     def close(self):
         """Close connection and print telemetry summary"""
@@ -186,10 +190,14 @@ def create_profiled_connection(
 
     Returns:
         ProfiledConnection instance
+
+    Pickling is disabled by default: bytes, str, numbers and tuples already
+    travel by value through RPyC's own brine encoding, so payloads that
+    need pickle should be pickled by the caller (or pass allow_pickle=True).
     """
     config = {
         'allow_public_attrs': True,
-        'allow_pickle': True,
+        'allow_pickle': False,
         'sync_request_timeout': 30,
     }
     config.update(rpyc_config)
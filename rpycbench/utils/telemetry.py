@@ -1,17 +1,48 @@
 """RPyC telemetry and profiling utilities"""
 
+import itertools
 import time
 import threading
 from collections import defaultdict, deque
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Callable
+import numpy as np
 import rpyc
 from rpyc.core import netref
 import inspect
 import traceback as tb
 
 
+
+class _Counter:
+    """
+    Lock-free event counter.
+
+    next() on an itertools.count is a single C call, so concurrent
+    increments cannot interleave and need no lock (no futex wait when many
+    threads count at once). Reading advances a second counter in step, and
+    the difference between the two is the number of increments.
+
+    A read is two next() calls, so two overlapping reads can each see the
+    other's step and be off by one. Reads must be serialized by the caller;
+    RPyCTelemetry reads under its lock.
+    """
+
+    __slots__ = ('_increments', '_reads')
+
+    def __init__(self):
+        self._increments = itertools.count()
+        self._reads = itertools.count()
+
+    def increment(self):
+        next(self._increments)
+
+    @property
+    def value(self) -> int:
+        return next(self._increments) - next(self._reads)
+
+
 @dataclass
 class RPyCCallInfo:
     """Information about a single RPyC remote call"""
@@ -29,6 +60,7 @@ class RPyCCallInfo:
     exception: Optional[str] = None
     stack_depth: int = 0
     source_location: Optional[str] = None
+    start_ns: int = field(default=0, repr=False)  # perf_counter_ns() at start, for duration
 
     def __str__(self):
         if self.duration:
@@ -82,23 +114,24 @@ class RPyCTelemetry:
         self.deep_stack_threshold = deep_stack_threshold
 
         # Counters
-        self.total_calls = 0
-        self.total_network_roundtrips = 0
+        self._roundtrips = _Counter()
         self.total_netrefs_created = 0
         self.active_netrefs = 0
 
         # Call tracking
-        self._call_counter = 0
+        self._call_ids = itertools.count(1)
         self._call_stack = deque()  # Stack of active call IDs
         self._calls: Dict[int, RPyCCallInfo] = {}
         self._call_history: List[RPyCCallInfo] = []
+        # Duration of _call_history[i]. A plain list keeps end_call() to one
+        # cheap append; stats convert it to an array for vectorized scans
+        self._durations: List[float] = []
 
         # Netref tracking
         self._netrefs: Dict[int, NetRefInfo] = {}
         self._netref_counter = 0
 
         # Performance tracking
-        self.slow_calls: List[RPyCCallInfo] = []
         self.deep_stacks: List[tuple] = []  # (depth, call_stack)
 
         # Thread safety
@@ -115,32 +148,32 @@ class RPyCTelemetry:
         if not self.enabled:
             return -1
 
-        with self._lock:
-            self._call_counter += 1
-            call_id = self._call_counter
-            self.total_calls += 1
-            self.total_network_roundtrips += 1
+        # Id and counters need no lock; only the shared stack/dicts below do
+        call_id = next(self._call_ids)
+        self._roundtrips.increment()
+
+        source_location = None
+        if self.track_stacks:
+            frame = inspect.currentframe()
+            try:
+                caller_frame = frame.f_back.f_back.f_back
+                if caller_frame:
+                    filename = caller_frame.f_code.co_filename
+                    lineno = caller_frame.f_lineno
+                    func_name = caller_frame.f_code.co_name
+                    source_location = f"{filename}:{lineno} in {func_name}"
+            except:
+                pass
+            finally:
+                del frame
 
+        with self._lock:
             parent_id = self._call_stack[-1] if self._call_stack else None
 
-            source_location = None
-            if self.track_stacks:
-                frame = inspect.currentframe()
-                try:
-                    caller_frame = frame.f_back.f_back.f_back
-                    if caller_frame:
-                        filename = caller_frame.f_code.co_filename
-                        lineno = caller_frame.f_lineno
-                        func_name = caller_frame.f_code.co_name
-                        source_location = f"{filename}:{lineno} in {func_name}"
-                except:
-                    pass
-                finally:
-                    del frame
-
             call_info = RPyCCallInfo(
                 call_id=call_id,
                 timestamp=time.time(),
+                start_ns=time.perf_counter_ns(),
                 method_name=method_name,
                 call_type=call_type,
                 parent_call_id=parent_id,
@@ -182,17 +215,13 @@ class RPyCTelemetry:
                 return
 
             call_info = self._calls[call_id]
-            call_info.duration = time.time() - call_info.timestamp
+            call_info.duration = (time.perf_counter_ns() - call_info.start_ns) * 1e-9
             call_info.result_is_netref = result_is_netref
             call_info.result_netref_id = result_netref_id
 
             if exception:
                 call_info.exception = str(exception)
 
-            # Check for slow calls
-            if call_info.duration >= self.slow_call_threshold:
-                self.slow_calls.append(call_info)
-
             # Check for deep stacks
             if self.track_stacks and len(self._call_stack) >= self.deep_stack_threshold:
                 self.deep_stacks.append((len(self._call_stack), list(self._call_stack)))
@@ -203,8 +232,47 @@ class RPyCTelemetry:
 
             # Move to history
             self._call_history.append(call_info)
+            self._durations.append(call_info.duration)
             del self._calls[call_id]
 
+    @property
+    def total_calls(self) -> int:
+        """Number of remote calls started"""
+        with self._lock:
+            return self._roundtrips.value
+
+    @property
+    def total_network_roundtrips(self) -> int:
+        """Number of network round trips (one per remote call)"""
+        with self._lock:
+            return self._roundtrips.value
+
+    def _duration_array(self) -> np.ndarray:
+        """Durations of _call_history as a float64 array"""
+        return np.asarray(self._durations, dtype=np.float64)
+
+    def _slow_call_indices(self, durations: np.ndarray) -> np.ndarray:
+        """History indices of calls at or above slow_call_threshold"""
+        return np.flatnonzero(durations >= self.slow_call_threshold)
+
+    @property
+    def slow_calls(self) -> List[RPyCCallInfo]:
+        """Completed calls that took at least slow_call_threshold, oldest first"""
+        with self._lock:
+            return [self._call_history[i] for i in self._slow_call_indices(self._duration_array())]
+
+    def get_slowest_calls(self, top_n: int = 20) -> List[RPyCCallInfo]:
+        """The top_n slow calls, slowest first (one partial sort, not a full one)"""
+        if top_n <= 0:
+            return []
+        with self._lock:
+            durations = self._duration_array()
+            slow = self._slow_call_indices(durations)
+            if len(slow) > top_n:
+                slow = slow[np.argpartition(-durations[slow], top_n - 1)[:top_n]]
+            slow = slow[np.argsort(-durations[slow], kind='stable')]
+            return [self._call_history[i] for i in slow]
+
     def register_netref(
         self,
         netref_obj: Any,
@@ -291,7 +359,7 @@ class RPyCTelemetry:
             if call.is_netref:
                 netref_str = f" [NetRef #{call.netref_id}]"
 
-            elapsed = time.time() - call.timestamp
+            elapsed = (time.perf_counter_ns() - call.start_ns) * 1e-9
             print(f"{indent}{arrow}{call.method_name} ({call.call_type}){netref_str} [{elapsed*1000:.2f}ms]")
 
         print(f"{'='*80}\n")
@@ -300,19 +368,20 @@ class RPyCTelemetry:
         """Get telemetry statistics"""
         with self._lock:
             avg_call_duration = 0
-            if self._call_history:
-                durations = [c.duration for c in self._call_history if c.duration]
-                if durations:
-                    avg_call_duration = sum(durations) / len(durations)
+            all_durations = self._duration_array()
+            durations = all_durations[all_durations > 0]
+            if len(durations):
+                avg_call_duration = float(durations.mean())
 
+            roundtrips = self._roundtrips.value
             return {
-                'total_calls': self.total_calls,
-                'total_network_roundtrips': self.total_network_roundtrips,
+                'total_calls': roundtrips,
+                'total_network_roundtrips': roundtrips,
                 'total_netrefs_created': self.total_netrefs_created,
                 'active_netrefs': self.active_netrefs,
                 'current_stack_depth': len(self._call_stack),
                 'max_stack_depth': max([d for d, _ in self.deep_stacks], default=0),
-                'num_slow_calls': len(self.slow_calls),
+                'num_slow_calls': len(self._slow_call_indices(all_durations)),
                 'avg_call_duration': avg_call_duration,
                 'call_history_size': len(self._call_history),
             }
@@ -334,12 +403,13 @@ class RPyCTelemetry:
         print(f"Avg Call Duration:        {stats['avg_call_duration']*1000:.2f}ms")
 
         # Show slow calls with call stacks
-        if self.slow_calls:
+        slow_calls = self.slow_calls
+        if slow_calls:
             print(f"\n{'-'*80}")
             print(f"SLOW CALLS (>{self.slow_call_threshold}s):")
             print(f"{'-'*80}")
 
-            for call in self.slow_calls[-10:]:  # Last 10
+            for call in slow_calls[-10:]:  # Last 10
                 print(f"\n  {call.method_name} ({call.call_type})")
                 print(f"    Duration:    {call.duration*1000:8.2f}ms")
                 print(f"    Stack Depth: {call.stack_depth}")
@@ -393,17 +463,16 @@ class RPyCTelemetry:
     def reset(self):
         """Reset all telemetry data"""
         with self._lock:
-            self.total_calls = 0
-            self.total_network_roundtrips = 0
+            self._roundtrips = _Counter()
             self.total_netrefs_created = 0
             self.active_netrefs = 0
-            self._call_counter = 0
+            self._call_ids = itertools.count(1)
             self._call_stack.clear()
             self._calls.clear()
             self._call_history.clear()
+            self._durations.clear()
             self._netrefs.clear()
             self._netref_counter = 0
-            self.slow_calls.clear()
             self.deep_stacks.clear()
 
 
@@ -1,6 +1,6 @@
 """Visualization utilities for RPyC telemetry"""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, TextIO
 from rpycbench.utils.telemetry import RPyCCallInfo, RPyCTelemetry
 import time
 
@@ -15,12 +15,26 @@ def format_duration(seconds: float) -> str:
         return f"{seconds:.2f}s"
 
 
+def _emit(lines: Iterable[str], out: Optional[TextIO]) -> Optional[str]:
+    """
+    Join report lines into one string, or stream them to out if given.
+
+    Streaming writes each line as it is produced, so a large report is
+    never held in memory as a whole; nothing is returned in that case.
+    """
+    if out is None:
+        return "\n".join(lines)
+    out.writelines(line + "\n" for line in lines)
+    return None
+
+
 def format_call_tree(
     telemetry: RPyCTelemetry,
     max_depth: Optional[int] = None,
     min_duration: float = 0.0,
     show_netrefs: bool = True,
-) -> str:
+    out: Optional[TextIO] = None,
+) -> Optional[str]:
     """
     Format call history as a tree
 
@@ -29,11 +43,20 @@ def format_call_tree(
         max_depth: Maximum depth to display
         min_duration: Minimum call duration to display
         show_netrefs: Whether to show netref information
+        out: Stream to write the report to instead of returning it
     """
-    lines = []
-    lines.append("=" * 80)
-    lines.append("RPYC CALL TREE")
-    lines.append("=" * 80)
+    return _emit(_call_tree_lines(telemetry, max_depth, min_duration, show_netrefs), out)
+
+
+def _call_tree_lines(
+    telemetry: RPyCTelemetry,
+    max_depth: Optional[int],
+    min_duration: float,
+    show_netrefs: bool,
+) -> Iterator[str]:
+    yield "=" * 80
+    yield "RPYC CALL TREE"
+    yield "=" * 80
 
     # Build parent-child relationships
     children_map: Dict[Optional[int], List[RPyCCallInfo]] = {}
@@ -47,8 +70,8 @@ def format_call_tree(
             children_map[parent_id] = []
         children_map[parent_id].append(call)
 
-    def print_tree(parent_id: Optional[int], depth: int, prefix: str = ""):
-        """Recursively print tree"""
+    def tree_lines(parent_id: Optional[int], depth: int, prefix: str = ""):
+        """Recursively yield tree lines"""
         if max_depth and depth >= max_depth:
             return
 
@@ -76,24 +99,23 @@ def format_call_tree(
             if call.exception:
                 exception_str = f" ⚠ {call.exception[:30]}"
 
-            line = f"{prefix}{connector}{call.method_name} ({call_type_str}){netref_str} [{duration_str}]{exception_str}"
-            lines.append(line)
+            yield f"{prefix}{connector}{call.method_name} ({call_type_str}){netref_str} [{duration_str}]{exception_str}"
 
             # Recurse for children
-            print_tree(call.call_id, depth + 1, prefix + extension)
+            yield from tree_lines(call.call_id, depth + 1, prefix + extension)
 
     # Start from root calls (no parent)
-    print_tree(None, 0)
+    yield from tree_lines(None, 0)
 
-    lines.append("=" * 80)
-    return "\n".join(lines)
+    yield "=" * 80
 
 
 def format_timeline(
     telemetry: RPyCTelemetry,
     width: int = 80,
     min_duration: float = 0.0,
-) -> str:
+    out: Optional[TextIO] = None,
+) -> Optional[str]:
     """
     Format call history as a timeline
 
@@ -101,18 +123,22 @@ def format_timeline(
         telemetry: Telemetry instance
         width: Width of timeline in characters
         min_duration: Minimum call duration to display
+        out: Stream to write the report to instead of returning it
     """
-    lines = []
-    lines.append("=" * 80)
-    lines.append("RPYC CALL TIMELINE")
-    lines.append("=" * 80)
+    return _emit(_timeline_lines(telemetry, width, min_duration), out)
+
+
+def _timeline_lines(telemetry: RPyCTelemetry, width: int, min_duration: float) -> Iterator[str]:
+    yield "=" * 80
+    yield "RPYC CALL TIMELINE"
+    yield "=" * 80
 
     history = [c for c in telemetry._call_history if c.duration and c.duration >= min_duration]
 
     if not history:
-        lines.append("(no calls recorded)")
-        lines.append("=" * 80)
-        return "\n".join(lines)
+        yield "(no calls recorded)"
+        yield "=" * 80
+        return
 
     # Find time range
     start_time = min(c.timestamp for c in history)
@@ -131,37 +157,37 @@ def format_timeline(
         bar_width = max(1, int(((call.duration or 0) / total_time) * width))
 
         # Build timeline bar
-        timeline = [' '] * width
-        for i in range(rel_pos, min(rel_pos + bar_width, width)):
-            timeline[i] = '█'
-
-        timeline_str = ''.join(timeline)
+        bar_end = min(rel_pos + bar_width, width)
+        timeline_str = (' ' * rel_pos + '█' * max(bar_end - rel_pos, 0)).ljust(width)[:width]
 
         # Format call info
         duration_str = format_duration(call.duration)
         depth_str = f"{'  ' * call.stack_depth}"
 
-        line = f"{timeline_str} {depth_str}{call.method_name} ({duration_str})"
-        lines.append(line)
+        yield f"{timeline_str} {depth_str}{call.method_name} ({duration_str})"
+
+    yield "=" * 80
+    yield f"Total time: {format_duration(total_time)}"
+    yield "=" * 80
 
-    lines.append("=" * 80)
-    lines.append(f"Total time: {format_duration(total_time)}")
-    lines.append("=" * 80)
 
-    return "\n".join(lines)
+def format_netref_report(
+    telemetry: RPyCTelemetry,
+    out: Optional[TextIO] = None,
+) -> Optional[str]:
+    """Format netref usage report (written to out instead of returned, if given)"""
+    return _emit(_netref_report_lines(telemetry), out)
 
 
-def format_netref_report(telemetry: RPyCTelemetry) -> str:
-    """Format netref usage report"""
-    lines = []
-    lines.append("=" * 80)
-    lines.append("NETREF REPORT")
-    lines.append("=" * 80)
+def _netref_report_lines(telemetry: RPyCTelemetry) -> Iterator[str]:
+    yield "=" * 80
+    yield "NETREF REPORT"
+    yield "=" * 80
 
     if not telemetry._netrefs:
-        lines.append("(no active netrefs)")
-        lines.append("=" * 80)
-        return "\n".join(lines)
+        yield "(no active netrefs)"
+        yield "=" * 80
+        return
 
     # Sort by activity
     sorted_netrefs = sorted(
@@ -170,14 +196,15 @@ def format_netref_report(telemetry: RPyCTelemetry) -> str:
         reverse=True
     )
 
-    lines.append(f"{'ID':<8} {'Class':<25} {'Age':<10} {'Calls':<8} {'Attrs':<8} {'Total':<8}")
-    lines.append("-" * 80)
+    yield f"{'ID':<8} {'Class':<25} {'Age':<10} {'Calls':<8} {'Attrs':<8} {'Total':<8}"
+    yield "-" * 80
 
+    now = time.time()
     for netref_id, netref_info in sorted_netrefs:
-        age = time.time() - netref_info.created_at
+        age = now - netref_info.created_at
         age_str = format_duration(age)
 
-        line = (
+        yield (
             f"{netref_id:<8} "
             f"{netref_info.class_name:<25} "
             f"{age_str:<10} "
@@ -185,56 +212,51 @@ def format_netref_report(telemetry: RPyCTelemetry) -> str:
             f"{netref_info.num_attr_accesses:<8} "
             f"{netref_info.num_accesses:<8}"
         )
-        lines.append(line)
-
-    lines.append("=" * 80)
-    lines.append(f"Total NetRefs: {len(telemetry._netrefs)}")
-    lines.append(f"Total Created: {telemetry.total_netrefs_created}")
-    lines.append("=" * 80)
 
-    return "\n".join(lines)
+    yield "=" * 80
+    yield f"Total NetRefs: {len(telemetry._netrefs)}"
+    yield f"Total Created: {telemetry.total_netrefs_created}"
+    yield "=" * 80
 
 
 def format_slow_calls_report(
     telemetry: RPyCTelemetry,
     top_n: int = 20,
-) -> str:
-    """Format slow calls report"""
-    lines = []
-    lines.append("=" * 80)
-    lines.append(f"SLOW CALLS REPORT (threshold: {format_duration(telemetry.slow_call_threshold)})")
-    lines.append("=" * 80)
-
-    if not telemetry.slow_calls:
-        lines.append("(no slow calls detected)")
-        lines.append("=" * 80)
-        return "\n".join(lines)
+    out: Optional[TextIO] = None,
+) -> Optional[str]:
+    """Format slow calls report (written to out instead of returned, if given)"""
+    return _emit(_slow_calls_report_lines(telemetry, top_n), out)
 
-    # Sort by duration
-    sorted_calls = sorted(
-        telemetry.slow_calls,
-        key=lambda c: c.duration or 0,
-        reverse=True
-    )[:top_n]
 
-    lines.append(f"{'Method':<40} {'Duration':<12} {'Type':<10} {'Depth':<8}")
-    lines.append("-" * 80)
+def _slow_calls_report_lines(telemetry: RPyCTelemetry, top_n: int) -> Iterator[str]:
+    yield "=" * 80
+    yield f"SLOW CALLS REPORT (threshold: {format_duration(telemetry.slow_call_threshold)})"
+    yield "=" * 80
+
+    num_slow_calls = telemetry.get_statistics()['num_slow_calls']
+    if not num_slow_calls:
+        yield "(no slow calls detected)"
+        yield "=" * 80
+        return
+
+    # Slowest first
+    sorted_calls = telemetry.get_slowest_calls(top_n)
+
+    yield f"{'Method':<40} {'Duration':<12} {'Type':<10} {'Depth':<8}"
+    yield "-" * 80
 
     for call in sorted_calls:
         duration_str = format_duration(call.duration) if call.duration else "N/A"
-        line = (
+        yield (
             f"{call.method_name[:40]:<40} "
             f"{duration_str:<12} "
             f"{call.call_type:<10} "
             f"{call.stack_depth:<8}"
         )
-        lines.append(line)
 
-    lines.append("=" * 80)
-    lines.append(f"Total Slow Calls: {len(telemetry.slow_calls)} (showing top {len(sorted_calls)})")
-    lines.append("=" * 80)
-
-    return "\n".join(lines)
+    yield "=" * 80
+    yield f"Total Slow Calls: {num_slow_calls} (showing top {len(sorted_calls)})"
+    yield "=" * 80
 
 
 def format_full_report(
@@ -243,49 +265,57 @@ def format_full_report(
     include_timeline: bool = False,
     include_netrefs: bool = True,
     include_slow_calls: bool = True,
-) -> str:
-    """Generate a full telemetry report"""
-    sections = []
+    out: Optional[TextIO] = None,
+) -> Optional[str]:
+    """Generate a full telemetry report (written to out instead of returned, if given)"""
+    return _emit(
+        _full_report_lines(telemetry, include_tree, include_timeline, include_netrefs, include_slow_calls),
+        out,
+    )
 
+
+def _full_report_lines(
+    telemetry: RPyCTelemetry,
+    include_tree: bool,
+    include_timeline: bool,
+    include_netrefs: bool,
+    include_slow_calls: bool,
+) -> Iterator[str]:
     # Statistics
     stats = telemetry.get_statistics()
-    lines = []
-    lines.append("=" * 80)
-    lines.append("RPYC TELEMETRY REPORT")
-    lines.append("=" * 80)
-    lines.append("")
-    lines.append("SUMMARY:")
-    lines.append(f"  Total Calls:              {stats['total_calls']}")
-    lines.append(f"  Network Round Trips:      {stats['total_network_roundtrips']}")
-    lines.append(f"  NetRefs Created:          {stats['total_netrefs_created']}")
-    lines.append(f"  Active NetRefs:           {stats['active_netrefs']}")
-    lines.append(f"  Max Stack Depth:          {stats['max_stack_depth']}")
-    lines.append(f"  Avg Call Duration:        {format_duration(stats['avg_call_duration'])}")
-    lines.append(f"  Slow Calls:               {stats['num_slow_calls']}")
-    lines.append("")
-    sections.append("\n".join(lines))
+    yield "=" * 80
+    yield "RPYC TELEMETRY REPORT"
+    yield "=" * 80
+    yield ""
+    yield "SUMMARY:"
+    yield f"  Total Calls:              {stats['total_calls']}"
+    yield f"  Network Round Trips:      {stats['total_network_roundtrips']}"
+    yield f"  NetRefs Created:          {stats['total_netrefs_created']}"
+    yield f"  Active NetRefs:           {stats['active_netrefs']}"
+    yield f"  Max Stack Depth:          {stats['max_stack_depth']}"
+    yield f"  Avg Call Duration:        {format_duration(stats['avg_call_duration'])}"
+    yield f"  Slow Calls:               {stats['num_slow_calls']}"
+    yield ""
 
     # Call tree
     if include_tree and telemetry._call_history:
-        sections.append(format_call_tree(telemetry))
-        sections.append("")
+        yield from _call_tree_lines(telemetry, None, 0.0, True)
+        yield ""
 
     # Timeline
     if include_timeline and telemetry._call_history:
-        sections.append(format_timeline(telemetry))
-        sections.append("")
+        yield from _timeline_lines(telemetry, 80, 0.0)
+        yield ""
 
     # NetRefs
     if include_netrefs and telemetry._netrefs:
-        sections.append(format_netref_report(telemetry))
-        sections.append("")
+        yield from _netref_report_lines(telemetry)
+        yield ""
 
     # Slow calls
-    if include_slow_calls and telemetry.slow_calls:
-        sections.append(format_slow_calls_report(telemetry))
-        sections.append("")
-
-    return "\n".join(sections)
+    if include_slow_calls and stats['num_slow_calls']:
+        yield from _slow_calls_report_lines(telemetry, 20)
+        yield ""
 
 
 def print_live_stack(telemetry: RPyCTelemetry, threshold_ms: float = 100):
@@ -297,7 +327,7 @@ def print_live_stack(telemetry: RPyCTelemetry, threshold_ms: float = 100):
 
     # Check if we should print
     oldest_call = stack[0]
-    elapsed = time.time() - oldest_call.timestamp
+    elapsed = (time.perf_counter_ns() - oldest_call.start_ns) * 1e-9
 
     if elapsed * 1000 >= threshold_ms:
         telemetry.print_call_stack(